@@ -0,0 +1,54 @@
+"""
+Compares building a devices table row by row from Device objects against
+extracting columns straight from the /devices/list JSON.
+
+    python -m benchmarks.columnar_export [--devices 10000] [--repeat 5]
+"""
+import argparse
+import timeit
+
+from benchmarks.fixtures import devices_response
+from seamapi.types import Device
+from seamapi.utils.columns import DEVICE_COLUMNS, to_columns
+
+
+def rows_from_models(devices):
+    rows = []
+    for device in (Device.from_dict(d) for d in devices):
+        rows.append(
+            {
+                "device_id": device.device_id,
+                "device_type": device.device_type,
+                "connected_account_id": device.connected_account_id,
+                "workspace_id": device.workspace_id,
+                "created_at": device.created_at,
+                "is_managed": device.is_managed,
+                "properties.name": device.properties.get("name"),
+                "properties.manufacturer": device.properties.get("manufacturer"),
+                "properties.online": device.properties.get("online"),
+                "properties.locked": device.properties.get("locked"),
+                "properties.battery_level": device.properties.get("battery_level"),
+            }
+        )
+    return {column: [row[column] for row in rows] for column in DEVICE_COLUMNS}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--devices", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    devices = devices_response(args.devices)["devices"]
+    assert rows_from_models(devices) == to_columns(devices, DEVICE_COLUMNS)
+
+    for label, fn in (
+        ("rows from Device objects", lambda: rows_from_models(devices)),
+        ("to_columns", lambda: to_columns(devices, DEVICE_COLUMNS)),
+    ):
+        best = min(timeit.repeat(fn, number=1, repeat=args.repeat))
+        print(f"{label:<26} {best * 1000:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Measures devices.list parse time and RSS growth for large payloads, comparing
+the previous eager DeepAttrDict copy against the current one, which only
+copies the top level and wraps nested dicts on access.
+
+Each variant runs in a fresh interpreter so peak RSS is not shared.
+
+    python -m benchmarks.device_parsing [--devices 10000] [--repeat 5]
+"""
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+
+import seamapi.types
+from benchmarks.fixtures import devices_response
+from seamapi.types import Device
+
+
+class EagerDeepAttrDict(dict):
+    """DeepAttrDict before nested dicts were wrapped lazily, kept for comparison"""
+
+    MARKER = object()
+
+    def __init__(self, value=None):
+        if value is None:
+            pass
+        elif isinstance(value, dict):
+            for key in value:
+                self.__setitem__(key, value[key])
+        else:
+            raise TypeError("expected dict")
+
+    def __setitem__(self, key, value):
+        if isinstance(value, dict) and not isinstance(value, EagerDeepAttrDict):
+            value = EagerDeepAttrDict(value)
+        super(EagerDeepAttrDict, self).__setitem__(key, value)
+
+    def __getitem__(self, key):
+        found = self.get(key, EagerDeepAttrDict.MARKER)
+        if found is EagerDeepAttrDict.MARKER:
+            found = EagerDeepAttrDict()
+            super(EagerDeepAttrDict, self).__setitem__(key, found)
+        return found
+
+    __setattr__, __getattr__ = __setitem__, __getitem__
+
+
+def max_rss_mb() -> float:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def worker(variant: str, count: int, repeat: int):
+    if variant == "eager":
+        seamapi.types.DeepAttrDict = EagerDeepAttrDict
+
+    body = json.dumps(devices_response(count))
+
+    # Measure what one parsed result retains before timing runs raise the peak
+    res = json.loads(body)
+    baseline = max_rss_mb()
+    devices = [Device.from_dict(d) for d in res["devices"]]
+    growth = max_rss_mb() - baseline
+    assert devices[-1].properties.model.display_name
+    del devices, res
+
+    timings = []
+    for _ in range(repeat):
+        res = json.loads(body)
+        start = time.perf_counter()
+        devices = [Device.from_dict(d) for d in res["devices"]]
+        timings.append(time.perf_counter() - start)
+        del devices, res
+
+    print(json.dumps({"parse_ms": min(timings) * 1000, "rss_mb": growth}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--devices", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--worker", choices=["eager", "lazy"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        worker(args.worker, args.devices, args.repeat)
+        return
+
+    print(f"{'variant':<8} {'devices':>8} {'parse ms':>10} {'RSS growth MB':>14}")
+    for variant in ("eager", "lazy"):
+        proc = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "benchmarks.device_parsing",
+                "--worker",
+                variant,
+                "--devices",
+                str(args.devices),
+                "--repeat",
+                str(args.repeat),
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        result = json.loads(proc.stdout)
+        print(
+            f"{variant:<8} {args.devices:>8} {result['parse_ms']:>10.1f} "
+            f"{result['rss_mb']:>14.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
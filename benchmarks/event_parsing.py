@@ -0,0 +1,53 @@
+"""
+Measures the cost of turning /events/list bodies into Event models and the
+memory retained per event, with and without field projection.
+
+    python -m benchmarks.event_parsing [--events 50000] [--repeat 5]
+"""
+import argparse
+import gc
+import json
+import timeit
+import tracemalloc
+
+from benchmarks.fixtures import events_response
+from seamapi.types import Event
+
+VARIANTS = {
+    "raw dicts": lambda events: events,
+    "Event": lambda events: [Event.from_dict(e) for e in events],
+    "Event fields=[method]": lambda events: [
+        Event.from_dict(e, ["method"]) for e in events
+    ],
+}
+
+
+def retained_bytes(body: str, build) -> int:
+    gc.collect()
+    tracemalloc.start()
+    result = build(json.loads(body)["events"])
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--events", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    body = json.dumps(events_response(args.events))
+    events = json.loads(body)["events"]
+
+    print(f"{'variant':<24} {'build ms':>9} {'bytes/event':>12}")
+    for label, build in VARIANTS.items():
+        seconds = min(timeit.repeat(lambda: build(events), number=1, repeat=args.repeat))
+        per_event = retained_bytes(body, build) / args.events
+        print(f"{label:<24} {seconds * 1000:>9.1f} {per_event:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""
+Realistic API payloads for benchmarks, shaped like /devices/list,
+/events/list and /access_codes/list responses.
+"""
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+
+START = datetime(2023, 1, 1, tzinfo=timezone.utc)
+
+
+def timestamp(seconds: int) -> str:
+    value = START + timedelta(seconds=seconds)
+    return value.strftime("%Y-%m-%dT%H:%M:%S.") + f"{value.microsecond // 1000:03d}Z"
+
+
+def make_device(i: int) -> Dict[str, Any]:
+    return {
+        "device_id": f"00000000-0000-0000-0000-{i:012d}",
+        "device_type": random.choice(["august_lock", "schlage_lock", "ecobee_thermostat"]),
+        "location": {"location_name": f"Unit {i}", "timezone": "America/New_York"},
+        "properties": {
+            "name": f"Front Door {i}",
+            "online": True,
+            "locked": random.random() < 0.5,
+            "door_open": False,
+            "battery_level": round(random.random(), 2),
+            "battery": {"level": round(random.random(), 2), "status": "good"},
+            "manufacturer": "august",
+            "image_url": "https://connect.getseam.com/assets/images/devices/august_wifi-smart-lock-3rd-gen_silver_front.png",
+            "image_alt_text": "August Wifi Smart Lock 3rd Gen, Silver, Front",
+            "supported_code_lengths": [4, 5, 6, 7, 8],
+            "max_active_codes_supported": 250,
+            "has_native_entry_events": True,
+            "august_metadata": {
+                "lock_id": f"lock-{i}",
+                "lock_name": f"Front Door {i}",
+                "house_id": f"house-{i % 50}",
+                "house_name": f"Building {i % 50}",
+                "has_keypad": True,
+                "keypad_battery_level": "Good",
+                "model": "3rd Gen",
+            },
+            "model": {
+                "display_name": "Wi-Fi Smart Lock",
+                "manufacturer_display_name": "August",
+                "offline_access_codes_supported": False,
+                "online_access_codes_supported": True,
+            },
+        },
+        "capabilities_supported": ["access_code", "lock"],
+        "errors": [],
+        "warnings": [],
+        "connected_account_id": f"10000000-0000-0000-0000-{i % 20:012d}",
+        "workspace_id": "20000000-0000-0000-0000-000000000000",
+        "created_at": timestamp(i * 60),
+        "is_managed": True,
+    }
+
+
+def make_event(i: int) -> Dict[str, Any]:
+    return {
+        "event_id": f"30000000-0000-0000-0000-{i:012d}",
+        "event_type": random.choice(["lock.locked", "lock.unlocked", "device.connected"]),
+        "event_class": "lock",
+        "device_id": f"00000000-0000-0000-0000-{i % 1000:012d}",
+        "connected_account_id": f"10000000-0000-0000-0000-{i % 20:012d}",
+        "workspace_id": "20000000-0000-0000-0000-000000000000",
+        "created_at": timestamp(i),
+        "occurred_at": timestamp(i),
+        "method": "keycode",
+    }
+
+
+def make_access_code(i: int) -> Dict[str, Any]:
+    return {
+        "access_code_id": f"40000000-0000-0000-0000-{i:012d}",
+        "device_id": f"00000000-0000-0000-0000-{i % 1000:012d}",
+        "type": "time_bound",
+        "created_at": timestamp(i),
+        "errors": [],
+        "warnings": [],
+        "code": f"{i % 10000:04d}",
+        "starts_at": timestamp(i),
+        "ends_at": timestamp(i + 86400),
+        "name": f"Guest {i}",
+        "status": "set",
+        "common_code_key": None,
+        "is_managed": True,
+        "is_waiting_for_code_assignment": False,
+        "is_scheduled_on_device": True,
+        "pulled_backup_access_code_id": None,
+        "is_backup_access_code_available": False,
+        "is_backup": False,
+        "appearance": None,
+        "is_external_modification_allowed": False,
+        "is_offline_access_code": False,
+        "is_one_time_use": False,
+    }
+
+
+def make_action_attempt(i: int) -> Dict[str, Any]:
+    return {
+        "action_attempt_id": f"50000000-0000-0000-0000-{i:012d}",
+        "action_type": "LOCK_DOOR",
+        "status": "error" if i % 10 == 0 else "success",
+        "result": {} if i % 10 else None,
+        "error": {"type": "device_offline", "message": "Device is offline"}
+        if i % 10 == 0
+        else None,
+    }
+
+
+def make_workspace(i: int) -> Dict[str, Any]:
+    return {
+        "workspace_id": f"20000000-0000-0000-0000-{i:012d}",
+        "name": f"Workspace {i}",
+        "is_sandbox": i % 2 == 0,
+        "connect_partner_name": "Acme",
+    }
+
+
+def make_connect_webview(i: int) -> Dict[str, Any]:
+    return {
+        "workspace_id": "20000000-0000-0000-0000-000000000000",
+        "connect_webview_id": f"60000000-0000-0000-0000-{i:012d}",
+        "status": "authorized",
+        "url": f"https://connect.getseam.com/connect_webviews/view?connect_webview_id={i}",
+        "login_successful": True,
+        "device_selection_mode": "none",
+        "any_provider_allowed": False,
+        "any_device_allowed": True,
+        "created_at": timestamp(i),
+        "custom_metadata": {"unit": f"{i}"},
+        "connected_account_id": f"10000000-0000-0000-0000-{i % 20:012d}",
+        "authorized_at": timestamp(i + 60),
+        "accepted_providers": ["august", "schlage"],
+        "accepted_devices": [],
+        "selected_provider": "august",
+        "wait_for_device_creation": False,
+        "automatically_manage_new_devices": True,
+    }
+
+
+def make_connected_account(i: int) -> Dict[str, Any]:
+    return {
+        "connected_account_id": f"10000000-0000-0000-0000-{i:012d}",
+        "created_at": timestamp(i),
+        "user_identifier": f"user{i}@example.com",
+        "account_type": "august",
+        "errors": [],
+        "custom_metadata": {},
+    }
+
+
+def make_climate_setting_schedule(i: int) -> Dict[str, Any]:
+    return {
+        "climate_setting_schedule_id": f"70000000-0000-0000-0000-{i:012d}",
+        "device_id": f"00000000-0000-0000-0000-{i % 1000:012d}",
+        "is_set_on_device": True,
+        "created_at": timestamp(i),
+        "schedule_type": "time_bound",
+        "name": f"Stay {i}",
+        "schedule_starts_at": timestamp(i),
+        "schedule_ends_at": timestamp(i + 86400),
+        "automatic_heating_enabled": True,
+        "automatic_cooling_enabled": True,
+        "hvac_mode_setting": "heatcool",
+        "cooling_set_point_celsius": 25.0,
+        "heating_set_point_celsius": 20.0,
+        "cooling_set_point_fahrenheit": 77.0,
+        "heating_set_point_fahrenheit": 68.0,
+        "manual_override_allowed": True,
+    }
+
+
+def devices_response(count: int) -> Dict[str, List[Dict[str, Any]]]:
+    return {"devices": [make_device(i) for i in range(count)], "ok": True}
+
+
+def events_response(count: int) -> Dict[str, List[Dict[str, Any]]]:
+    return {"events": [make_event(i) for i in range(count)], "ok": True}
+
+
+def access_codes_response(count: int) -> Dict[str, List[Dict[str, Any]]]:
+    return {"access_codes": [make_access_code(i) for i in range(count)], "ok": True}
@@ -0,0 +1,77 @@
+"""
+Tracks the cold import cost of the SDK.
+
+Runs `python -X importtime -c "import seamapi.seam"` in fresh interpreters
+and reports the median total plus the slowest modules from the last run.
+seamapi/__init__.py raises on import, so the package is registered without
+running it and only the client modules are timed.
+
+    python benchmarks/import_time.py [--runs 5] [--top 15] [--module seamapi.seam]
+"""
+import argparse
+import importlib.util
+import statistics
+import subprocess
+import sys
+
+# Registers the seamapi package without executing its __init__
+IMPORT_SOURCE = """\
+import sys, types
+package = types.ModuleType("seamapi")
+package.__path__ = {path!r}
+sys.modules["seamapi"] = package
+import {module}
+"""
+
+
+def run_importtime(module: str):
+    path = list(importlib.util.find_spec("seamapi").submodule_search_locations)
+    source = IMPORT_SOURCE.format(path=path, module=module)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", source],
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        errors = [
+            line
+            for line in proc.stderr.splitlines()
+            if not line.startswith("import time:")
+        ]
+        raise SystemExit(f"import {module} failed:\n" + "\n".join(errors))
+
+    # Lines look like: "import time:   self [us] | cumulative | imported package"
+    timings = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, self_us, cumulative_us, name = (
+            part.strip() for part in line.replace("import time:", "|", 1).split("|")
+        )
+        timings.append((name.strip(), int(self_us), int(cumulative_us)))
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--module", default="seamapi.seam")
+    args = parser.parse_args()
+
+    totals = []
+    timings = []
+    for _ in range(args.runs):
+        timings = run_importtime(args.module)
+        total = next(c for name, _, c in reversed(timings) if name == args.module)
+        totals.append(total)
+
+    print(f"import {args.module}: median {statistics.median(totals) / 1000:.1f} ms over {args.runs} runs")
+    print()
+    print(f"{'cumulative ms':>14}  {'self ms':>8}  module")
+    for name, self_us, cumulative_us in sorted(timings, key=lambda t: -t[2])[: args.top]:
+        print(f"{cumulative_us / 1000:>14.1f}  {self_us / 1000:>8.1f}  {name}")
+
+
+if __name__ == "__main__":
+    main()
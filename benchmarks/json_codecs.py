@@ -0,0 +1,51 @@
+"""
+Compares JSON codecs on realistic /devices/list and /events/list bodies.
+
+    python -m benchmarks.json_codecs [--devices 5000] [--events 20000] [--repeat 5]
+"""
+import argparse
+import timeit
+
+from benchmarks.fixtures import devices_response, events_response
+from seamapi.utils.json_codec import STDLIB_JSON_CODEC, get_orjson_codec
+
+
+def available_codecs():
+    codecs = [STDLIB_JSON_CODEC]
+    try:
+        codecs.append(get_orjson_codec())
+    except ImportError:
+        print("orjson not installed, only benchmarking the standard library\n")
+    return codecs
+
+
+def best_of(repeat: int, fn) -> float:
+    return min(timeit.repeat(fn, number=1, repeat=repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--devices", type=int, default=5000)
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    payloads = {
+        f"/devices/list ({args.devices} devices)": devices_response(args.devices),
+        f"/events/list ({args.events} events)": events_response(args.events),
+    }
+
+    print(f"{'payload':<36} {'codec':<8} {'size MB':>8} {'decode ms':>10} {'encode ms':>10}")
+    for label, payload in payloads.items():
+        body = STDLIB_JSON_CODEC.dumps(payload)
+        for codec in available_codecs():
+            decode = best_of(args.repeat, lambda: codec.loads(body))
+            encode = best_of(args.repeat, lambda: codec.dumps(payload))
+            print(
+                f"{label:<36} {codec.name:<8} {len(body) / 1e6:>8.2f} "
+                f"{decode * 1000:>10.1f} {encode * 1000:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
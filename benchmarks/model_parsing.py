@@ -0,0 +1,99 @@
+"""
+Compares the slotted model from_dict/to_dict against dataclasses-json for
+each API model, reporting decode/encode time and retained memory per object.
+
+The dataclasses-json rows are skipped when it is not installed.
+
+    python -m benchmarks.model_parsing [--count 2000] [--repeat 5]
+"""
+import argparse
+import timeit
+import tracemalloc
+from dataclasses import MISSING, field, fields, make_dataclass
+
+from benchmarks import fixtures
+from seamapi.types import (
+    AccessCode,
+    ActionAttempt,
+    ClimateSettingSchedule,
+    ConnectedAccount,
+    ConnectWebview,
+    Workspace,
+)
+
+MODELS = [
+    (AccessCode, fixtures.make_access_code),
+    (ActionAttempt, fixtures.make_action_attempt),
+    (ClimateSettingSchedule, fixtures.make_climate_setting_schedule),
+    (ConnectedAccount, fixtures.make_connected_account),
+    (ConnectWebview, fixtures.make_connect_webview),
+    (Workspace, fixtures.make_workspace),
+]
+
+
+def dataclass_json_twin(model):
+    """Builds the same model the way it was declared before, with dataclasses-json"""
+    from dataclasses_json import dataclass_json
+
+    twin_fields = []
+    for f in fields(model):
+        if f.default is MISSING:
+            twin_fields.append((f.name, f.type))
+        else:
+            twin_fields.append((f.name, f.type, field(default=f.default)))
+    return dataclass_json(make_dataclass(model.__name__, twin_fields))
+
+
+def bytes_per_object(model, payloads):
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = [model.from_dict(p) for p in payloads]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    retained = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del objects
+    return retained / len(payloads)
+
+
+def best_of(repeat, fn):
+    return min(timeit.repeat(fn, number=1, repeat=repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    try:
+        import dataclasses_json  # noqa: F401
+
+        compare = True
+    except ImportError:
+        print("dataclasses-json not installed, only benchmarking slotted models\n")
+        compare = False
+
+    print(
+        f"{'model':<24} {'impl':<16} {'from_dict ms':>13} {'to_dict ms':>11} "
+        f"{'bytes/obj':>10}"
+    )
+    for model, make in MODELS:
+        payloads = [make(i) for i in range(args.count)]
+        impls = [("slotted", model)]
+        if compare:
+            impls.insert(0, ("dataclasses-json", dataclass_json_twin(model)))
+        for label, impl in impls:
+            objects = [impl.from_dict(p) for p in payloads]
+            decode = best_of(
+                args.repeat, lambda: [impl.from_dict(p) for p in payloads]
+            )
+            encode = best_of(args.repeat, lambda: [o.to_dict() for o in objects])
+            size = bytes_per_object(impl, payloads)
+            print(
+                f"{model.__name__:<24} {label:<16} {decode * 1000:>13.1f} "
+                f"{encode * 1000:>11.1f} {size:>10.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
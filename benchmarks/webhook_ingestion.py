@@ -0,0 +1,80 @@
+"""
+Measures webhook deliveries verified and parsed per second.
+
+    python -m benchmarks.webhook_ingestion [--deliveries 20000] [--repeat 5]
+
+"naive" is the usual hand-written verifier: a fresh HMAC per delivery on
+the concatenated payload, json.loads and a raw dict. "receiver" is
+WebhookReceiver.parse_many.
+"""
+import argparse
+import base64
+import hashlib
+import hmac
+import json
+import os
+import time
+import timeit
+
+from benchmarks.fixtures import make_event
+from seamapi.webhooks import WebhookReceiver
+
+SECRET = "whsec_" + base64.b64encode(os.urandom(24)).decode()
+
+
+def make_deliveries(count: int):
+    key = base64.b64decode(SECRET[len("whsec_") :])
+    now = str(int(time.time()))
+    deliveries = []
+    for i in range(count):
+        body = json.dumps(make_event(i)).encode()
+        message_id = f"msg_{i}"
+        signature = base64.b64encode(
+            hmac.new(
+                key, f"{message_id}.{now}.".encode() + body, hashlib.sha256
+            ).digest()
+        ).decode()
+        headers = {
+            "svix-id": message_id,
+            "svix-timestamp": now,
+            "svix-signature": "v1," + signature,
+        }
+        deliveries.append((headers, body))
+    return deliveries
+
+
+def naive(deliveries):
+    key = base64.b64decode(SECRET[len("whsec_") :])
+    events = []
+    for headers, body in deliveries:
+        signed = f"{headers['svix-id']}.{headers['svix-timestamp']}.{body.decode()}"
+        expected = base64.b64encode(
+            hmac.new(key, signed.encode(), hashlib.sha256).digest()
+        ).decode()
+        if not hmac.compare_digest(expected, headers["svix-signature"][3:]):
+            raise ValueError("invalid signature")
+        events.append(json.loads(body))
+    return events
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--deliveries", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    deliveries = make_deliveries(args.deliveries)
+    receiver = WebhookReceiver(SECRET)
+    assert len(naive(deliveries)) == len(receiver.parse_many(deliveries))
+
+    print(f"{'verifier':<10} {'codec':<8} {'deliveries/s':>14}")
+    for label, run, codec in [
+        ("naive", lambda: naive(deliveries), "json"),
+        ("receiver", lambda: receiver.parse_many(deliveries), receiver.json_codec.name),
+    ]:
+        seconds = min(timeit.repeat(run, number=1, repeat=args.repeat))
+        print(f"{label:<10} {codec:<8} {args.deliveries / seconds:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
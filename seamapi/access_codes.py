@@ -12,9 +12,11 @@ from seamapi.types import (
     DeviceId,
     AbstractSeam as Seam,
 )
-from typing import List, Optional, Union, Any
+from typing import Dict, Iterator, List, Optional, Sequence, Union, Any
 import requests
+from seamapi.utils.columns import ACCESS_CODE_COLUMNS, to_columns
 from seamapi.utils.convert_to_id import to_access_code_id, to_device_id
+from seamapi.utils.paginate import chunks
 from seamapi.utils.report_error import report_error
 
 
@@ -34,15 +36,19 @@ class AccessCodes(AbstractAccessCodes):
     -------
     list(device, access_codes=None)
         Gets a list of access codes for a device
+    iter_list(device=None, access_codes=None, page_size=100)
+        Iterates over access codes page by page
+    list_columns(device=None, access_codes=None, columns=ACCESS_CODE_COLUMNS)
+        Gets a list of access codes as columns
     get(access_code=None, device=None)
         Gets a certain access code of a device
     create(device, name=None, code=None, starts_at=None, ends_at=None, attempt_for_offline_device=None, wait_for_code=None, timeout=None, allow_external_modification=None, prefer_native_scheduling=None, use_backup_access_code_pool=None)
         Creates an access code on a device
     create_multiple(devices, name=None, code=None, starts_at=None, ends_at=None)
         Creates multiple access codes across devices
-    update(access_code, device=None, name=None, code=None, starts_at=None, ends_at=None, type=None, allow_external_modification=None)
+    update(access_code, device=None, name=None, code=None, starts_at=None, ends_at=None, type=None, allow_external_modification=None, wait_for_action_attempt=True)
         Updates an access code on a device
-    delete(access_code, device=None)
+    delete(access_code, device=None, wait_for_action_attempt=True)
         Deletes an access code on a device
     pull_backup_access_code(access_code)
         Pulls a backup access code.
@@ -101,6 +107,88 @@ class AccessCodes(AbstractAccessCodes):
 
         return [AccessCode.from_dict(ac) for ac in res_access_codes]
 
+    def iter_list(
+        self,
+        device: Optional[Union[DeviceId, Device]] = None,
+        access_codes: Optional[Union[List[AccessCode], List[AccessCodeId]]] = None,
+        page_size: int = 100,
+    ) -> Iterator[AccessCode]:
+        """Iterates over access codes, fetching one page at a time.
+
+        When `access_codes` is given, the ids are requested in chunks of
+        `page_size` so large id lists don't produce one huge response.
+        Otherwise /access_codes/list has no pagination and the device's
+        access codes come back in one response, so this is the same as
+        `list`.
+
+        Parameters
+        ----------
+        device : Union[DeviceId, Device], optional
+            Device id or Device to list access codes for
+        access_codes : Union[List[AccessCode], List[AccessCodeId]], optional
+            Access Code IDs or Access Codes to filter access_codes by
+        page_size : int, optional
+            Number of access code ids requested per page. Defaults to 100.
+
+        Raises
+        ------
+        Exception
+            If the API request wasn't successful.
+
+        Yields
+        ------
+            AccessCode
+        """
+
+        if not access_codes:
+            yield from self.list(device=device)
+            return
+
+        for page in chunks(list(access_codes), page_size):
+            yield from self.list(device=device, access_codes=page)
+
+    @report_error
+    def list_columns(
+        self,
+        device: Optional[Union[DeviceId, Device]] = None,
+        access_codes: Optional[Union[List[AccessCode], List[AccessCodeId]]] = None,
+        columns: Sequence[str] = ACCESS_CODE_COLUMNS,
+    ) -> Dict[str, List[Any]]:
+        """Gets a list of access codes as columns instead of AccessCode objects.
+
+        Parameters
+        ----------
+        device : Union[DeviceId, Device], optional
+            Device id or Device to list access codes for
+        access_codes : Union[List[AccessCode], List[AccessCodeId]], optional
+            Access Code IDs or Access Codes to filter access_codes by
+        columns : Sequence[str], optional
+            Dotted paths to extract. Defaults to ACCESS_CODE_COLUMNS.
+
+        Raises
+        ------
+        Exception
+            If the API request wasn't successful.
+
+        Returns
+        ------
+            A dict mapping each column to a list with one value per access code.
+        """
+
+        params = {}
+        if device:
+            params["device_id"] = to_device_id(device)
+        if access_codes:
+            params["access_code_ids"] = [to_access_code_id(ac) for ac in access_codes]
+
+        res = self.seam.make_request(
+            "GET",
+            "/access_codes/list",
+            params=params,
+        )
+
+        return to_columns(res["access_codes"], columns)
+
     @report_error
     def get(
         self,
@@ -364,7 +452,8 @@ class AccessCodes(AbstractAccessCodes):
         ends_at: Optional[str] = None,
         type: Optional[str] = None,
         allow_external_modification: Optional[bool] = None,
-    ) -> AccessCode:
+        wait_for_action_attempt: Optional[bool] = True,
+    ) -> Union[AccessCode, ActionAttempt]:
         """Updates an access code on a device.
 
         Parameters
@@ -385,6 +474,8 @@ class AccessCodes(AbstractAccessCodes):
             Access code type eg. ongoing or time_bound
         allow_external_modification : bool, optional:
             Allow external modifications of the access code e.g. through the lock provider's app. False by default.
+        wait_for_action_attempt: bool, optional
+            Should wait for action attempt to resolve
 
         Raises
         ------
@@ -393,7 +484,7 @@ class AccessCodes(AbstractAccessCodes):
 
         Returns
         ------
-            AccessCode
+            AccessCode, or the pending ActionAttempt if wait_for_action_attempt is False
         """
 
         access_code_id = to_access_code_id(access_code)
@@ -419,6 +510,9 @@ class AccessCodes(AbstractAccessCodes):
             json=update_payload,
         )
 
+        if not wait_for_action_attempt:
+            return ActionAttempt.from_dict(res["action_attempt"])
+
         action_attempt = self.seam.action_attempts.poll_until_ready(
             res["action_attempt"]["action_attempt_id"]
         )
@@ -431,6 +525,7 @@ class AccessCodes(AbstractAccessCodes):
         self,
         access_code: Union[AccessCodeId, AccessCode],
         device: Optional[Union[DeviceId, AccessCode]] = None,
+        wait_for_action_attempt: Optional[bool] = True,
     ) -> ActionAttempt:
         """Deletes an access code on a device.
 
@@ -440,6 +535,8 @@ class AccessCodes(AbstractAccessCodes):
             Access code id or AccessCode to delete it
         device : DeviceId or Device, optional
             Device id or Device to delete an access code on
+        wait_for_action_attempt: bool, optional
+            Should wait for action attempt to resolve
 
         Raises
         ------
@@ -464,6 +561,9 @@ class AccessCodes(AbstractAccessCodes):
             json=create_payload,
         )
 
+        if not wait_for_action_attempt:
+            return ActionAttempt.from_dict(res["action_attempt"])
+
         action_attempt = self.seam.action_attempts.poll_until_ready(
             res["action_attempt"]["action_attempt_id"]
         )
@@ -519,7 +619,7 @@ class UnmanagedAccessCodes(AbstractUnmanagedAccessCodes):
         Gets an unmanaged access code
     list(device)
         Gets a list of unmanaged access codes
-    convert_to_managed(access_code, allow_external_modification=None)
+    convert_to_managed(access_code, allow_external_modification=None, wait_for_action_attempt=True)
         Converts an unmanaged access code to a managed one
     """
 
@@ -617,6 +717,7 @@ class UnmanagedAccessCodes(AbstractUnmanagedAccessCodes):
         self,
         access_code: Union[AccessCodeId, UnmanagedAccessCode],
         allow_external_modification: Optional[bool] = None,
+        wait_for_action_attempt: Optional[bool] = True,
     ) -> ActionAttempt:
         """Converts an unmanaged access code to a managed one.
 
@@ -626,6 +727,8 @@ class UnmanagedAccessCodes(AbstractUnmanagedAccessCodes):
             Access Code ID or UnmanagedAccessCode
         allow_external_modification : bool
             Allow external modifications of the access code e.g. through the lock provider's app. False by default.
+        wait_for_action_attempt: bool, optional
+            Should wait for action attempt to resolve
 
         Raises
         ------
@@ -650,6 +753,9 @@ class UnmanagedAccessCodes(AbstractUnmanagedAccessCodes):
             json=payload,
         )
 
+        if not wait_for_action_attempt:
+            return ActionAttempt.from_dict(res["action_attempt"])
+
         action_attempt = self.seam.action_attempts.poll_until_ready(
             res["action_attempt"]["action_attempt_id"]
         )
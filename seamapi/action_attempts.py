@@ -4,11 +4,14 @@ from seamapi.types import (
     ActionAttempt,
     AbstractSeam as Seam,
     ActionAttemptFailedException,
+    ActionAttemptsNotFoundException,
+    ActionAttemptTimeoutException,
     ActionAttemptId,
 )
 import time
-import requests
-from typing import Union
+from concurrent import futures
+from typing import Iterator, List, Optional, Sequence, Union
+from seamapi.utils.backoff import apply_jitter, backoff_intervals
 from seamapi.utils.convert_to_id import to_action_attempt_id
 from seamapi.utils.report_error import report_error
 
@@ -29,8 +32,12 @@ class ActionAttempts(AbstractActionAttempts):
     -------
     get(action_attempt)
         Gets data about an action attempt
-    poll_until_ready(action_attempt)
+    list(action_attempts)
+        Gets data about many action attempts
+    poll_until_ready(action_attempt, should_raise=True, timeout=300)
         Polls an action attempt until its status is 'success' or 'error'
+    wait_for_many(action_attempts, timeout=300)
+        Yields action attempts as they finish, polling only pending ones
     """
 
     seam: Seam
@@ -89,34 +96,132 @@ class ActionAttempts(AbstractActionAttempts):
             error=error,
         )
 
+    @report_error
+    def list(
+        self,
+        action_attempts: Sequence[Union[ActionAttemptId, ActionAttempt]],
+    ) -> List[ActionAttempt]:
+        """Gets data about many action attempts in one request.
+
+        Parameters
+        ----------
+        action_attempts : list of ActionAttemptId or ActionAttempt
+            Action attempt ids or ActionAttempts to get latest state of
+
+        Raises
+        ------
+        Exception
+            If the API request wasn't successful.
+
+        Returns
+        ------
+            A list of action attempts.
+        """
+
+        res = self.seam.make_request(
+            "GET",
+            "/action_attempts/list",
+            params={
+                "action_attempt_ids": [
+                    to_action_attempt_id(aa) for aa in action_attempts
+                ]
+            },
+        )
+
+        return [ActionAttempt.from_dict(aa) for aa in res["action_attempts"]]
+
     @report_error
     def poll_until_ready(
         self,
         action_attempt: Union[ActionAttemptId, ActionAttempt],
         should_raise: bool = True,
+        timeout: Optional[float] = 300,
+        initial_delay: float = 0,
+        poll_interval: float = 0.25,
+        max_poll_interval: float = 5,
+        backoff_factor: float = 1.5,
+        jitter: float = 0.1,
     ) -> ActionAttempt:
         """
         Polls an action attempt until its status is 'success' or 'error'.
 
+        The delay between polls starts at `poll_interval` and grows by
+        `backoff_factor` up to `max_poll_interval`, with random jitter.
+        When the client has a completion broker, the attempt is fetched as
+        soon as a webhook event for it arrives and otherwise only every
+        `fallback_interval` seconds of the broker.
+
         Parameters
         ----------
         action_attempt: ActionAttemptId or ActionAttempt
             Action attempt id or ActionAttempt to be polled
         should_raise: bool
             Should raise an exception if action attempt status is 'error'
+        timeout: float, optional
+            Maximum polling time in seconds. None polls forever. Defaults to 300.
+        initial_delay: float
+            Seconds to wait before the first poll. Defaults to 0.
+        poll_interval: float
+            Seconds to wait between the first and second poll. Defaults to 0.25.
+        max_poll_interval: float
+            Upper bound for the delay between polls. Defaults to 5.
+        backoff_factor: float
+            Multiplier applied to the delay after each poll. Defaults to 1.5.
+        jitter: float
+            Random spread applied to each delay, as a fraction of it. Defaults to 0.1.
+
+        Raises
+        ------
+        ActionAttemptFailedException
+            If action attempt status is 'error' and should_raise is True.
+        ActionAttemptTimeoutException
+            If action attempt is still pending after timeout seconds.
 
         Returns
         ------
             ActionAttempt
         """
 
-        updated_action_attempt = None
-        while (
-            updated_action_attempt is None
-            or updated_action_attempt.status == "pending"
-        ):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        intervals = backoff_intervals(
+            poll_interval, max_poll_interval, backoff_factor, jitter
+        )
+
+        if initial_delay > 0:
+            time.sleep(initial_delay)
+
+        # With a completion broker, a webhook event wakes the waiter and
+        # polling backs off to the broker's safety-net interval
+        broker = self.seam.completion_broker
+        action_attempt_id = to_action_attempt_id(action_attempt)
+        waiter = (
+            broker.register(action_attempt_id) if broker is not None else None
+        )
+        try:
             updated_action_attempt = self.get(action_attempt)
-            time.sleep(0.25)
+            while updated_action_attempt.status == "pending":
+                waiting_for_event = waiter is not None and not waiter.done()
+                if waiting_for_event:
+                    delay = broker.fallback_interval
+                else:
+                    delay = next(intervals)
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise ActionAttemptTimeoutException(
+                            action_attempt_id=updated_action_attempt.action_attempt_id,
+                            action_type=updated_action_attempt.action_type,
+                            timeout=timeout,
+                        )
+                    delay = min(delay, remaining)
+                if waiting_for_event:
+                    futures.wait([waiter], timeout=delay)
+                else:
+                    time.sleep(delay)
+                updated_action_attempt = self.get(action_attempt)
+        finally:
+            if waiter is not None:
+                broker.discard(action_attempt_id, waiter)
 
         if updated_action_attempt.status == "error" and should_raise:
             error_type = None
@@ -132,3 +237,104 @@ class ActionAttempts(AbstractActionAttempts):
             )
 
         return updated_action_attempt
+
+    def wait_for_many(
+        self,
+        action_attempts: Sequence[Union[ActionAttemptId, ActionAttempt]],
+        timeout: Optional[float] = 300,
+        poll_interval: float = 0.25,
+        max_poll_interval: float = 5,
+        backoff_factor: float = 1.5,
+        jitter: float = 0.1,
+        batch_size: int = 100,
+    ) -> Iterator[ActionAttempt]:
+        """
+        Waits for many action attempts at once, yielding each one as soon as
+        its status is 'success' or 'error'.
+
+        Every poll fetches only the attempts that are still pending, through
+        /action_attempts/list in chunks of `batch_size`. The poll interval
+        resets to `poll_interval` whenever an attempt finishes and otherwise
+        backs off up to `max_poll_interval`. Failed attempts are yielded, not
+        raised; check their status. Pending ids that a poll doesn't return
+        raise ActionAttemptsNotFoundException instead of being waited on
+        until the deadline.
+
+        Parameters
+        ----------
+        action_attempts: list of ActionAttemptId or ActionAttempt
+            Action attempt ids or ActionAttempts to wait for
+        timeout: float, optional
+            Maximum waiting time in seconds. None waits forever. Defaults to 300.
+        poll_interval: float
+            Shortest delay between polls. Defaults to 0.25.
+        max_poll_interval: float
+            Upper bound for the delay between polls. Defaults to 5.
+        backoff_factor: float
+            Multiplier applied to the delay after a poll without progress. Defaults to 1.5.
+        jitter: float
+            Random spread applied to each delay, as a fraction of it. Defaults to 0.1.
+        batch_size: int
+            Maximum number of action attempt ids per request. Defaults to 100.
+
+        Raises
+        ------
+        ActionAttemptsNotFoundException
+            If some action attempts don't exist.
+        Exception
+            If the API request wasn't successful.
+
+        Yields
+        ------
+            ActionAttempt, in completion order. Attempts still pending at the
+            deadline are yielded last with status 'pending'.
+        """
+
+        latest = {}
+        for action_attempt in action_attempts:
+            if isinstance(action_attempt, ActionAttempt):
+                latest[action_attempt.action_attempt_id] = action_attempt
+        pending = list(
+            dict.fromkeys(to_action_attempt_id(aa) for aa in action_attempts)
+        )
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        interval = poll_interval
+        while True:
+            returned = set()
+            for i in range(0, len(pending), batch_size):
+                for action_attempt in self.list(pending[i : i + batch_size]):
+                    returned.add(action_attempt.action_attempt_id)
+                    latest[action_attempt.action_attempt_id] = action_attempt
+
+            missing = [i for i in pending if i not in returned]
+            if missing:
+                raise ActionAttemptsNotFoundException(missing)
+
+            still_pending = []
+            for action_attempt_id in pending:
+                action_attempt = latest.get(action_attempt_id)
+                if action_attempt is not None and action_attempt.status != "pending":
+                    yield action_attempt
+                else:
+                    still_pending.append(action_attempt_id)
+
+            if not still_pending:
+                return
+
+            if len(still_pending) < len(pending):
+                interval = poll_interval
+            else:
+                interval = min(interval * backoff_factor, max_poll_interval)
+            pending = still_pending
+
+            delay = apply_jitter(interval, jitter)
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    for action_attempt_id in pending:
+                        if action_attempt_id in latest:
+                            yield latest[action_attempt_id]
+                    return
+                delay = min(delay, remaining)
+            time.sleep(delay)
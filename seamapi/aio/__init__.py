@@ -0,0 +1 @@
+from seamapi.aio.seam import AsyncSeam
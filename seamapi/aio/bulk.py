@@ -0,0 +1,152 @@
+import asyncio
+import time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TYPE_CHECKING,
+)
+from seamapi.types import BulkResult
+
+if TYPE_CHECKING:
+    from seamapi.aio.seam import AsyncSeam as Seam
+
+
+class AsyncBulk:
+    """
+    A class used to run many coroutines concurrently with bounded
+    concurrency, e.g. unlocking a list of doors
+
+    Every operation goes through the client's connection pool, so rate
+    limits and retries still apply. A failing operation does not stop the
+    others; its exception is returned in its result.
+
+    ...
+
+    Attributes
+    ----------
+    seam : AsyncSeam
+        Initial seam class
+
+    Methods
+    -------
+    run(operations, max_workers=8, on_result=None)
+        Awaits zero-argument coroutine functions concurrently
+    map(fn, items, max_workers=8, on_result=None, **kwargs)
+        Awaits fn(item, **kwargs) for every item concurrently
+    """
+
+    seam: "Seam"
+
+    def __init__(self, seam: "Seam"):
+        """
+        Parameters
+        ----------
+        seam : AsyncSeam
+          Initial seam class
+        """
+
+        self.seam = seam
+
+    async def run(
+        self,
+        operations: Sequence[Callable[[], Awaitable[Any]]],
+        max_workers: int = 8,
+        on_result: Optional[Callable[[BulkResult], None]] = None,
+    ) -> List[BulkResult]:
+        """Awaits operations concurrently and collects every outcome.
+
+        Parameters
+        ----------
+        operations : Sequence[Callable[[], Awaitable[Any]]]
+            Zero-argument coroutine functions, e.g. lambda: seam.locks.unlock_door(device_id)
+        max_workers : int, optional
+            Maximum number of operations running at once. Defaults to 8.
+        on_result : Callable[[BulkResult], None], optional
+            Called as each operation finishes. An exception it raises is
+            stored in the result's `callback_error` and does not stop the run.
+
+        Returns
+        ------
+            A list of BulkResult in the order of `operations`, each with the
+            returned value or raised exception and the duration in seconds.
+        """
+
+        return await self._run(
+            [(operation, operation) for operation in operations],
+            max_workers,
+            on_result,
+        )
+
+    async def map(
+        self,
+        fn: Callable[..., Awaitable[Any]],
+        items: Sequence[Any],
+        max_workers: int = 8,
+        on_result: Optional[Callable[[BulkResult], None]] = None,
+        **kwargs: Any,
+    ) -> List[BulkResult]:
+        """Awaits fn(item, **kwargs) for every item concurrently.
+
+        Parameters
+        ----------
+        fn : Callable
+            Route method to call, e.g. seam.locks.unlock_door
+        items : Sequence[Any]
+            First argument of each call, e.g. device ids
+        max_workers : int, optional
+            Maximum number of calls running at once. Defaults to 8.
+        on_result : Callable[[BulkResult], None], optional
+            Called as each call finishes. Exceptions it raises are stored in
+            `callback_error`.
+        **kwargs
+            Keyword arguments passed to every call
+
+        Returns
+        ------
+            A list of BulkResult in the order of `items`, with `item` set to
+            the corresponding item.
+        """
+
+        return await self._run(
+            [(item, lambda item=item: fn(item, **kwargs)) for item in items],
+            max_workers,
+            on_result,
+        )
+
+    async def _run(
+        self,
+        calls: Sequence[Tuple[Any, Callable[[], Awaitable[Any]]]],
+        max_workers: int,
+        on_result: Optional[Callable[[BulkResult], None]],
+    ) -> List[BulkResult]:
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def call(index: int, item: Any, operation) -> BulkResult:
+            result = BulkResult(index=index, item=item)
+            async with semaphore:
+                start = time.perf_counter()
+                try:
+                    result.value = await operation()
+                except Exception as error:
+                    result.error = error
+                result.duration = time.perf_counter() - start
+            if on_result is not None:
+                try:
+                    on_result(result)
+                except Exception as error:
+                    result.callback_error = error
+            return result
+
+        return list(
+            await asyncio.gather(
+                *(
+                    call(index, item, operation)
+                    for index, (item, operation) in enumerate(calls)
+                )
+            )
+        )
@@ -0,0 +1,812 @@
+import asyncio
+import copy
+from seamapi.types import (
+    ConnectWebview,
+    ConnectWebviewId,
+    ConnectedAccount,
+    ConnectedAccountId,
+    Device,
+    DeviceId,
+    DevicesNotFoundException,
+    UnmanagedDevice,
+    DeviceType,
+)
+from typing import (
+    Any,
+    AsyncIterator,
+    List,
+    Sequence,
+    Union,
+    Optional,
+    Dict,
+    TYPE_CHECKING,
+)
+from seamapi.utils.batcher import AsyncBatcher
+from seamapi.utils.columns import DEVICE_COLUMNS, to_columns
+from seamapi.utils.paginate import CreatedBeforeCursor, chunks
+from seamapi.utils.parse_list_device_params import parse_list_device_params
+from seamapi.utils.convert_to_id import (
+    to_device_id,
+)
+from seamapi.utils.device_cache import (
+    cache_devices,
+    get_cached_device,
+    invalidate_device,
+)
+from seamapi.utils.report_error import report_error_async
+
+if TYPE_CHECKING:
+    from seamapi.aio.seam import AsyncSeam as Seam
+
+
+class AsyncDevices:
+    """
+    A class used to retrieve device data
+    through interaction with Seam API
+
+    ...
+
+    Attributes
+    ----------
+    seam : Seam
+        Initial seam class
+
+    Methods
+    -------
+    list(connected_account=None, connected_accounts=None, connect_webview=None, device_type=None, device_ids=None, manufacturer=None)
+        Gets a list of devices
+    iter_list(connected_account=None, connected_accounts=None, connect_webview=None, device_type=None, device_ids=None, manufacturer=None, created_before=None, page_size=100)
+        Iterates over devices page by page
+    list_columns(connected_account=None, connected_accounts=None, connect_webview=None, device_type=None, device_ids=None, manufacturer=None, columns=DEVICE_COLUMNS)
+        Gets a list of devices as columns
+    get(device=None, name=None)
+        Gets a device
+    get_many(devices, batch_size=100, raise_if_missing=True)
+        Gets several devices through batched list requests
+    update(device, name=None, properties=None, location=None)
+        Updates a device
+    list_device_providers(provider_category=None):
+        Gets a list of device providers
+    """
+
+    seam: "Seam"
+
+    def __init__(self, seam: "Seam"):
+        """
+        Parameters
+        ----------
+        seam : Seam
+          Initial seam class
+        """
+
+        self.seam = seam
+        self._batcher = (
+            AsyncBatcher(
+                self._get_by_ids,
+                window=seam.device_get_batch_window,
+                copy_value=copy.deepcopy,
+            )
+            if seam.device_get_batch_window is not None
+            else None
+        )
+        self.unmanaged = AsyncUnmanagedDevices(seam)
+
+    @report_error_async
+    async def list(
+        self,
+        connected_account: Union[ConnectedAccountId, ConnectedAccount] = None,
+        connected_accounts: List[
+            Union[ConnectedAccountId, ConnectedAccount]
+        ] = None,
+        connect_webview: Union[ConnectWebviewId, ConnectWebview] = None,
+        device_type: Optional[DeviceType] = None,
+        device_types: Optional[List[DeviceType]] = None,
+        device_ids: Optional[List[Union[DeviceId, Device]]] = None,
+        manufacturer: Optional[str] = None,
+        limit: Optional[float] = None,
+        created_before: Optional[str] = None,
+    ) -> List[Device]:
+        """Gets a list of devices.
+
+        Parameters
+        ----------
+        connected_account : ConnectedAccountId or ConnectedAccount, optional
+            Connected account id or ConnectedAccount to get devices associated with
+        connected_accounts : ConnectedAccountId(s) or ConnectedAccount(s), optional
+            Connected account ids or ConnectedAccount(s) to get devices associated with
+        connect_webview : ConnectWebviewId or ConnectWebview, optional
+            Connect webview id or ConnectWebview to get devices associated with
+        device_type : DeviceType, optional
+            Device type e.g. august_lock
+        device_types : List[DeviceType], optional
+            List of device types e.g. august_lock
+        device_ids : Optional[List[Union[DeviceId, Device]]]
+            Device IDs to filter devices by
+        manufacturer : Optional[str]
+            Manufacturer name to filter devices by e.g. august, schlage
+        limit : str, optional
+            Limit the number of devices returned
+        created_before : str, optional
+            If specified, only devices created before this date will be returned
+
+        Raises
+        ------
+        Exception
+            If the API request wasn't successful.
+
+        Returns
+        ------
+            A list of devices.
+        """
+
+        params = parse_list_device_params(
+            connected_account,
+            connected_accounts,
+            connect_webview,
+            device_type,
+            device_types,
+            device_ids,
+            manufacturer,
+            limit,
+            created_before,
+        )
+
+        if self.seam.stream_list_responses:
+            devices = await self.seam.make_request(
+                "GET",
+                "/devices/list",
+                params=params,
+                stream_items="devices.item",
+            )
+            devices = [Device.from_dict(d) async for d in devices]
+            cache_devices(self.seam, devices)
+            return devices
+
+        res = await self.seam.make_request(
+            "GET",
+            "/devices/list",
+            params=params,
+        )
+        devices = [Device.from_dict(d) for d in res["devices"]]
+        cache_devices(self.seam, devices)
+
+        return devices
+
+    async def iter_list(
+        self,
+        connected_account: Union[ConnectedAccountId, ConnectedAccount] = None,
+        connected_accounts: List[
+            Union[ConnectedAccountId, ConnectedAccount]
+        ] = None,
+        connect_webview: Union[ConnectWebviewId, ConnectWebview] = None,
+        device_type: Optional[DeviceType] = None,
+        device_types: Optional[List[DeviceType]] = None,
+        device_ids: Optional[List[Union[DeviceId, Device]]] = None,
+        manufacturer: Optional[str] = None,
+        created_before: Optional[str] = None,
+        page_size: int = 100,
+    ) -> AsyncIterator[Device]:
+        """Iterates over devices, fetching one page at a time.
+
+        Pages are requested newest first by walking `created_before`, so only
+        one page is held in memory and the first devices arrive before the
+        last page is fetched.
+
+        Parameters
+        ----------
+        connected_account : ConnectedAccountId or ConnectedAccount, optional
+            Connected account id or ConnectedAccount to get devices associated with
+        connected_accounts : ConnectedAccountId(s) or ConnectedAccount(s), optional
+            Connected account ids or ConnectedAccount(s) to get devices associated with
+        connect_webview : ConnectWebviewId or ConnectWebview, optional
+            Connect webview id or ConnectWebview to get devices associated with
+        device_type : DeviceType, optional
+            Device type e.g. august_lock
+        device_types : List[DeviceType], optional
+            List of device types e.g. august_lock
+        device_ids : List[Union[DeviceId, Device]], optional
+            Device IDs to filter devices by
+        manufacturer : str, optional
+            Manufacturer name to filter devices by e.g. august, schlage
+        created_before : str, optional
+            If specified, only devices created before this date will be returned
+        page_size : int, optional
+            Number of devices fetched per request. Defaults to 100.
+
+        Raises
+        ------
+        Exception
+            If the API request wasn't successful.
+
+        Yields
+        ------
+            Device
+        """
+
+        cursor = CreatedBeforeCursor(page_size, "device_id", created_before)
+        while not cursor.done:
+            page = await self.list(
+                connected_account=connected_account,
+                connected_accounts=connected_accounts,
+                connect_webview=connect_webview,
+                device_type=device_type,
+                device_types=device_types,
+                device_ids=device_ids,
+                manufacturer=manufacturer,
+                limit=page_size,
+                created_before=cursor.created_before,
+            )
+            for device in cursor.advance(page):
+                yield device
+
+    @report_error_async
+    async def list_columns(
+        self,
+        connected_account: Union[ConnectedAccountId, ConnectedAccount] = None,
+        connected_accounts: List[
+            Union[ConnectedAccountId, ConnectedAccount]
+        ] = None,
+        connect_webview: Union[ConnectWebviewId, ConnectWebview] = None,
+        device_type: Optional[DeviceType] = None,
+        device_types: Optional[List[DeviceType]] = None,
+        device_ids: Optional[List[Union[DeviceId, Device]]] = None,
+        manufacturer: Optional[str] = None,
+        limit: Optional[float] = None,
+        created_before: Optional[str] = None,
+        columns: Sequence[str] = DEVICE_COLUMNS,
+    ) -> Dict[str, List[Any]]:
+        """Gets a list of devices as columns instead of Device objects.
+
+        Values are read straight from the response, so no per-device objects
+        are built. Pass the result to `seamapi.utils.columns.as_table` for a
+        pyarrow.Table.
+
+        Parameters
+        ----------
+        connected_account : ConnectedAccountId or ConnectedAccount, optional
+            Connected account id or ConnectedAccount to get devices associated with
+        connected_accounts : ConnectedAccountId(s) or ConnectedAccount(s), optional
+            Connected account ids or ConnectedAccount(s) to get devices associated with
+        connect_webview : ConnectWebviewId or ConnectWebview, optional
+            Connect webview id or ConnectWebview to get devices associated with
+        device_type : DeviceType, optional
+            Device type e.g. august_lock
+        device_types : List[DeviceType], optional
+            List of device types e.g. august_lock
+        device_ids : Optional[List[Union[DeviceId, Device]]]
+            Device IDs to filter devices by
+        manufacturer : Optional[str]
+            Manufacturer name to filter devices by e.g. august, schlage
+        limit : str, optional
+            Limit the number of devices returned
+        created_before : str, optional
+            If specified, only devices created before this date will be returned
+        columns : Sequence[str], optional
+            Dotted paths to extract, e.g. "properties.online". Defaults to
+            DEVICE_COLUMNS.
+
+        Raises
+        ------
+        Exception
+            If the API request wasn't successful.
+
+        Returns
+        ------
+            A dict mapping each column to a list with one value per device.
+        """
+
+        params = parse_list_device_params(
+            connected_account,
+            connected_accounts,
+            connect_webview,
+            device_type,
+            device_types,
+            device_ids,
+            manufacturer,
+            limit,
+            created_before,
+        )
+
+        res = await self.seam.make_request(
+            "GET",
+            "/devices/list",
+            params=params,
+        )
+
+        return to_columns(res["devices"], columns)
+
+    @report_error_async
+    async def get(
+        self,
+        device: Optional[Union[DeviceId, Device]] = None,
+        name: Optional[str] = None,
+    ) -> Device:
+        """Gets a device.
+
+        Parameters
+        ----------
+        device : DeviceId or Device, optional
+            Device id or Device to get the state of
+        name : str, optional
+            Device name
+
+        Raises
+        ------
+        Exception
+            If the API request wasn't successful.
+
+        Returns
+        ------
+            Device
+        """
+
+        cached_device = get_cached_device(self.seam, device, name)
+        if cached_device is not None:
+            return cached_device
+
+        if self._batcher is not None and device and not name:
+            device_id = to_device_id(device)
+            batched_device = await self._batcher.get(device_id)
+            if batched_device is None:
+                raise DevicesNotFoundException([device_id])
+            return batched_device
+
+        params = {}
+        if device:
+            params["device_id"] = to_device_id(device)
+        if name:
+            params["name"] = name
+        res = await self.seam.make_request("GET", "/devices/get", params=params)
+        json_device = res["device"]
+        fetched_device = Device.from_dict(json_device)
+        cache_devices(self.seam, [fetched_device])
+        return fetched_device
+
+    @report_error_async
+    async def get_many(
+        self,
+        devices: Sequence[Union[DeviceId, Device]],
+        batch_size: int = 100,
+        raise_if_missing: bool = True,
+    ) -> List[Optional[Device]]:
+        """Gets several devices with as few requests as possible.
+
+        Devices are fetched through /devices/list in chunks of `batch_size`
+        ids, and devices already in the device cache are not requested.
+
+        Parameters
+        ----------
+        devices : Sequence[Union[DeviceId, Device]]
+            Device ids or Devices to get
+        batch_size : int, optional
+            Number of device ids per request. Defaults to 100.
+        raise_if_missing : bool, optional
+            Defaults to True. If false, devices that were not found are
+            returned as None instead of raising.
+
+        Raises
+        ------
+        DevicesNotFoundException
+            If some devices were not found and raise_if_missing is true.
+        Exception
+            If the API request wasn't successful.
+
+        Returns
+        ------
+            A list of devices in the order of `devices`.
+        """
+
+        device_ids = [to_device_id(d) for d in devices]
+        found = await self._get_by_ids(device_ids, batch_size)
+
+        missing = [i for i in dict.fromkeys(device_ids) if i not in found]
+        if missing and raise_if_missing:
+            raise DevicesNotFoundException(missing)
+
+        return [found.get(i) for i in device_ids]
+
+    async def _get_by_ids(
+        self, device_ids: List[DeviceId], batch_size: int = 100
+    ) -> Dict[DeviceId, Device]:
+        found = {}
+        pending = []
+        for device_id in dict.fromkeys(device_ids):
+            cached_device = get_cached_device(self.seam, device_id)
+            if cached_device is not None:
+                found[device_id] = cached_device
+            else:
+                pending.append(device_id)
+
+        pages = await asyncio.gather(
+            *(self.list(device_ids=chunk) for chunk in chunks(pending, batch_size))
+        )
+        for page in pages:
+            for device in page:
+                found[device.device_id] = device
+        return found
+
+    @report_error_async
+    async def update(
+        self,
+        device: Union[DeviceId, Device],
+        name: Optional[str] = None,
+        properties: Optional[dict] = None,
+        location: Optional[dict] = None,
+        is_managed: Optional[bool] = None,
+    ) -> bool:
+        """Updates a device.
+
+        Parameters
+        ----------
+        device : DeviceId or Device
+            Device id or Device to update
+        name : str, optional
+            New device name
+        properties : dict, optional
+            New device properties
+        location : str, optional
+            New device location
+        is_managed : bool, optional
+            The managed state of the device
+
+        Raises
+        ------
+        Exception
+            If the API request wasn't successful.
+
+        Returns
+        ------
+            Boolean
+        """
+
+        if not device:
+            raise Exception("device is required")
+
+        update_payload = {
+            "device_id": to_device_id(device),
+        }
+        if name:
+            update_payload["name"] = name
+        if properties:
+            update_payload["properties"] = properties
+        if location:
+            update_payload["location"] = location
+        if is_managed is not None:
+            update_payload["is_managed"] = is_managed
+
+        await self.seam.make_request(
+            "POST",
+            "/devices/update",
+            json=update_payload,
+        )
+        invalidate_device(self.seam, device)
+
+        return True
+
+    @report_error_async
+    async def delete(self, device: Union[DeviceId, Device]) -> bool:
+        """Deletes a device.
+
+        Parameters
+        ----------
+        device : DeviceId or Device
+            Device id or Device to delete
+
+        Raises
+        ------
+        Exception
+            If the API request wasn't successful.
+
+        Returns
+        ------
+            Boolean
+        """
+
+        if not device:
+            raise Exception("device is required")
+
+        delete_payload = {"device_id": to_device_id(device)}
+        await self.seam.make_request(
+            "DELETE",
+            "/devices/delete",
+            json=delete_payload,
+        )
+        invalidate_device(self.seam, device)
+
+        return True
+
+    @report_error_async
+    async def list_device_providers(
+        self, provider_category: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Retrieve a list of device providers
+
+        Parameters
+        ----------
+        provider_category : Optional[str]
+            Provider category to filter by eg. stable
+
+        Raises
+        ------
+        Exception
+            If the API request wasn't successful.
+
+        Returns
+        ------
+            List of device providers
+        """
+        params = {}
+
+        if provider_category:
+            params["provider_category"] = provider_category
+
+        res = await self.seam.make_request(
+            "GET",
+            "/devices/list_device_providers",
+            params=params,
+        )
+
+        return res["device_providers"]
+
+
+class AsyncUnmanagedDevices:
+    """
+    A class used to retrieve unmanaged device data
+    through interaction with Seam API
+
+    ...
+
+    Attributes
+    ----------
+    seam : Seam
+        Initial seam class
+
+    Methods
+    -------
+    get(device=None, name=None)
+        Gets an unmanaged device
+    list(connected_account=None, connected_accounts=None, connect_webview=None, device_type=None, device_ids=None, manufacturer=None)
+        Gets a list of unmanaged devices
+    iter_list(connected_account=None, connected_accounts=None, connect_webview=None, device_type=None, device_ids=None, manufacturer=None, created_before=None, page_size=100)
+        Iterates over unmanaged devices page by page
+    update(device, is_managed)
+        Updates an unmanaged device
+    """
+
+    seam: "Seam"
+
+    def __init__(self, seam: "Seam"):
+        """
+        Parameters
+        ----------
+        seam : Seam
+          Initial seam class
+        """
+
+        self.seam = seam
+
+    @report_error_async
+    async def get(
+        self,
+        device: Optional[Union[DeviceId, Device]] = None,
+        name: Optional[str] = None,
+    ) -> UnmanagedDevice:
+        """Gets an unmanaged devices.
+
+        Parameters
+        ----------
+        device : Union[DeviceId, Device], optional
+            Device ID or Device
+        name : str, optional
+            Device name
+
+        Raises
+        ------
+        Exception
+            If the API request wasn't successful.
+
+        Returns
+        ------
+            An unmanaged device.
+        """
+
+        params = {}
+
+        if device:
+            params["device_id"] = to_device_id(device)
+        if name:
+            params["name"] = name
+
+        res = await self.seam.make_request(
+            "GET",
+            "/devices/unmanaged/get",
+            params=params,
+        )
+        json_device = res["device"]
+
+        return UnmanagedDevice.from_dict(json_device)
+
+    @report_error_async
+    async def list(
+        self,
+        connected_account: Union[ConnectedAccountId, ConnectedAccount] = None,
+        connected_accounts: List[
+            Union[ConnectedAccountId, ConnectedAccount]
+        ] = None,
+        connect_webview: Union[ConnectWebviewId, ConnectWebview] = None,
+        device_type: Optional[DeviceType] = None,
+        device_types: Optional[List[DeviceType]] = None,
+        device_ids: Optional[List[Union[DeviceId, Device]]] = None,
+        manufacturer: Optional[str] = None,
+        limit: Optional[float] = None,
+        created_before: Optional[str] = None,
+    ) -> List[UnmanagedDevice]:
+        """Gets a list of unmanaged devices.
+
+        Parameters
+        ----------
+        connected_account : ConnectedAccountId or ConnectedAccount, optional
+            Connected account id or ConnectedAccount to get devices associated with
+        connected_accounts : ConnectedAccountId(s) or ConnectedAccount(s), optional
+            Connected account ids or ConnectedAccount(s) to get devices associated with
+        connect_webview : ConnectWebviewId or ConnectWebview, optional
+            Connect webview id or ConnectWebview to get devices associated with
+        device_type : DeviceType, optional
+            Device type e.g. august_lock
+        device_types : List[DeviceType], optional
+            List of device types e.g. august_lock
+        device_ids : List[Union[DeviceId, Device]], optional
+            Device IDs to filter devices by
+        manufacturer : str, optional
+            Manufacturer name to filter devices by e.g. august, schlage
+        limit : str, optional
+            Limit the number of devices returned
+        created_before : str, optional
+            If specified, only devices created before this date will be returned
+
+        Raises
+        ------
+        Exception
+            If the API request wasn't successful.
+
+        Returns
+        ------
+            A list of unmanaged devices.
+        """
+
+        params = parse_list_device_params(
+            connected_account,
+            connected_accounts,
+            connect_webview,
+            device_type,
+            device_types,
+            device_ids,
+            manufacturer,
+            limit,
+            created_before,
+        )
+
+        if self.seam.stream_list_responses:
+            devices = await self.seam.make_request(
+                "GET",
+                "/devices/unmanaged/list",
+                params=params,
+                stream_items="devices.item",
+            )
+            return [UnmanagedDevice.from_dict(d) async for d in devices]
+
+        res = await self.seam.make_request(
+            "GET",
+            "/devices/unmanaged/list",
+            params=params,
+        )
+        devices = res["devices"]
+
+        return [UnmanagedDevice.from_dict(d) for d in devices]
+
+    async def iter_list(
+        self,
+        connected_account: Union[ConnectedAccountId, ConnectedAccount] = None,
+        connected_accounts: List[
+            Union[ConnectedAccountId, ConnectedAccount]
+        ] = None,
+        connect_webview: Union[ConnectWebviewId, ConnectWebview] = None,
+        device_type: Optional[DeviceType] = None,
+        device_types: Optional[List[DeviceType]] = None,
+        device_ids: Optional[List[Union[DeviceId, Device]]] = None,
+        manufacturer: Optional[str] = None,
+        created_before: Optional[str] = None,
+        page_size: int = 100,
+    ) -> AsyncIterator[UnmanagedDevice]:
+        """Iterates over unmanaged devices, fetching one page at a time.
+
+        Pages are requested newest first by walking `created_before`, so only
+        one page is held in memory and the first unmanaged devices arrive before the
+        last page is fetched.
+
+        Parameters
+        ----------
+        connected_account : ConnectedAccountId or ConnectedAccount, optional
+            Connected account id or ConnectedAccount to get devices associated with
+        connected_accounts : ConnectedAccountId(s) or ConnectedAccount(s), optional
+            Connected account ids or ConnectedAccount(s) to get devices associated with
+        connect_webview : ConnectWebviewId or ConnectWebview, optional
+            Connect webview id or ConnectWebview to get devices associated with
+        device_type : DeviceType, optional
+            Device type e.g. august_lock
+        device_types : List[DeviceType], optional
+            List of device types e.g. august_lock
+        device_ids : List[Union[DeviceId, Device]], optional
+            Device IDs to filter devices by
+        manufacturer : str, optional
+            Manufacturer name to filter devices by e.g. august, schlage
+        created_before : str, optional
+            If specified, only devices created before this date will be returned
+        page_size : int, optional
+            Number of devices fetched per request. Defaults to 100.
+
+        Raises
+        ------
+        Exception
+            If the API request wasn't successful.
+
+        Yields
+        ------
+            UnmanagedDevice
+        """
+
+        cursor = CreatedBeforeCursor(page_size, "device_id", created_before)
+        while not cursor.done:
+            page = await self.list(
+                connected_account=connected_account,
+                connected_accounts=connected_accounts,
+                connect_webview=connect_webview,
+                device_type=device_type,
+                device_types=device_types,
+                device_ids=device_ids,
+                manufacturer=manufacturer,
+                limit=page_size,
+                created_before=cursor.created_before,
+            )
+            for device in cursor.advance(page):
+                yield device
+
+    @report_error_async
+    async def update(
+        self,
+        device: Union[DeviceId, UnmanagedDevice],
+        is_managed: bool,
+    ) -> bool:
+        """Updates a device transitioning it from an unmanaged state to a managed one.
+
+        Parameters
+        ----------
+        device : DeviceId or Device
+            Device id or Device to update
+        is_managed : bool
+            The managed state of the device
+
+        Raises
+        ------
+        Exception
+            If the API request wasn't successful.
+
+        Returns
+        ------
+            Boolean
+        """
+
+        if not device:
+            raise Exception("device is required")
+
+        await self.seam.make_request(
+            "POST",
+            "/devices/unmanaged/update",
+            json={
+                "device_id": to_device_id(device),
+                "is_managed": is_managed,
+            },
+        )
+        invalidate_device(self.seam, device)
+
+        return True
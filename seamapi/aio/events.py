@@ -0,0 +1,417 @@
+from seamapi.types import (
+    AccessCode,
+    ConnectedAccount,
+    Device,
+    Event,
+)
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, List, Optional, Sequence, Union, TYPE_CHECKING
+from seamapi.utils.convert_to_id import (
+    to_access_code_id,
+    to_connected_account_id,
+    to_device_id,
+    to_event_id,
+)
+from seamapi.utils.paginate import (
+    TimeShards,
+    format_timestamp,
+    parse_timestamp,
+    time_windows,
+)
+
+from seamapi.utils.device_cache import invalidate_event_devices
+from seamapi.utils.report_error import report_error_async
+
+if TYPE_CHECKING:
+    from seamapi.aio.seam import AsyncSeam as Seam
+
+
+class AsyncEvents:
+    """
+    A class to interact with events through the Seam API
+
+    ...
+
+    Attributes
+    ----------
+    seam : Seam
+        Initial seam class
+
+    Methods
+    -------
+    list(since=None, between=None, device_id=None, device_ids=None, access_code_id=None, access_code_ids=None, event_type=None, event_types=None, connected_account_id=None, fields=None)
+        Gets a list of events
+
+    iter_list(since, until=None, window=timedelta(hours=1), page_limit=500, min_window=timedelta(seconds=1), device_id=None, device_ids=None, access_code_id=None, access_code_ids=None, event_type=None, event_types=None, connected_account_id=None, fields=None)
+        Iterates over events one time window at a time
+
+    backfill(start, end=None, shards=8, max_workers=8, page_limit=500, min_shard=timedelta(seconds=1), device_id=None, device_ids=None, access_code_id=None, access_code_ids=None, event_type=None, event_types=None, connected_account_id=None, fields=None)
+        Fetches a long time range as concurrent, adaptively split shards
+
+    get(device_id=None, event_id=None, event_type=None, fields=None)
+        Gets an event
+    """
+
+    seam: "Seam"
+
+    def __init__(self, seam: "Seam"):
+        """
+        Parameters
+        ----------
+        seam : Seam
+          Initial seam class
+        """
+        self.seam = seam
+
+    @report_error_async
+    async def list(
+        self,
+        since: Optional[str] = None,
+        between: Optional[list] = None,
+        device_id: Union[str, Device] = None,
+        device_ids: Optional[list] = None,
+        access_code_id: Union[str, AccessCode] = None,
+        access_code_ids: Optional[list] = None,
+        event_type: Optional[str] = None,
+        event_types: Optional[list] = None,
+        connected_account_id: Union[str, ConnectedAccount] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[Event]:
+        """Gets a list of events.
+
+        Parameters
+        ----------
+        since : Optional[str]
+            ISO 8601 timestamp of the earliest event to return
+        between : Optional[list]
+            List of two ISO 8601 timestamps to specify a date range for filtering events
+        device_id : Union[str, Device]
+            Device ID or Device to filter events by
+        device_ids : Optional[list]
+            Device IDs to filter events by
+        access_code_id : Union[str, AccessCode]
+            Access Code ID or AccessCode to filter events by
+        access_code_ids : Optional[list]
+            Access Code IDs to filter events by
+        event_type : Optional[str]
+            Event type to filter events by
+        event_types : Optional[list]
+            Event types to filter events by
+        connected_account_id : Union[str, ConnectedAccount]
+            Connected Account ID or ConnectedAccount to filter events by
+        fields : Optional[Sequence[str]]
+            Payload fields to keep besides the Event attributes. Defaults to
+            all. Projecting lets the rest of each event be freed.
+
+        Raises
+        ------
+        Exception
+            If the API request wasn't successful.
+
+        Returns
+        ------
+            A list of events.
+        """
+        device_id = to_device_id(device_id) if device_id else None
+        access_code_id = (
+            to_access_code_id(access_code_id) if access_code_id else None
+        )
+        connected_account_id = (
+            to_connected_account_id(connected_account_id)
+            if connected_account_id
+            else None
+        )
+
+        params = {}
+        arguments = {
+            "since": since,
+            "between": between,
+            "device_id": device_id,
+            "device_ids": device_ids,
+            "access_code_id": access_code_id,
+            "access_code_ids": access_code_ids,
+            "event_type": event_type,
+            "event_types": event_types,
+            "connected_account_id": connected_account_id,
+        }
+
+        for name in arguments:
+            if arguments[name]:
+                params.update({name: arguments[name]})
+
+        if self.seam.stream_list_responses:
+            events = await self.seam.make_request(
+                "GET",
+                "/events/list",
+                params=params,
+                stream_items="events.item",
+            )
+            events = [Event.from_dict(e, fields) async for e in events]
+            invalidate_event_devices(self.seam, events)
+            return events
+
+        res = await self.seam.make_request(
+            "GET",
+            "/events/list",
+            params=params,
+        )
+        events = [Event.from_dict(e, fields) for e in res["events"]]
+        invalidate_event_devices(self.seam, events)
+
+        return events
+
+    async def iter_list(
+        self,
+        since: str,
+        until: Optional[str] = None,
+        window: timedelta = timedelta(hours=1),
+        page_limit: int = 500,
+        min_window: timedelta = timedelta(seconds=1),
+        device_id: Union[str, Device] = None,
+        device_ids: Optional[list] = None,
+        access_code_id: Union[str, AccessCode] = None,
+        access_code_ids: Optional[list] = None,
+        event_type: Optional[str] = None,
+        event_types: Optional[list] = None,
+        connected_account_id: Union[str, ConnectedAccount] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> AsyncIterator[Event]:
+        """Iterates over events, fetching one time window at a time.
+
+        The range from `since` to `until` is split into consecutive windows,
+        each fetched with `between`, so only one window of events is held in
+        memory. Like in `backfill`, a window that returns `page_limit` events
+        is treated as truncated and fetched again as two halves. Events on a
+        window edge are yielded once.
+
+        Parameters
+        ----------
+        since : str
+            ISO 8601 timestamp of the earliest event to return
+        until : Optional[str]
+            ISO 8601 timestamp of the latest event to return. Defaults to now.
+        window : timedelta
+            Length of the time range fetched per request. Defaults to one hour.
+        page_limit : int
+            Number of events per response at which a window is treated as
+            truncated and split in two. Set it to the server's page size.
+            Defaults to 500.
+        min_window : timedelta
+            Windows shorter than this are not split further. Defaults to one second.
+        device_id : Union[str, Device]
+            Device ID or Device to filter events by
+        device_ids : Optional[list]
+            Device IDs to filter events by
+        access_code_id : Union[str, AccessCode]
+            Access Code ID or AccessCode to filter events by
+        access_code_ids : Optional[list]
+            Access Code IDs to filter events by
+        event_type : Optional[str]
+            Event type to filter events by
+        event_types : Optional[list]
+            Event types to filter events by
+        connected_account_id : Union[str, ConnectedAccount]
+            Connected Account ID or ConnectedAccount to filter events by
+        fields : Optional[Sequence[str]]
+            Payload fields to keep besides the Event attributes. Defaults to
+            all. Projecting lets the rest of each event be freed.
+
+        Raises
+        ------
+        Exception
+            If the API request wasn't successful.
+
+        Yields
+        ------
+            Event
+        """
+        previous_ids = set()
+        for start, end in time_windows(since, until, window):
+            windows = TimeShards(
+                parse_timestamp(start),
+                parse_timestamp(end),
+                1,
+                page_limit,
+                min_window,
+                previous_ids=previous_ids,
+            )
+            while not windows.done:
+                shard = windows.pending[0]
+                events = await self.list(
+                    between=[format_timestamp(shard[0]), format_timestamp(shard[1])],
+                    device_id=device_id,
+                    device_ids=device_ids,
+                    access_code_id=access_code_id,
+                    access_code_ids=access_code_ids,
+                    event_type=event_type,
+                    event_types=event_types,
+                    connected_account_id=connected_account_id,
+                    fields=fields,
+                )
+                windows.complete(shard, events)
+                for event in windows.ready():
+                    yield event
+            previous_ids = windows.previous_ids
+
+    async def backfill(
+        self,
+        start: str,
+        end: Optional[str] = None,
+        shards: int = 8,
+        max_workers: int = 8,
+        page_limit: int = 500,
+        min_shard: timedelta = timedelta(seconds=1),
+        device_id: Union[str, Device] = None,
+        device_ids: Optional[list] = None,
+        access_code_id: Union[str, AccessCode] = None,
+        access_code_ids: Optional[list] = None,
+        event_type: Optional[str] = None,
+        event_types: Optional[list] = None,
+        connected_account_id: Union[str, ConnectedAccount] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> AsyncIterator[Event]:
+        """Fetches a long time range as concurrent shards of `between` requests.
+
+        The range is split into `shards` equal parts fetched with at most `max_workers` requests in flight. Shards
+        that hit `page_limit` are split in two and fetched again, so busy
+        periods end up in narrower shards. Events are yielded in
+        `created_at` order as soon as every earlier shard is done, without
+        the duplicates returned on shard edges.
+
+        Parameters
+        ----------
+        start : str
+            ISO 8601 timestamp of the earliest event to return
+        end : Optional[str]
+            ISO 8601 timestamp of the latest event to return. Defaults to now.
+        shards : int
+            Number of equal time shards the range starts split into. Defaults to 8.
+        max_workers : int
+            Maximum number of shards fetched at once. Defaults to 8.
+        page_limit : int
+            Number of events per response at which a shard is treated as
+            truncated and split in two. Set it to the server's page size.
+            Defaults to 500.
+        min_shard : timedelta
+            Shards shorter than this are not split further. Defaults to one second.
+        device_id : Union[str, Device]
+            Device ID or Device to filter events by
+        device_ids : Optional[list]
+            Device IDs to filter events by
+        access_code_id : Union[str, AccessCode]
+            Access Code ID or AccessCode to filter events by
+        access_code_ids : Optional[list]
+            Access Code IDs to filter events by
+        event_type : Optional[str]
+            Event type to filter events by
+        event_types : Optional[list]
+            Event types to filter events by
+        connected_account_id : Union[str, ConnectedAccount]
+            Connected Account ID or ConnectedAccount to filter events by
+        fields : Optional[Sequence[str]]
+            Payload fields to keep besides the Event attributes. Defaults to all.
+
+        Raises
+        ------
+        Exception
+            If the API request wasn't successful.
+
+        Yields
+        ------
+            Event, in `created_at` order
+        """
+
+        end_at = datetime.now(timezone.utc) if end is None else parse_timestamp(end)
+        time_shards = TimeShards(
+            parse_timestamp(start), end_at, shards, page_limit, min_shard
+        )
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def fetch(shard):
+            async with semaphore:
+                return await self.list(
+                    between=[format_timestamp(shard[0]), format_timestamp(shard[1])],
+                    device_id=device_id,
+                    device_ids=device_ids,
+                    access_code_id=access_code_id,
+                    access_code_ids=access_code_ids,
+                    event_type=event_type,
+                    event_types=event_types,
+                    connected_account_id=connected_account_id,
+                    fields=fields,
+                )
+
+        in_flight = {
+            asyncio.ensure_future(fetch(shard)): shard
+            for shard in time_shards.pending
+        }
+        try:
+            while not time_shards.done:
+                finished, _ = await asyncio.wait(
+                    in_flight, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in finished:
+                    shard = in_flight.pop(task)
+                    for retry in time_shards.complete(shard, task.result()):
+                        in_flight[asyncio.ensure_future(fetch(retry))] = retry
+                for event in time_shards.ready():
+                    yield event
+        finally:
+            for task in in_flight:
+                task.cancel()
+
+    @report_error_async
+    async def get(
+        self,
+        event_id: Union[str, Event] = None,
+        event_type: Optional[str] = None,
+        device_id: Union[str, Device] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Optional[Event]:
+        """Get an Event.
+
+        Parameters
+        ----------
+            event_id : Union[str, Event]
+                Event ID or Event to filter events by
+            event_type : Optional[str]
+                Event type to filter events by
+            device_id : Union[str, Device]
+                Device ID or Device to filter events by
+            fields : Optional[Sequence[str]]
+                Payload fields to keep besides the Event attributes. Defaults to all.
+
+        Raises
+        ------
+        Exception
+            If the API request wasn't successful.
+
+        Returns
+        ------
+            An event or None.
+        """
+        device_id = to_device_id(device_id) if device_id else None
+        event_id = to_event_id(event_id) if event_id else None
+
+        params = {}
+        arguments = {
+            "event_id": event_id,
+            "event_type": event_type,
+            "device_id": device_id,
+        }
+
+        for name in arguments:
+            if arguments[name]:
+                params.update({name: arguments[name]})
+
+        res = await self.seam.make_request(
+            "GET",
+            "/events/get",
+            params=params,
+        )
+
+        event = res.get("event", None)
+        if event is None:
+            return None
+        return Event.from_dict(event, fields)
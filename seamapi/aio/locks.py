@@ -0,0 +1,238 @@
+from seamapi.types import (
+    ActionAttempt,
+    ConnectWebview,
+    ConnectWebviewId,
+    ConnectedAccount,
+    ConnectedAccountId,
+    Device,
+    DeviceId,
+)
+from typing import List, Union, Optional, TYPE_CHECKING
+from seamapi.utils.convert_to_id import (
+    to_connect_webview_id,
+    to_connected_account_id,
+    to_device_id,
+)
+from seamapi.utils.device_cache import (
+    cache_devices,
+    get_cached_device,
+    invalidate_device,
+    poll_until_ready_and_invalidate_async,
+)
+from seamapi.utils.report_error import report_error_async
+
+if TYPE_CHECKING:
+    from seamapi.aio.seam import AsyncSeam as Seam
+
+
+class AsyncLocks:
+    """
+    A class used to retreive lock data
+    through interaction with Seam API
+
+    ...
+
+    Attributes
+    ----------
+    seam : Seam
+        Initial seam class
+
+    Methods
+    -------
+    list(connected_account=None, connect_webview=None)
+        Gets a list of locks
+    get(device=None, name=None)
+        Gets a lock
+    lock_door(device, wait_for_action_attempt=True)
+        Locks a lock
+    unlock_door(device, wait_for_action_attempt=True)
+        Unlocks a lock
+    """
+
+    seam: "Seam"
+
+    def __init__(self, seam: "Seam"):
+        """
+        Parameters
+        ----------
+        seam : Seam
+          Initial seam class
+        """
+
+        self.seam = seam
+
+    @report_error_async
+    async def list(
+        self,
+        connected_account: Optional[
+            Union[ConnectedAccountId, ConnectedAccount]
+        ] = None,
+        connect_webview: Optional[
+            Union[ConnectWebviewId, ConnectWebview]
+        ] = None,
+    ) -> List[Device]:
+        """Gets a list of locks.
+
+        Parameters
+        ----------
+        connected_account : ConnectedAccountId or ConnectedAccount, optional
+            Connected account id or ConnectedAccount to get locks associated with
+        connect_webview : ConnectWebviewId or ConnectWebview, optional
+            Connect webview id or ConnectWebview to get locks associated with
+
+        Raises
+        ------
+        Exception
+            If the API request wasn't successful.
+
+        Returns
+        ------
+            A list of locks.
+        """
+
+        params = {}
+        if connected_account:
+            params["connected_account_id"] = to_connected_account_id(
+                connected_account
+            )
+        if connect_webview:
+            params["connect_webview_id"] = to_connect_webview_id(
+                connect_webview
+            )
+
+        res = await self.seam.make_request(
+            "GET",
+            "/locks/list",
+            params=params,
+        )
+        json_locks = res["devices"]
+
+        return [Device.from_dict(d) for d in json_locks]
+
+    @report_error_async
+    async def get(
+        self,
+        device: Optional[Union[DeviceId, Device]] = None,
+        name: Optional[str] = None,
+    ) -> Device:
+        """Gets a lock.
+
+        Parameters
+        ----------
+        device : DeviceId or Device, optional
+            Device id or Device to get the latest state of
+        name : str, optional
+            Device name
+
+        Raises
+        ------
+        Exception
+            If the API request wasn't successful.
+
+        Returns
+        ------
+            A lock dict.
+        """
+
+        cached_device = get_cached_device(self.seam, device, name)
+        if cached_device is not None:
+            return cached_device
+
+        params = {}
+        if device:
+            params["device_id"] = to_device_id(device)
+        if name:
+            params["name"] = name
+
+        res = await self.seam.make_request(
+            "GET",
+            "/locks/get",
+            params=params,
+        )
+        json_lock = res["device"]
+
+        fetched_device = Device.from_dict(json_lock)
+        cache_devices(self.seam, [fetched_device])
+        return fetched_device
+
+    @report_error_async
+    async def lock_door(
+        self,
+        device: Union[DeviceId, Device],
+        wait_for_action_attempt: Optional[bool] = True,
+    ) -> ActionAttempt:
+        """Locks a lock.
+
+        Parameters
+        ----------
+        device : DeviceId or Device
+            Device id or Device to be locked
+        wait_for_action_attempt: bool, optional
+            Should wait for action attempt to resolve
+
+        Raises
+        ------
+        Exception
+            If the API request wasn't successful.
+
+        Returns
+        ------
+            ActionAttempt
+        """
+
+        device_id = to_device_id(device)
+        res = await self.seam.make_request(
+            "POST",
+            "/locks/lock_door",
+            json={"device_id": device_id},
+        )
+        action_attempt = res["action_attempt"]
+        invalidate_device(self.seam, device_id)
+
+        if not wait_for_action_attempt:
+            return ActionAttempt.from_dict(action_attempt)
+
+        return await poll_until_ready_and_invalidate_async(
+            self.seam, action_attempt["action_attempt_id"], device_id
+        )
+
+    @report_error_async
+    async def unlock_door(
+        self,
+        device: Union[DeviceId, Device],
+        wait_for_action_attempt: Optional[bool] = True,
+    ) -> ActionAttempt:
+        """Unlocks a lock.
+
+        Parameters
+        ----------
+        device : DeviceId or Device
+            Device id or Device to be locked
+        wait_for_action_attempt: bool, optional
+            Should wait for action attempt to resolve
+
+        Raises
+        ------
+        Exception
+            If the API request wasn't successful.
+
+        Returns
+        ------
+            ActionAttempt
+        """
+
+        device_id = to_device_id(device)
+        res = await self.seam.make_request(
+            "POST",
+            "/locks/unlock_door",
+            json={"device_id": device_id},
+        )
+        action_attempt = res["action_attempt"]
+        invalidate_device(self.seam, device_id)
+
+        if not wait_for_action_attempt:
+            return ActionAttempt.from_dict(action_attempt)
+
+        return await poll_until_ready_and_invalidate_async(
+            self.seam, action_attempt["action_attempt_id"], device_id
+        )
@@ -0,0 +1,44 @@
+from typing import TYPE_CHECKING
+from seamapi.aio.noise_thresholds import AsyncNoiseThresholds
+from seamapi.utils.report_error import report_error_async
+
+if TYPE_CHECKING:
+    from seamapi.aio.seam import AsyncSeam as Seam
+
+
+class AsyncNoiseSensors:
+    """
+    A class to interact with noise sensors through the Seam API
+
+    ...
+
+    Attributes
+    ----------
+    seam : Seam
+        Initial seam class
+
+    Properties
+    -------
+    noise_thresholds
+        An instance of the NoiseThresholds class designed to interact with noise thresholds
+    """
+
+    seam: "Seam"
+
+    def __init__(self, seam: "Seam"):
+        """
+        Parameters
+        ----------
+        seam : Seam
+          Initial seam class
+        """
+        self.seam = seam
+        self._noise_thresholds = AsyncNoiseThresholds(seam=seam)
+
+    @property
+    def noise_thresholds(self) -> AsyncNoiseThresholds:
+        return self._noise_thresholds
+
+    @report_error_async
+    async def list_noise_levels(self, noise_threshold_id):
+        raise NotImplementedError()
@@ -0,0 +1,19 @@
+from seamapi.routes import LazyRoute
+
+
+class AsyncRoutes:
+    workspaces = LazyRoute("seamapi.aio.workspaces", "AsyncWorkspaces")
+    connected_accounts = LazyRoute("seamapi.aio.connected_accounts", "AsyncConnectedAccounts")
+    connect_webviews = LazyRoute("seamapi.aio.connect_webviews", "AsyncConnectWebviews")
+    devices = LazyRoute("seamapi.aio.devices", "AsyncDevices")
+    events = LazyRoute("seamapi.aio.events", "AsyncEvents")
+    locks = LazyRoute("seamapi.aio.locks", "AsyncLocks")
+    access_codes = LazyRoute("seamapi.aio.access_codes", "AsyncAccessCodes")
+    action_attempts = LazyRoute("seamapi.aio.action_attempts", "AsyncActionAttempts")
+    noise_sensors = LazyRoute("seamapi.aio.noise_sensors", "AsyncNoiseSensors")
+    thermostats = LazyRoute("seamapi.aio.thermostats", "AsyncThermostats")
+    webhooks = LazyRoute("seamapi.aio.webhooks", "AsyncWebhooks")
+    bulk = LazyRoute("seamapi.aio.bulk", "AsyncBulk")
+
+    async def make_request(self):
+      raise NotImplementedError()
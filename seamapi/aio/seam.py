@@ -0,0 +1,352 @@
+import asyncio
+import os
+
+from seamapi.utils.get_sentry_dsn import get_sentry_dsn
+from seamapi.utils.get_sdk_version import get_sdk_version
+from seamapi.utils.http_cache import MISSING, HttpCache, request_key
+from seamapi.utils.completion_broker import CompletionBroker
+from seamapi.utils.device_cache import DeviceCache
+from seamapi.utils.json_codec import JsonCodec, get_default_json_codec
+from seamapi.utils.rate_limit import RateLimiter
+from seamapi.utils.retry import RetryPolicy
+from seamapi.utils.single_flight import AsyncSingleFlight
+from seamapi.utils.stream_json import aiter_json_items, require_ijson
+from .routes import AsyncRoutes
+import httpx
+from typing import Optional, cast
+from seamapi.types import SeamApiException
+
+
+class AsyncSeam(AsyncRoutes):
+    """
+    Asyncio counterpart of the Seam class. Every route method is a coroutine
+    and all requests share one pooled httpx.AsyncClient.
+
+    ...
+
+    Attributes
+    ----------
+    api_key : str
+        API key (default None)
+    api_url : str
+        API url (default None)
+    client : httpx.AsyncClient
+        Connection-pooled client reused by every request
+    workspaces : AsyncWorkspaces
+        Workspaces class
+    connected_accounts : AsyncConnectedAccounts
+        Connected accounts class
+    connect_webviews : AsyncConnectWebviews
+        Connect webviews class
+    devices : AsyncDevices
+        Devices class
+    events : AsyncEvents
+        Events class
+    locks : AsyncLocks
+        Locks class
+    access_codes : AsyncAccessCodes
+        Access codes class
+    action_attempts : AsyncActionAttempts
+        Action attempts class
+    bulk : AsyncBulk
+        Concurrent executor for multi-device operations
+    device_cache : DeviceCache or None
+        Opt-in device cache used by the device, lock and thermostat routes
+    http_cache : HttpCache or None
+        Opt-in validator cache for conditional GET requests
+    retry_policy : RetryPolicy or None
+        Opt-in retry policy applied to every request
+    rate_limiter : RateLimiter or None
+        Opt-in client-side rate and concurrency limits
+    single_flight : AsyncSingleFlight or None
+        Coalesces identical in-flight GET requests when enabled
+    completion_broker : CompletionBroker or None
+        Opt-in webhook receiver that wakes action attempt waiters
+    """
+
+    api_key: str
+    api_url: str = "https://connect.getseam.com"
+    client: httpx.AsyncClient
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        workspace_id: Optional[str] = None,
+        api_url: Optional[str] = None,
+        should_report_exceptions: Optional[bool] = False,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        stream_list_responses: bool = False,
+        json_codec: Optional[JsonCodec] = None,
+        device_cache: Optional[DeviceCache] = None,
+        http_cache: Optional[HttpCache] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalesce_requests: bool = False,
+        device_get_batch_window: Optional[float] = None,
+        completion_broker: Optional[CompletionBroker] = None,
+    ):
+        """
+        Parameters
+        ----------
+        api_key : str, optional
+          API key
+        workspace_id : str, optional
+          Workspace id
+        api_url : str, optional
+          API url
+        should_report_exceptions : bool, optional
+          Defaults to False. If true, thrown exceptions will be reported to Seam.
+        max_connections : int, optional
+          Maximum number of concurrent connections. Defaults to 100.
+        max_keepalive_connections : int, optional
+          Maximum number of idle keep-alive connections. Defaults to 20.
+        stream_list_responses : bool, optional
+          Defaults to False. If true, large list responses (devices, events)
+          are decoded incrementally and each model is built as soon as its
+          array element is parsed. Requires ijson.
+        json_codec : JsonCodec, optional
+          Codec used to encode payloads and decode responses. Defaults to
+          orjson when it is installed, otherwise the standard library json.
+        device_cache : DeviceCache, optional
+          Defaults to None. If given, devices fetched through the device,
+          lock and thermostat routes are cached and reads are served from it
+          until they expire or a write or event invalidates them. Events
+          are those listed through the events routes and, when a
+          completion_broker is given too, webhook deliveries it receives.
+        http_cache : HttpCache, optional
+          Defaults to None. If given, GET requests are made conditional with
+          the validators of the previous response, and a 304 reply is
+          served from the previously received body.
+        retry_policy : RetryPolicy, optional
+          Defaults to None (no retries). If given, failed requests are
+          retried according to the policy.
+        rate_limiter : RateLimiter, optional
+          Defaults to None. If given, every request (including retries)
+          waits for the rate and in-flight limits of its endpoint family.
+          Share one limiter between clients to enforce a common quota.
+        coalesce_requests : bool, optional
+          Defaults to False. If true, identical GET requests made while one
+          is already in flight share its response, and each caller still
+          decodes its own copy of the body.
+        device_get_batch_window : float, optional
+          Defaults to None. If set, concurrent devices.get calls by id made
+          within this many seconds of each other are combined into one
+          /devices/list request. Callers asking for the same id each get
+          their own Device. A device that isn't found raises
+          DevicesNotFoundException.
+        completion_broker : CompletionBroker, optional
+          Defaults to None. If given, poll_until_ready waits for the
+          broker's webhook events instead of polling, and only polls every
+          `fallback_interval` seconds as a safety net.
+        """
+        if api_key is None:
+            api_key = os.environ.get("SEAM_API_KEY", None)
+        if api_key is None:
+            raise Exception(
+                "SEAM_API_KEY not found in environment, and api_key not provided"
+            )
+        if workspace_id is None:
+            workspace_id = os.environ.get("SEAM_WORKSPACE_ID", None)
+        self.api_key = api_key
+        self.workspace_id = workspace_id
+        if api_url is not None:
+            self.api_url = cast(str, api_url)
+        self.should_report_exceptions = should_report_exceptions
+        self.stream_list_responses = stream_list_responses
+        if self.stream_list_responses:
+            require_ijson()
+        self.json_codec = json_codec or get_default_json_codec()
+        self.device_cache = device_cache
+        self.http_cache = http_cache
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self.device_get_batch_window = device_get_batch_window
+        self.single_flight = AsyncSingleFlight() if coalesce_requests else None
+        self.completion_broker = completion_broker
+        if completion_broker is not None and device_cache is not None:
+            completion_broker.add_device_cache(device_cache)
+
+        # Static headers are built once and sent with every request
+        headers = {
+            "Authorization": "Bearer " + self.api_key,
+            "Content-Type": "application/json",
+            "User-Agent": "Python SDK v" + get_sdk_version() + " (https://github.com/seamapi/python)",
+        }
+        if self.workspace_id is not None:
+            headers["seam-workspace"] = self.workspace_id
+
+        self.client = httpx.AsyncClient(
+            headers=headers,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+            # Match requests, which never times out unless asked to
+            timeout=None,
+        )
+
+        if self.should_report_exceptions:
+            # Imported here so clients without reporting skip its import cost
+            import sentry_sdk
+
+            self.sentry_client = sentry_sdk.Hub(sentry_sdk.Client(
+                dsn=get_sentry_dsn(),
+            ))
+            self.sentry_client.scope.set_context("sdk_info", {
+                "repository": "https://github.com/seamapi/python",
+                "version": get_sdk_version(),
+                "endpoint": self.api_url,
+            })
+
+    async def close(self):
+        """
+        Closes the underlying client and releases its pooled connections
+        """
+
+        await self.client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def _request(self, path: str, request: httpx.Request, stream: bool):
+        if self.rate_limiter is None:
+            return await self.client.send(request, stream=stream)
+        async with self.rate_limiter.acquire_async(path):
+            return await self.client.send(request, stream=stream)
+
+    async def _send(self, method: str, path: str, url: str, stream: bool, kwargs: dict):
+        retry_policy = self.retry_policy
+        if retry_policy is not None and retry_policy.timeout is not None:
+            kwargs.setdefault("timeout", retry_policy.timeout)
+        request = self.client.build_request(method, url, **kwargs)
+        if retry_policy is None:
+            return await self._request(path, request, stream)
+
+        deadline = retry_policy.deadline()
+        attempt = 1
+        while True:
+            try:
+                response = await self._request(path, request, stream)
+            except httpx.TransportError as error:
+                delay = retry_policy.next_delay(
+                    method, url, attempt, deadline, error=error
+                )
+                if delay is None:
+                    raise
+            else:
+                delay = retry_policy.next_delay(
+                    method,
+                    url,
+                    attempt,
+                    deadline,
+                    status_code=response.status_code,
+                    retry_after=response.headers.get("retry-after"),
+                )
+                if delay is None:
+                    return response
+                await response.aclose()
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def make_request(
+        self,
+        method: str,
+        path: str,
+        stream_items: Optional[str] = None,
+        **kwargs
+    ):
+        """
+        Makes a request to the API
+
+        Parameters
+        ----------
+        method : str
+          Request method
+        path : str
+          Request path
+        stream_items : str, optional
+          ijson prefix (e.g. "devices.item"). If set, the body is not
+          buffered; an async iterator over the items at that prefix is
+          returned instead, decoding each one as it arrives.
+        **kwargs
+          Keyword arguments passed to httpx.AsyncClient.request
+        """
+
+        url = self.api_url + path
+        if kwargs.get("json") is not None:
+            kwargs["content"] = self.json_codec.dumps(kwargs.pop("json"))
+
+        cache_key = None
+        if self.http_cache is not None and method == "GET" and stream_items is None:
+            cache_key = self.http_cache.key(
+                url,
+                kwargs.get("params"),
+                self.workspace_id,
+                self.client.headers.get("Authorization"),
+            )
+            validators = self.http_cache.validators(cache_key)
+            if validators:
+                kwargs["headers"] = {**(kwargs.get("headers") or {}), **validators}
+
+        if self.single_flight is not None and method == "GET" and stream_items is None:
+            # Concurrent identical GETs share one response, each caller
+            # decodes the body itself below
+            response = await self.single_flight.do(
+                (self.workspace_id, request_key(url, kwargs.get("params"))),
+                lambda: self._send(method, path, url, False, kwargs),
+            )
+        else:
+            response = await self._send(
+                method, path, url, stream_items is not None, kwargs
+            )
+
+        if self.should_report_exceptions and response.status_code:
+            # Add breadcrumb
+            self.sentry_client.add_breadcrumb(
+                category="http",
+                level="info",
+                data={
+                    "method": method,
+                    "url": url,
+                    "status_code": response.status_code,
+                    "request_id": response.headers.get("seam-request-id", "unknown"),
+                },
+            )
+
+        if response.status_code == 304 and cache_key is not None:
+            cached = self.http_cache.get(cache_key, self.json_codec.loads)
+            if cached is not MISSING:
+                return cached
+            # The entry was evicted after its validators were sent, so ask
+            # for the full body again
+            kwargs["headers"] = {
+                name: value
+                for name, value in (kwargs.get("headers") or {}).items()
+                if name not in validators
+            }
+            response = await self._send(method, path, url, False, kwargs)
+
+        if response.status_code != 200:
+            if stream_items is not None:
+                await response.aread()
+            raise SeamApiException(response)
+
+        if stream_items is not None:
+            return aiter_json_items(response, stream_items)
+
+        if "application/json" in response.headers["content-type"]:
+            if cache_key is not None:
+                return self.http_cache.store(
+                    cache_key,
+                    response.headers,
+                    response.content,
+                    self.json_codec.loads,
+                )
+            return self.json_codec.loads(response.content)
+
+        return response.text
@@ -0,0 +1,144 @@
+from seamapi.types import (
+    AbstractBulk,
+    AbstractSeam as Seam,
+    BulkResult,
+)
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+
+class Bulk(AbstractBulk):
+    """
+    A class used to run many operations concurrently on a bounded thread
+    pool, e.g. unlocking a list of doors
+
+    Every operation goes through the client's session, so rate limits,
+    retries and connection pooling still apply. A failing operation does
+    not stop the others; its exception is returned in its result.
+
+    ...
+
+    Attributes
+    ----------
+    seam : Seam
+        Initial seam class
+
+    Methods
+    -------
+    run(operations, max_workers=8, on_result=None)
+        Runs zero-argument callables concurrently
+    map(fn, items, max_workers=8, on_result=None, **kwargs)
+        Calls fn(item, **kwargs) for every item concurrently
+    """
+
+    seam: Seam
+
+    def __init__(self, seam: Seam):
+        """
+        Parameters
+        ----------
+        seam : Seam
+          Initial seam class
+        """
+
+        self.seam = seam
+
+    def run(
+        self,
+        operations: Sequence[Callable[[], Any]],
+        max_workers: int = 8,
+        on_result: Optional[Callable[[BulkResult], None]] = None,
+    ) -> List[BulkResult]:
+        """Runs operations concurrently and collects every outcome.
+
+        Parameters
+        ----------
+        operations : Sequence[Callable[[], Any]]
+            Zero-argument callables, e.g. functools.partial(seam.locks.unlock_door, device_id)
+        max_workers : int, optional
+            Maximum number of operations running at once. Defaults to 8.
+            Keep it at or below the client's pool_maxsize.
+        on_result : Callable[[BulkResult], None], optional
+            Called from the worker thread as each operation finishes. An
+            exception it raises is stored in the result's `callback_error`
+            and does not stop the run.
+
+        Returns
+        ------
+            A list of BulkResult in the order of `operations`, each with the
+            returned value or raised exception and the duration in seconds.
+        """
+
+        return self._run(
+            [(operation, operation) for operation in operations],
+            max_workers,
+            on_result,
+        )
+
+    def map(
+        self,
+        fn: Callable[..., Any],
+        items: Sequence[Any],
+        max_workers: int = 8,
+        on_result: Optional[Callable[[BulkResult], None]] = None,
+        **kwargs: Any,
+    ) -> List[BulkResult]:
+        """Calls fn(item, **kwargs) for every item concurrently.
+
+        Parameters
+        ----------
+        fn : Callable
+            Route method to call, e.g. seam.locks.unlock_door
+        items : Sequence[Any]
+            First argument of each call, e.g. device ids
+        max_workers : int, optional
+            Maximum number of calls running at once. Defaults to 8.
+        on_result : Callable[[BulkResult], None], optional
+            Called from the worker thread as each call finishes. Exceptions
+            it raises are stored in `callback_error`.
+        **kwargs
+            Keyword arguments passed to every call
+
+        Returns
+        ------
+            A list of BulkResult in the order of `items`, with `item` set to
+            the corresponding item.
+        """
+
+        return self._run(
+            [(item, partial(fn, item, **kwargs)) for item in items],
+            max_workers,
+            on_result,
+        )
+
+    def _run(
+        self,
+        calls: Sequence[Tuple[Any, Callable[[], Any]]],
+        max_workers: int,
+        on_result: Optional[Callable[[BulkResult], None]],
+    ) -> List[BulkResult]:
+        def call(index: int, item: Any, operation: Callable[[], Any]) -> BulkResult:
+            result = BulkResult(index=index, item=item)
+            start = time.perf_counter()
+            try:
+                result.value = operation()
+            except Exception as error:
+                result.error = error
+            result.duration = time.perf_counter() - start
+            if on_result is not None:
+                try:
+                    on_result(result)
+                except Exception as error:
+                    result.callback_error = error
+            return result
+
+        if not calls:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as executor:
+            futures = [
+                executor.submit(call, index, item, operation)
+                for index, (item, operation) in enumerate(calls)
+            ]
+            return [future.result() for future in futures]
@@ -1,3 +1,4 @@
+import copy
 from seamapi.types import (
     AbstractDevices,
     AbstractUnmanagedDevices,
@@ -7,15 +8,24 @@ from seamapi.types import (
     ConnectedAccountId,
     Device,
     DeviceId,
+    DevicesNotFoundException,
     UnmanagedDevice,
     AbstractSeam as Seam,
     DeviceType,
 )
-from typing import Any, List, Union, Optional, Dict
+from typing import Any, Iterator, List, Sequence, Union, Optional, Dict
+from seamapi.utils.batcher import Batcher
+from seamapi.utils.columns import DEVICE_COLUMNS, to_columns
+from seamapi.utils.paginate import CreatedBeforeCursor, chunks
 from seamapi.utils.parse_list_device_params import parse_list_device_params
 from seamapi.utils.convert_to_id import (
     to_device_id,
 )
+from seamapi.utils.device_cache import (
+    cache_devices,
+    get_cached_device,
+    invalidate_device,
+)
 from seamapi.utils.report_error import report_error
 
 
@@ -35,8 +45,14 @@ class Devices(AbstractDevices):
     -------
     list(connected_account=None, connected_accounts=None, connect_webview=None, device_type=None, device_ids=None, manufacturer=None)
         Gets a list of devices
+    iter_list(connected_account=None, connected_accounts=None, connect_webview=None, device_type=None, device_ids=None, manufacturer=None, created_before=None, page_size=100)
+        Iterates over devices page by page
+    list_columns(connected_account=None, connected_accounts=None, connect_webview=None, device_type=None, device_ids=None, manufacturer=None, columns=DEVICE_COLUMNS)
+        Gets a list of devices as columns
     get(device=None, name=None)
         Gets a device
+    get_many(devices, batch_size=100, raise_if_missing=True)
+        Gets several devices through batched list requests
     update(device, name=None, properties=None, location=None)
         Updates a device
     list_device_providers(provider_category=None):
@@ -54,6 +70,15 @@ class Devices(AbstractDevices):
         """
 
         self.seam = seam
+        self._batcher = (
+            Batcher(
+                self._get_by_ids,
+                window=seam.device_get_batch_window,
+                copy_value=copy.deepcopy,
+            )
+            if seam.device_get_batch_window is not None
+            else None
+        )
         self.unmanaged = UnmanagedDevices(seam)
 
     @report_error
@@ -116,14 +141,168 @@ class Devices(AbstractDevices):
             created_before,
         )
 
+        if self.seam.stream_list_responses:
+            devices = self.seam.make_request(
+                "GET",
+                "/devices/list",
+                params=params,
+                stream_items="devices.item",
+            )
+            devices = [Device.from_dict(d) for d in devices]
+            cache_devices(self.seam, devices)
+            return devices
+
         res = self.seam.make_request(
             "GET",
             "/devices/list",
             params=params,
         )
-        devices = res["devices"]
+        devices = [Device.from_dict(d) for d in res["devices"]]
+        cache_devices(self.seam, devices)
+
+        return devices
+
+    def iter_list(
+        self,
+        connected_account: Union[ConnectedAccountId, ConnectedAccount] = None,
+        connected_accounts: List[
+            Union[ConnectedAccountId, ConnectedAccount]
+        ] = None,
+        connect_webview: Union[ConnectWebviewId, ConnectWebview] = None,
+        device_type: Optional[DeviceType] = None,
+        device_types: Optional[List[DeviceType]] = None,
+        device_ids: Optional[List[Union[DeviceId, Device]]] = None,
+        manufacturer: Optional[str] = None,
+        created_before: Optional[str] = None,
+        page_size: int = 100,
+    ) -> Iterator[Device]:
+        """Iterates over devices, fetching one page at a time.
+
+        Pages are requested newest first by walking `created_before`, so only
+        one page is held in memory and the first devices arrive before the
+        last page is fetched.
+
+        Parameters
+        ----------
+        connected_account : ConnectedAccountId or ConnectedAccount, optional
+            Connected account id or ConnectedAccount to get devices associated with
+        connected_accounts : ConnectedAccountId(s) or ConnectedAccount(s), optional
+            Connected account ids or ConnectedAccount(s) to get devices associated with
+        connect_webview : ConnectWebviewId or ConnectWebview, optional
+            Connect webview id or ConnectWebview to get devices associated with
+        device_type : DeviceType, optional
+            Device type e.g. august_lock
+        device_types : List[DeviceType], optional
+            List of device types e.g. august_lock
+        device_ids : List[Union[DeviceId, Device]], optional
+            Device IDs to filter devices by
+        manufacturer : str, optional
+            Manufacturer name to filter devices by e.g. august, schlage
+        created_before : str, optional
+            If specified, only devices created before this date will be returned
+        page_size : int, optional
+            Number of devices fetched per request. Defaults to 100.
+
+        Raises
+        ------
+        Exception
+            If the API request wasn't successful.
+
+        Yields
+        ------
+            Device
+        """
 
-        return [Device.from_dict(d) for d in devices]
+        cursor = CreatedBeforeCursor(page_size, "device_id", created_before)
+        while not cursor.done:
+            page = self.list(
+                connected_account=connected_account,
+                connected_accounts=connected_accounts,
+                connect_webview=connect_webview,
+                device_type=device_type,
+                device_types=device_types,
+                device_ids=device_ids,
+                manufacturer=manufacturer,
+                limit=page_size,
+                created_before=cursor.created_before,
+            )
+            yield from cursor.advance(page)
+
+    @report_error
+    def list_columns(
+        self,
+        connected_account: Union[ConnectedAccountId, ConnectedAccount] = None,
+        connected_accounts: List[
+            Union[ConnectedAccountId, ConnectedAccount]
+        ] = None,
+        connect_webview: Union[ConnectWebviewId, ConnectWebview] = None,
+        device_type: Optional[DeviceType] = None,
+        device_types: Optional[List[DeviceType]] = None,
+        device_ids: Optional[List[Union[DeviceId, Device]]] = None,
+        manufacturer: Optional[str] = None,
+        limit: Optional[float] = None,
+        created_before: Optional[str] = None,
+        columns: Sequence[str] = DEVICE_COLUMNS,
+    ) -> Dict[str, List[Any]]:
+        """Gets a list of devices as columns instead of Device objects.
+
+        Values are read straight from the response, so no per-device objects
+        are built. Pass the result to `seamapi.utils.columns.as_table` for a
+        pyarrow.Table.
+
+        Parameters
+        ----------
+        connected_account : ConnectedAccountId or ConnectedAccount, optional
+            Connected account id or ConnectedAccount to get devices associated with
+        connected_accounts : ConnectedAccountId(s) or ConnectedAccount(s), optional
+            Connected account ids or ConnectedAccount(s) to get devices associated with
+        connect_webview : ConnectWebviewId or ConnectWebview, optional
+            Connect webview id or ConnectWebview to get devices associated with
+        device_type : DeviceType, optional
+            Device type e.g. august_lock
+        device_types : List[DeviceType], optional
+            List of device types e.g. august_lock
+        device_ids : Optional[List[Union[DeviceId, Device]]]
+            Device IDs to filter devices by
+        manufacturer : Optional[str]
+            Manufacturer name to filter devices by e.g. august, schlage
+        limit : str, optional
+            Limit the number of devices returned
+        created_before : str, optional
+            If specified, only devices created before this date will be returned
+        columns : Sequence[str], optional
+            Dotted paths to extract, e.g. "properties.online". Defaults to
+            DEVICE_COLUMNS.
+
+        Raises
+        ------
+        Exception
+            If the API request wasn't successful.
+
+        Returns
+        ------
+            A dict mapping each column to a list with one value per device.
+        """
+
+        params = parse_list_device_params(
+            connected_account,
+            connected_accounts,
+            connect_webview,
+            device_type,
+            device_types,
+            device_ids,
+            manufacturer,
+            limit,
+            created_before,
+        )
+
+        res = self.seam.make_request(
+            "GET",
+            "/devices/list",
+            params=params,
+        )
+
+        return to_columns(res["devices"], columns)
 
     @report_error
     def get(
@@ -150,6 +329,17 @@ class Devices(AbstractDevices):
             Device
         """
 
+        cached_device = get_cached_device(self.seam, device, name)
+        if cached_device is not None:
+            return cached_device
+
+        if self._batcher is not None and device and not name:
+            device_id = to_device_id(device)
+            batched_device = self._batcher.get(device_id)
+            if batched_device is None:
+                raise DevicesNotFoundException([device_id])
+            return batched_device
+
         params = {}
         if device:
             params["device_id"] = to_device_id(device)
@@ -157,7 +347,69 @@ class Devices(AbstractDevices):
             params["name"] = name
         res = self.seam.make_request("GET", "/devices/get", params=params)
         json_device = res["device"]
-        return Device.from_dict(json_device)
+        fetched_device = Device.from_dict(json_device)
+        cache_devices(self.seam, [fetched_device])
+        return fetched_device
+
+    @report_error
+    def get_many(
+        self,
+        devices: Sequence[Union[DeviceId, Device]],
+        batch_size: int = 100,
+        raise_if_missing: bool = True,
+    ) -> List[Optional[Device]]:
+        """Gets several devices with as few requests as possible.
+
+        Devices are fetched through /devices/list in chunks of `batch_size`
+        ids, and devices already in the device cache are not requested.
+
+        Parameters
+        ----------
+        devices : Sequence[Union[DeviceId, Device]]
+            Device ids or Devices to get
+        batch_size : int, optional
+            Number of device ids per request. Defaults to 100.
+        raise_if_missing : bool, optional
+            Defaults to True. If false, devices that were not found are
+            returned as None instead of raising.
+
+        Raises
+        ------
+        DevicesNotFoundException
+            If some devices were not found and raise_if_missing is true.
+        Exception
+            If the API request wasn't successful.
+
+        Returns
+        ------
+            A list of devices in the order of `devices`.
+        """
+
+        device_ids = [to_device_id(d) for d in devices]
+        found = self._get_by_ids(device_ids, batch_size)
+
+        missing = [i for i in dict.fromkeys(device_ids) if i not in found]
+        if missing and raise_if_missing:
+            raise DevicesNotFoundException(missing)
+
+        return [found.get(i) for i in device_ids]
+
+    def _get_by_ids(
+        self, device_ids: List[DeviceId], batch_size: int = 100
+    ) -> Dict[DeviceId, Device]:
+        found = {}
+        pending = []
+        for device_id in dict.fromkeys(device_ids):
+            cached_device = get_cached_device(self.seam, device_id)
+            if cached_device is not None:
+                found[device_id] = cached_device
+            else:
+                pending.append(device_id)
+
+        for chunk in chunks(pending, batch_size):
+            for device in self.list(device_ids=chunk):
+                found[device.device_id] = device
+        return found
 
     @report_error
     def update(
@@ -213,6 +465,7 @@ class Devices(AbstractDevices):
             "/devices/update",
             json=update_payload,
         )
+        invalidate_device(self.seam, device)
 
         return True
 
@@ -244,6 +497,7 @@ class Devices(AbstractDevices):
             "/devices/delete",
             json=delete_payload,
         )
+        invalidate_device(self.seam, device)
 
         return True
 
@@ -299,6 +553,8 @@ class UnmanagedDevices(AbstractUnmanagedDevices):
         Gets an unmanaged device
     list(connected_account=None, connected_accounts=None, connect_webview=None, device_type=None, device_ids=None, manufacturer=None)
         Gets a list of unmanaged devices
+    iter_list(connected_account=None, connected_accounts=None, connect_webview=None, device_type=None, device_ids=None, manufacturer=None, created_before=None, page_size=100)
+        Iterates over unmanaged devices page by page
     update(device, is_managed)
         Updates an unmanaged device
     """
@@ -416,6 +672,15 @@ class UnmanagedDevices(AbstractUnmanagedDevices):
             created_before,
         )
 
+        if self.seam.stream_list_responses:
+            devices = self.seam.make_request(
+                "GET",
+                "/devices/unmanaged/list",
+                params=params,
+                stream_items="devices.item",
+            )
+            return [UnmanagedDevice.from_dict(d) for d in devices]
+
         res = self.seam.make_request(
             "GET",
             "/devices/unmanaged/list",
@@ -425,6 +690,72 @@ class UnmanagedDevices(AbstractUnmanagedDevices):
 
         return [UnmanagedDevice.from_dict(d) for d in devices]
 
+    def iter_list(
+        self,
+        connected_account: Union[ConnectedAccountId, ConnectedAccount] = None,
+        connected_accounts: List[
+            Union[ConnectedAccountId, ConnectedAccount]
+        ] = None,
+        connect_webview: Union[ConnectWebviewId, ConnectWebview] = None,
+        device_type: Optional[DeviceType] = None,
+        device_types: Optional[List[DeviceType]] = None,
+        device_ids: Optional[List[Union[DeviceId, Device]]] = None,
+        manufacturer: Optional[str] = None,
+        created_before: Optional[str] = None,
+        page_size: int = 100,
+    ) -> Iterator[UnmanagedDevice]:
+        """Iterates over unmanaged devices, fetching one page at a time.
+
+        Pages are requested newest first by walking `created_before`, so only
+        one page is held in memory and the first unmanaged devices arrive before the
+        last page is fetched.
+
+        Parameters
+        ----------
+        connected_account : ConnectedAccountId or ConnectedAccount, optional
+            Connected account id or ConnectedAccount to get devices associated with
+        connected_accounts : ConnectedAccountId(s) or ConnectedAccount(s), optional
+            Connected account ids or ConnectedAccount(s) to get devices associated with
+        connect_webview : ConnectWebviewId or ConnectWebview, optional
+            Connect webview id or ConnectWebview to get devices associated with
+        device_type : DeviceType, optional
+            Device type e.g. august_lock
+        device_types : List[DeviceType], optional
+            List of device types e.g. august_lock
+        device_ids : List[Union[DeviceId, Device]], optional
+            Device IDs to filter devices by
+        manufacturer : str, optional
+            Manufacturer name to filter devices by e.g. august, schlage
+        created_before : str, optional
+            If specified, only devices created before this date will be returned
+        page_size : int, optional
+            Number of devices fetched per request. Defaults to 100.
+
+        Raises
+        ------
+        Exception
+            If the API request wasn't successful.
+
+        Yields
+        ------
+            UnmanagedDevice
+        """
+
+        cursor = CreatedBeforeCursor(page_size, "device_id", created_before)
+        while not cursor.done:
+            page = self.list(
+                connected_account=connected_account,
+                connected_accounts=connected_accounts,
+                connect_webview=connect_webview,
+                device_type=device_type,
+                device_types=device_types,
+                device_ids=device_ids,
+                manufacturer=manufacturer,
+                limit=page_size,
+                created_before=cursor.created_before,
+            )
+            yield from cursor.advance(page)
+
     @report_error
     def update(
         self,
@@ -461,5 +792,6 @@ class UnmanagedDevices(AbstractUnmanagedDevices):
                 "is_managed": is_managed,
             },
         )
+        invalidate_device(self.seam, device)
 
         return True
@@ -6,7 +6,9 @@ from seamapi.types import (
     AbstractEvents,
     AbstractSeam as Seam,
 )
-from typing import List, Optional, Union
+from datetime import datetime, timedelta, timezone
+from typing import Iterator, List, Optional, Sequence, Union
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 import requests
 from seamapi.utils.convert_to_id import (
     to_access_code_id,
@@ -14,7 +16,14 @@ from seamapi.utils.convert_to_id import (
     to_device_id,
     to_event_id,
 )
+from seamapi.utils.paginate import (
+    TimeShards,
+    format_timestamp,
+    parse_timestamp,
+    time_windows,
+)
 
+from seamapi.utils.device_cache import invalidate_event_devices
 from seamapi.utils.report_error import report_error
 
 
@@ -31,10 +40,16 @@ class Events(AbstractEvents):
 
     Methods
     -------
-    list(since=None, between=None, device_id=None, device_ids=None, access_code_id=None, access_code_ids=None, event_type=None, event_types=None, connected_account_id=None)
+    list(since=None, between=None, device_id=None, device_ids=None, access_code_id=None, access_code_ids=None, event_type=None, event_types=None, connected_account_id=None, fields=None)
         Gets a list of events
 
-    get(device_id=None, event_id=None, event_type=None)
+    iter_list(since, until=None, window=timedelta(hours=1), page_limit=500, min_window=timedelta(seconds=1), device_id=None, device_ids=None, access_code_id=None, access_code_ids=None, event_type=None, event_types=None, connected_account_id=None, fields=None)
+        Iterates over events one time window at a time
+
+    backfill(start, end=None, shards=8, max_workers=8, page_limit=500, min_shard=timedelta(seconds=1), device_id=None, device_ids=None, access_code_id=None, access_code_ids=None, event_type=None, event_types=None, connected_account_id=None, fields=None)
+        Fetches a long time range as concurrent, adaptively split shards
+
+    get(device_id=None, event_id=None, event_type=None, fields=None)
         Gets an event
     """
 
@@ -61,6 +76,7 @@ class Events(AbstractEvents):
         event_type: Optional[str] = None,
         event_types: Optional[list] = None,
         connected_account_id: Union[str, ConnectedAccount] = None,
+        fields: Optional[Sequence[str]] = None,
     ) -> List[Event]:
         """Gets a list of events.
 
@@ -84,6 +100,9 @@ class Events(AbstractEvents):
             Event types to filter events by
         connected_account_id : Union[str, ConnectedAccount]
             Connected Account ID or ConnectedAccount to filter events by
+        fields : Optional[Sequence[str]]
+            Payload fields to keep besides the Event attributes. Defaults to
+            all. Projecting lets the rest of each event be freed.
 
         Raises
         ------
@@ -121,13 +140,220 @@ class Events(AbstractEvents):
             if arguments[name]:
                 params.update({name: arguments[name]})
 
+        if self.seam.stream_list_responses:
+            events = self.seam.make_request(
+                "GET",
+                "/events/list",
+                params=params,
+                stream_items="events.item",
+            )
+            events = [Event.from_dict(e, fields) for e in events]
+            invalidate_event_devices(self.seam, events)
+            return events
+
         res = self.seam.make_request(
             "GET",
             "/events/list",
             params=params,
         )
+        events = [Event.from_dict(e, fields) for e in res["events"]]
+        invalidate_event_devices(self.seam, events)
+
+        return events
+
+    def iter_list(
+        self,
+        since: str,
+        until: Optional[str] = None,
+        window: timedelta = timedelta(hours=1),
+        page_limit: int = 500,
+        min_window: timedelta = timedelta(seconds=1),
+        device_id: Union[str, Device] = None,
+        device_ids: Optional[list] = None,
+        access_code_id: Union[str, AccessCode] = None,
+        access_code_ids: Optional[list] = None,
+        event_type: Optional[str] = None,
+        event_types: Optional[list] = None,
+        connected_account_id: Union[str, ConnectedAccount] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Iterator[Event]:
+        """Iterates over events, fetching one time window at a time.
+
+        The range from `since` to `until` is split into consecutive windows,
+        each fetched with `between`, so only one window of events is held in
+        memory. Like in `backfill`, a window that returns `page_limit` events
+        is treated as truncated and fetched again as two halves. Events on a
+        window edge are yielded once.
+
+        Parameters
+        ----------
+        since : str
+            ISO 8601 timestamp of the earliest event to return
+        until : Optional[str]
+            ISO 8601 timestamp of the latest event to return. Defaults to now.
+        window : timedelta
+            Length of the time range fetched per request. Defaults to one hour.
+        page_limit : int
+            Number of events per response at which a window is treated as
+            truncated and split in two. Set it to the server's page size.
+            Defaults to 500.
+        min_window : timedelta
+            Windows shorter than this are not split further. Defaults to one second.
+        device_id : Union[str, Device]
+            Device ID or Device to filter events by
+        device_ids : Optional[list]
+            Device IDs to filter events by
+        access_code_id : Union[str, AccessCode]
+            Access Code ID or AccessCode to filter events by
+        access_code_ids : Optional[list]
+            Access Code IDs to filter events by
+        event_type : Optional[str]
+            Event type to filter events by
+        event_types : Optional[list]
+            Event types to filter events by
+        connected_account_id : Union[str, ConnectedAccount]
+            Connected Account ID or ConnectedAccount to filter events by
+        fields : Optional[Sequence[str]]
+            Payload fields to keep besides the Event attributes. Defaults to
+            all. Projecting lets the rest of each event be freed.
+
+        Raises
+        ------
+        Exception
+            If the API request wasn't successful.
+
+        Yields
+        ------
+            Event
+        """
+        previous_ids = set()
+        for start, end in time_windows(since, until, window):
+            windows = TimeShards(
+                parse_timestamp(start),
+                parse_timestamp(end),
+                1,
+                page_limit,
+                min_window,
+                previous_ids=previous_ids,
+            )
+            while not windows.done:
+                shard = windows.pending[0]
+                events = self.list(
+                    between=[format_timestamp(shard[0]), format_timestamp(shard[1])],
+                    device_id=device_id,
+                    device_ids=device_ids,
+                    access_code_id=access_code_id,
+                    access_code_ids=access_code_ids,
+                    event_type=event_type,
+                    event_types=event_types,
+                    connected_account_id=connected_account_id,
+                    fields=fields,
+                )
+                windows.complete(shard, events)
+                yield from windows.ready()
+            previous_ids = windows.previous_ids
+
+    def backfill(
+        self,
+        start: str,
+        end: Optional[str] = None,
+        shards: int = 8,
+        max_workers: int = 8,
+        page_limit: int = 500,
+        min_shard: timedelta = timedelta(seconds=1),
+        device_id: Union[str, Device] = None,
+        device_ids: Optional[list] = None,
+        access_code_id: Union[str, AccessCode] = None,
+        access_code_ids: Optional[list] = None,
+        event_type: Optional[str] = None,
+        event_types: Optional[list] = None,
+        connected_account_id: Union[str, ConnectedAccount] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Iterator[Event]:
+        """Fetches a long time range as concurrent shards of `between` requests.
+
+        The range is split into `shards` equal parts fetched on a pool of `max_workers` threads. Shards
+        that hit `page_limit` are split in two and fetched again, so busy
+        periods end up in narrower shards. Events are yielded in
+        `created_at` order as soon as every earlier shard is done, without
+        the duplicates returned on shard edges.
+
+        Parameters
+        ----------
+        start : str
+            ISO 8601 timestamp of the earliest event to return
+        end : Optional[str]
+            ISO 8601 timestamp of the latest event to return. Defaults to now.
+        shards : int
+            Number of equal time shards the range starts split into. Defaults to 8.
+        max_workers : int
+            Maximum number of shards fetched at once. Defaults to 8.
+        page_limit : int
+            Number of events per response at which a shard is treated as
+            truncated and split in two. Set it to the server's page size.
+            Defaults to 500.
+        min_shard : timedelta
+            Shards shorter than this are not split further. Defaults to one second.
+        device_id : Union[str, Device]
+            Device ID or Device to filter events by
+        device_ids : Optional[list]
+            Device IDs to filter events by
+        access_code_id : Union[str, AccessCode]
+            Access Code ID or AccessCode to filter events by
+        access_code_ids : Optional[list]
+            Access Code IDs to filter events by
+        event_type : Optional[str]
+            Event type to filter events by
+        event_types : Optional[list]
+            Event types to filter events by
+        connected_account_id : Union[str, ConnectedAccount]
+            Connected Account ID or ConnectedAccount to filter events by
+        fields : Optional[Sequence[str]]
+            Payload fields to keep besides the Event attributes. Defaults to all.
+
+        Raises
+        ------
+        Exception
+            If the API request wasn't successful.
+
+        Yields
+        ------
+            Event, in `created_at` order
+        """
+
+        end_at = datetime.now(timezone.utc) if end is None else parse_timestamp(end)
+        time_shards = TimeShards(
+            parse_timestamp(start), end_at, shards, page_limit, min_shard
+        )
+
+        def fetch(shard):
+            return self.list(
+                between=[format_timestamp(shard[0]), format_timestamp(shard[1])],
+                device_id=device_id,
+                device_ids=device_ids,
+                access_code_id=access_code_id,
+                access_code_ids=access_code_ids,
+                event_type=event_type,
+                event_types=event_types,
+                connected_account_id=connected_account_id,
+                fields=fields,
+            )
 
-        return res["events"]
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            in_flight = {
+                pool.submit(fetch, shard): shard for shard in time_shards.pending
+            }
+            try:
+                while not time_shards.done:
+                    finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        shard = in_flight.pop(future)
+                        for retry in time_shards.complete(shard, future.result()):
+                            in_flight[pool.submit(fetch, retry)] = retry
+                    yield from time_shards.ready()
+            finally:
+                for future in in_flight:
+                    future.cancel()
 
     @report_error
     def get(
@@ -135,7 +361,8 @@ class Events(AbstractEvents):
         event_id: Union[str, Event] = None,
         event_type: Optional[str] = None,
         device_id: Union[str, Device] = None,
-    ) -> Event:
+        fields: Optional[Sequence[str]] = None,
+    ) -> Optional[Event]:
         """Get an Event.
 
         Parameters
@@ -146,6 +373,8 @@ class Events(AbstractEvents):
                 Event type to filter events by
             device_id : Union[str, Device]
                 Device ID or Device to filter events by
+            fields : Optional[Sequence[str]]
+                Payload fields to keep besides the Event attributes. Defaults to all.
 
         Raises
         ------
@@ -176,4 +405,7 @@ class Events(AbstractEvents):
             params=params,
         )
 
-        return res.get("event", None)
+        event = res.get("event", None)
+        if event is None:
+            return None
+        return Event.from_dict(event, fields)
@@ -17,6 +17,12 @@ from seamapi.utils.convert_to_id import (
     to_connected_account_id,
     to_device_id,
 )
+from seamapi.utils.device_cache import (
+    cache_devices,
+    get_cached_device,
+    invalidate_device,
+    poll_until_ready_and_invalidate,
+)
 from seamapi.utils.report_error import report_error
 
 
@@ -38,9 +44,9 @@ class Locks(AbstractLocks):
         Gets a list of locks
     get(device=None, name=None)
         Gets a lock
-    lock_door(device)
+    lock_door(device, wait_for_action_attempt=True)
         Locks a lock
-    unlock_door(device)
+    unlock_door(device, wait_for_action_attempt=True)
         Unlocks a lock
     """
 
@@ -129,6 +135,10 @@ class Locks(AbstractLocks):
             A lock dict.
         """
 
+        cached_device = get_cached_device(self.seam, device, name)
+        if cached_device is not None:
+            return cached_device
+
         params = {}
         if device:
             params["device_id"] = to_device_id(device)
@@ -142,16 +152,24 @@ class Locks(AbstractLocks):
         )
         json_lock = res["device"]
 
-        return Device.from_dict(json_lock)
+        fetched_device = Device.from_dict(json_lock)
+        cache_devices(self.seam, [fetched_device])
+        return fetched_device
 
     @report_error
-    def lock_door(self, device: Union[DeviceId, Device]) -> ActionAttempt:
+    def lock_door(
+        self,
+        device: Union[DeviceId, Device],
+        wait_for_action_attempt: Optional[bool] = True,
+    ) -> ActionAttempt:
         """Locks a lock.
 
         Parameters
         ----------
         device : DeviceId or Device
             Device id or Device to be locked
+        wait_for_action_attempt: bool, optional
+            Should wait for action attempt to resolve
 
         Raises
         ------
@@ -169,19 +187,30 @@ class Locks(AbstractLocks):
             "/locks/lock_door",
             json={"device_id": device_id},
         )
+        action_attempt = res["action_attempt"]
+        invalidate_device(self.seam, device_id)
 
-        return self.seam.action_attempts.poll_until_ready(
-            res["action_attempt"]["action_attempt_id"]
+        if not wait_for_action_attempt:
+            return ActionAttempt.from_dict(action_attempt)
+
+        return poll_until_ready_and_invalidate(
+            self.seam, action_attempt["action_attempt_id"], device_id
         )
 
     @report_error
-    def unlock_door(self, device: Union[DeviceId, Device]) -> ActionAttempt:
+    def unlock_door(
+        self,
+        device: Union[DeviceId, Device],
+        wait_for_action_attempt: Optional[bool] = True,
+    ) -> ActionAttempt:
         """Unlocks a lock.
 
         Parameters
         ----------
         device : DeviceId or Device
             Device id or Device to be locked
+        wait_for_action_attempt: bool, optional
+            Should wait for action attempt to resolve
 
         Raises
         ------
@@ -199,7 +228,12 @@ class Locks(AbstractLocks):
             "/locks/unlock_door",
             json={"device_id": device_id},
         )
+        action_attempt = res["action_attempt"]
+        invalidate_device(self.seam, device_id)
+
+        if not wait_for_action_attempt:
+            return ActionAttempt.from_dict(action_attempt)
 
-        return self.seam.action_attempts.poll_until_ready(
-            res["action_attempt"]["action_attempt_id"]
+        return poll_until_ready_and_invalidate(
+            self.seam, action_attempt["action_attempt_id"], device_id
         )
@@ -1,29 +1,46 @@
-from .noise_sensors import NoiseSensors
+import importlib
+from typing import Any
 from .types import AbstractRoutes
-from .workspaces import Workspaces
-from .devices import Devices, UnmanagedDevices
-from .events import Events
-from .connected_accounts import ConnectedAccounts
-from .connect_webviews import ConnectWebviews
-from .locks import Locks
-from .access_codes import AccessCodes
-from .action_attempts import ActionAttempts
-from .thermostats import Thermostats
-from .webhooks import Webhooks
+
+
+class LazyRoute:
+    """
+    Descriptor that imports and builds a route class the first time it is
+    accessed, then caches the instance on the owning client so later lookups
+    are plain attribute reads.
+    """
+
+    def __init__(self, module: str, class_name: str):
+        self.module = module
+        self.class_name = class_name
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None) -> Any:
+        if instance is None:
+            return self
+        route_class = getattr(
+            importlib.import_module(self.module), self.class_name
+        )
+        route = route_class(seam=instance)
+        instance.__dict__[self.name] = route
+        return route
+
 
 class Routes(AbstractRoutes):
-    def __init__(self):
-      self.workspaces = Workspaces(seam=self)
-      self.connected_accounts = ConnectedAccounts(seam=self)
-      self.connect_webviews = ConnectWebviews(seam=self)
-      self.devices = Devices(seam=self)
-      self.events = Events(seam=self)
-      self.locks = Locks(seam=self)
-      self.access_codes = AccessCodes(seam=self)
-      self.action_attempts = ActionAttempts(seam=self)
-      self.noise_sensors = NoiseSensors(seam=self)
-      self.thermostats = Thermostats(seam=self)
-      self.webhooks = Webhooks(seam=self)
+    workspaces = LazyRoute("seamapi.workspaces", "Workspaces")
+    connected_accounts = LazyRoute("seamapi.connected_accounts", "ConnectedAccounts")
+    connect_webviews = LazyRoute("seamapi.connect_webviews", "ConnectWebviews")
+    devices = LazyRoute("seamapi.devices", "Devices")
+    events = LazyRoute("seamapi.events", "Events")
+    locks = LazyRoute("seamapi.locks", "Locks")
+    access_codes = LazyRoute("seamapi.access_codes", "AccessCodes")
+    action_attempts = LazyRoute("seamapi.action_attempts", "ActionAttempts")
+    noise_sensors = LazyRoute("seamapi.noise_sensors", "NoiseSensors")
+    thermostats = LazyRoute("seamapi.thermostats", "Thermostats")
+    webhooks = LazyRoute("seamapi.webhooks", "Webhooks")
+    bulk = LazyRoute("seamapi.bulk", "Bulk")
 
     def make_request(self):
       raise NotImplementedError()
@@ -1,15 +1,24 @@
 import os
+import time
 
 from seamapi.utils.get_sentry_dsn import get_sentry_dsn
+from seamapi.utils.get_sdk_version import get_sdk_version
+from seamapi.utils.http_cache import MISSING, HttpCache, request_key
+from seamapi.utils.completion_broker import CompletionBroker
+from seamapi.utils.device_cache import DeviceCache
+from seamapi.utils.json_codec import JsonCodec, get_default_json_codec
+from seamapi.utils.rate_limit import RateLimiter
+from seamapi.utils.retry import RetryPolicy
+from seamapi.utils.single_flight import SingleFlight
+from seamapi.utils.stream_json import iter_json_items, require_ijson
 from .routes import Routes
 import requests
-import sentry_sdk
-import pkg_resources
+from requests.adapters import HTTPAdapter
 from typing import Optional, cast
 from .types import AbstractSeam, SeamApiException
 
 
-class Seam(AbstractSeam):
+class Seam(Routes, AbstractSeam):
     """
     Initial Seam class used to interact with Seam API
 
@@ -37,10 +46,27 @@ class Seam(AbstractSeam):
         Access codes class
     action_attempts : ActionAttempts
         Action attempts class
+    bulk : Bulk
+        Concurrent executor for multi-device operations
+    session : requests.Session
+        Connection-pooled session reused by every request
+    device_cache : DeviceCache or None
+        Opt-in device cache used by the device, lock and thermostat routes
+    http_cache : HttpCache or None
+        Opt-in validator cache for conditional GET requests
+    retry_policy : RetryPolicy or None
+        Opt-in retry policy applied to every request
+    rate_limiter : RateLimiter or None
+        Opt-in client-side rate and concurrency limits
+    single_flight : SingleFlight or None
+        Coalesces identical in-flight GET requests when enabled
+    completion_broker : CompletionBroker or None
+        Opt-in webhook receiver that wakes action attempt waiters
     """
 
     api_key: str
     api_url: str = "https://connect.getseam.com"
+    session: requests.Session
 
     def __init__(
         self,
@@ -48,6 +74,17 @@ class Seam(AbstractSeam):
         workspace_id: Optional[str] = None,
         api_url: Optional[str] = None,
         should_report_exceptions: Optional[bool] = False,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        stream_list_responses: bool = False,
+        json_codec: Optional[JsonCodec] = None,
+        device_cache: Optional[DeviceCache] = None,
+        http_cache: Optional[HttpCache] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalesce_requests: bool = False,
+        device_get_batch_window: Optional[float] = None,
+        completion_broker: Optional[CompletionBroker] = None,
     ):
         """
         Parameters
@@ -60,9 +97,51 @@ class Seam(AbstractSeam):
           API url
         should_report_exceptions : bool, optional
           Defaults to False. If true, thrown exceptions will be reported to Seam.
+        pool_connections : int, optional
+          Number of host connection pools to cache. Defaults to 10.
+        pool_maxsize : int, optional
+          Maximum number of keep-alive connections kept open per host.
+          Defaults to 10. Raise this when sharing one instance across
+          many threads.
+        stream_list_responses : bool, optional
+          Defaults to False. If true, large list responses (devices, events)
+          are decoded incrementally and each model is built as soon as its
+          array element is parsed. Requires ijson.
+        json_codec : JsonCodec, optional
+          Codec used to encode payloads and decode responses. Defaults to
+          orjson when it is installed, otherwise the standard library json.
+        device_cache : DeviceCache, optional
+          Defaults to None. If given, devices fetched through the device,
+          lock and thermostat routes are cached and reads are served from it
+          until they expire or a write or event invalidates them. Events
+          are those listed through the events routes and, when a
+          completion_broker is given too, webhook deliveries it receives.
+        http_cache : HttpCache, optional
+          Defaults to None. If given, GET requests are made conditional with
+          the validators of the previous response, and a 304 reply is
+          served from the previously received body.
+        retry_policy : RetryPolicy, optional
+          Defaults to None (no retries). If given, failed requests are
+          retried according to the policy.
+        rate_limiter : RateLimiter, optional
+          Defaults to None. If given, every request (including retries)
+          waits for the rate and in-flight limits of its endpoint family.
+          Share one limiter between clients to enforce a common quota.
+        coalesce_requests : bool, optional
+          Defaults to False. If true, identical GET requests made while one
+          is already in flight share its response, and each caller still
+          decodes its own copy of the body.
+        device_get_batch_window : float, optional
+          Defaults to None. If set, concurrent devices.get calls by id made
+          within this many seconds of each other are combined into one
+          /devices/list request. Callers asking for the same id each get
+          their own Device. A device that isn't found raises
+          DevicesNotFoundException.
+        completion_broker : CompletionBroker, optional
+          Defaults to None. If given, poll_until_ready waits for the
+          broker's webhook events instead of polling, and only polls every
+          `fallback_interval` seconds as a safety net.
         """
-        Routes.__init__(self)
-
         if api_key is None:
             api_key = os.environ.get("SEAM_API_KEY", None)
         if api_key is None:
@@ -76,18 +155,111 @@ class Seam(AbstractSeam):
         if api_url is not None:
             self.api_url = cast(str, api_url)
         self.should_report_exceptions = should_report_exceptions
+        self.stream_list_responses = stream_list_responses
+        if self.stream_list_responses:
+            require_ijson()
+        self.json_codec = json_codec or get_default_json_codec()
+        self.device_cache = device_cache
+        self.http_cache = http_cache
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self.device_get_batch_window = device_get_batch_window
+        self.single_flight = SingleFlight() if coalesce_requests else None
+        self.completion_broker = completion_broker
+        if completion_broker is not None and device_cache is not None:
+            completion_broker.add_device_cache(device_cache)
+
+        # Static headers are built once and sent with every request
+        headers = {
+            "Authorization": "Bearer " + self.api_key,
+            "Content-Type": "application/json",
+            "User-Agent": "Python SDK v" + get_sdk_version() + " (https://github.com/seamapi/python)",
+        }
+        if self.workspace_id is not None:
+            headers["seam-workspace"] = self.workspace_id
+
+        self.session = requests.Session()
+        self.session.headers.update(headers)
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
         if self.should_report_exceptions:
+            # Imported here so clients without reporting skip its import cost
+            import sentry_sdk
+
             self.sentry_client = sentry_sdk.Hub(sentry_sdk.Client(
                 dsn=get_sentry_dsn(),
             ))
             self.sentry_client.scope.set_context("sdk_info", {
                 "repository": "https://github.com/seamapi/python",
-                "version": pkg_resources.get_distribution("seamapi").version,
+                "version": get_sdk_version(),
                 "endpoint": self.api_url,
             })
 
-    def make_request(self, method: str, path: str, **kwargs):
+    def close(self):
+        """
+        Closes the underlying session and releases its pooled connections
+        """
+
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _request(self, method: str, path: str, url: str, stream: bool, kwargs: dict):
+        if self.rate_limiter is None:
+            return self.session.request(method, url, stream=stream, **kwargs)
+        with self.rate_limiter.acquire(path):
+            return self.session.request(method, url, stream=stream, **kwargs)
+
+    def _send(self, method: str, path: str, url: str, stream: bool, kwargs: dict):
+        retry_policy = self.retry_policy
+        if retry_policy is None:
+            return self._request(method, path, url, stream, kwargs)
+
+        if retry_policy.timeout is not None:
+            kwargs.setdefault("timeout", retry_policy.timeout)
+        deadline = retry_policy.deadline()
+        attempt = 1
+        while True:
+            try:
+                response = self._request(method, path, url, stream, kwargs)
+            except (requests.ConnectionError, requests.Timeout) as error:
+                delay = retry_policy.next_delay(
+                    method, url, attempt, deadline, error=error
+                )
+                if delay is None:
+                    raise
+            else:
+                delay = retry_policy.next_delay(
+                    method,
+                    url,
+                    attempt,
+                    deadline,
+                    status_code=response.status_code,
+                    retry_after=response.headers.get("retry-after"),
+                )
+                if delay is None:
+                    return response
+                response.close()
+
+            time.sleep(delay)
+            attempt += 1
+
+    def make_request(
+        self,
+        method: str,
+        path: str,
+        stream_items: Optional[str] = None,
+        **kwargs
+    ):
         """
         Makes a request to the API
 
@@ -97,19 +269,41 @@ class Seam(AbstractSeam):
           Request method
         path : str
           Request path
+        stream_items : str, optional
+          ijson prefix (e.g. "devices.item"). If set, the body is not
+          buffered; an iterator over the items at that prefix is returned
+          instead, decoding each one as it arrives.
         **kwargs
-          Keyword arguments passed to requests.request
+          Keyword arguments passed to requests.Session.request
         """
 
         url = self.api_url + path
-        headers = {
-            "Authorization": "Bearer " + self.api_key,
-            "Content-Type": "application/json",
-            "User-Agent": "Python SDK v" + pkg_resources.get_distribution("seamapi").version + " (https://github.com/seamapi/python)",
-        }
-        if self.workspace_id is not None:
-            headers["seam-workspace"] = self.workspace_id
-        response = requests.request(method, url, headers=headers, **kwargs)
+        if kwargs.get("json") is not None:
+            kwargs["data"] = self.json_codec.dumps(kwargs.pop("json"))
+
+        cache_key = None
+        if self.http_cache is not None and method == "GET" and stream_items is None:
+            cache_key = self.http_cache.key(
+                url,
+                kwargs.get("params"),
+                self.workspace_id,
+                self.session.headers.get("Authorization"),
+            )
+            validators = self.http_cache.validators(cache_key)
+            if validators:
+                kwargs["headers"] = {**(kwargs.get("headers") or {}), **validators}
+
+        if self.single_flight is not None and method == "GET" and stream_items is None:
+            # Concurrent identical GETs share one response, each caller
+            # decodes the body itself below
+            response = self.single_flight.do(
+                (self.workspace_id, request_key(url, kwargs.get("params"))),
+                lambda: self._send(method, path, url, False, kwargs),
+            )
+        else:
+            response = self._send(
+                method, path, url, stream_items is not None, kwargs
+            )
 
         if self.should_report_exceptions and response.status_code:
             # Add breadcrumb
@@ -125,10 +319,33 @@ class Seam(AbstractSeam):
             )
 
 
+        if response.status_code == 304 and cache_key is not None:
+            cached = self.http_cache.get(cache_key, self.json_codec.loads)
+            if cached is not MISSING:
+                return cached
+            # The entry was evicted after its validators were sent, so ask
+            # for the full body again
+            kwargs["headers"] = {
+                name: value
+                for name, value in (kwargs.get("headers") or {}).items()
+                if name not in validators
+            }
+            response = self._send(method, path, url, False, kwargs)
+
         if response.status_code != 200:
             raise SeamApiException(response)
 
+        if stream_items is not None:
+            return iter_json_items(response, stream_items)
+
         if "application/json" in response.headers["content-type"]:
-            return response.json()
+            if cache_key is not None:
+                return self.http_cache.store(
+                    cache_key,
+                    response.headers,
+                    response.content,
+                    self.json_codec.loads,
+                )
+            return self.json_codec.loads(response.content)
 
         return response.text
@@ -15,6 +15,12 @@ from seamapi.utils.parse_list_device_params import parse_list_device_params
 from seamapi.utils.convert_to_id import (
     to_device_id,
 )
+from seamapi.utils.device_cache import (
+    cache_devices,
+    get_cached_device,
+    invalidate_device,
+    poll_until_ready_and_invalidate,
+)
 from seamapi.utils.report_error import report_error
 from .climate_setting_schedules import ClimateSettingSchedules
 
@@ -166,6 +172,10 @@ class Thermostats(AbstractThermostats):
             Device
         """
 
+        cached_device = get_cached_device(self.seam, device, name)
+        if cached_device is not None:
+            return cached_device
+
         params = {}
 
         if device:
@@ -175,7 +185,9 @@ class Thermostats(AbstractThermostats):
 
         res = self.seam.make_request("GET", "/thermostats/get", params=params)
         json_thermostat = res["thermostat"]
-        return Device.from_dict(json_thermostat)
+        fetched_device = Device.from_dict(json_thermostat)
+        cache_devices(self.seam, [fetched_device])
+        return fetched_device
 
     @report_error
     def update(
@@ -218,6 +230,7 @@ class Thermostats(AbstractThermostats):
             "/thermostats/update",
             json=update_payload,
         )
+        invalidate_device(self.seam, device)
 
         return True
 
@@ -274,16 +287,15 @@ class Thermostats(AbstractThermostats):
             json=params,
         )
         action_attempt = res["action_attempt"]
+        invalidate_device(self.seam, device)
 
         if not wait_for_action_attempt:
             return ActionAttempt.from_dict(action_attempt)
 
-        updated_action_attempt = self.seam.action_attempts.poll_until_ready(
-            action_attempt["action_attempt_id"]
+        return poll_until_ready_and_invalidate(
+            self.seam, action_attempt["action_attempt_id"], device
         )
 
-        return updated_action_attempt
-
     @report_error
     def heat(
         self,
@@ -337,16 +349,15 @@ class Thermostats(AbstractThermostats):
             json=params,
         )
         action_attempt = res["action_attempt"]
+        invalidate_device(self.seam, device)
 
         if not wait_for_action_attempt:
             return ActionAttempt.from_dict(action_attempt)
 
-        updated_action_attempt = self.seam.action_attempts.poll_until_ready(
-            action_attempt["action_attempt_id"]
+        return poll_until_ready_and_invalidate(
+            self.seam, action_attempt["action_attempt_id"], device
         )
 
-        return updated_action_attempt
-
     @report_error
     def heat_cool(
         self,
@@ -408,16 +419,15 @@ class Thermostats(AbstractThermostats):
             json=params,
         )
         action_attempt = res["action_attempt"]
+        invalidate_device(self.seam, device)
 
         if not wait_for_action_attempt:
             return ActionAttempt.from_dict(action_attempt)
 
-        updated_action_attempt = self.seam.action_attempts.poll_until_ready(
-            action_attempt["action_attempt_id"]
+        return poll_until_ready_and_invalidate(
+            self.seam, action_attempt["action_attempt_id"], device
         )
 
-        return updated_action_attempt
-
     @report_error
     def off(
         self,
@@ -454,16 +464,15 @@ class Thermostats(AbstractThermostats):
             },
         )
         action_attempt = res["action_attempt"]
+        invalidate_device(self.seam, device)
 
         if not wait_for_action_attempt:
             return ActionAttempt.from_dict(action_attempt)
 
-        updated_action_attempt = self.seam.action_attempts.poll_until_ready(
-            action_attempt["action_attempt_id"]
+        return poll_until_ready_and_invalidate(
+            self.seam, action_attempt["action_attempt_id"], device
         )
 
-        return updated_action_attempt
-
     @report_error
     def set_fan_mode(
         self,
@@ -506,12 +515,11 @@ class Thermostats(AbstractThermostats):
             },
         )
         action_attempt = res["action_attempt"]
+        invalidate_device(self.seam, device)
 
         if not wait_for_action_attempt:
             return ActionAttempt.from_dict(action_attempt)
 
-        updated_action_attempt = self.seam.action_attempts.poll_until_ready(
-            action_attempt["action_attempt_id"]
+        return poll_until_ready_and_invalidate(
+            self.seam, action_attempt["action_attempt_id"], device
         )
-
-        return updated_action_attempt
@@ -1,10 +1,12 @@
 # TODO this file should eventually be generated by looking at openapi.json
 
 import abc
-from typing import List, Optional, Union, Dict, Any
-from dataclasses import dataclass
-from dataclasses_json import dataclass_json
+from datetime import timedelta
+from typing import Callable, Iterator, List, Optional, Sequence, Union, Dict, Any
+from dataclasses import dataclass, field
+from seamapi.utils.columns import ACCESS_CODE_COLUMNS, DEVICE_COLUMNS
 from seamapi.utils.deep_attr_dict import DeepAttrDict
+from seamapi.utils.slotted_model import add_slots, slotted_model
 
 AccessCodeId = str
 ActionAttemptId = str
@@ -55,6 +57,43 @@ class ActionAttemptFailedException(Exception):
         )
 
 
+class ActionAttemptTimeoutException(Exception):
+    def __init__(
+        self,
+        action_attempt_id: Optional[str] = None,
+        action_type: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ):
+        self.action_attempt_id = action_attempt_id
+        self.action_type = action_type
+        self.timeout = timeout
+        super().__init__(
+            f'Action Attempt for "{action_type}" still pending after {timeout} seconds (action_attempt_id={action_attempt_id})'
+        )
+
+
+class ActionAttemptsNotFoundException(Exception):
+    def __init__(self, action_attempt_ids: List[str]):
+        self.action_attempt_ids = action_attempt_ids
+        super().__init__(
+            f"Action attempts not found: {', '.join(action_attempt_ids)}"
+        )
+
+
+class DevicesNotFoundException(Exception):
+    def __init__(self, device_ids: List[str]):
+        self.device_ids = device_ids
+        super().__init__(f"Devices not found: {', '.join(device_ids)}")
+
+
+class WebhookVerificationException(Exception):
+    def __init__(self, message: str, message_id: Optional[str] = None):
+        self.message_id = message_id
+        super().__init__(
+            f"Webhook verification failed: {message} (message_id={message_id})"
+        )
+
+
 class WaitForAccessCodeFailedException(Exception):
     def __init__(self, message: str, access_code_id: str, errors: Optional[list] = []):
         self.access_code_id = access_code_id
@@ -122,24 +161,79 @@ class UnmanagedDevice:
         )
 
 
+_EVENT_ATTRIBUTES = frozenset(
+    ["event_id", "event_class", "event_type", "device_id", "created_at"]
+)
+
+
+@add_slots
 @dataclass
 class Event:
+    """
+    `payload` is the decoded API object the event was built from. It is
+    shared, not copied, and fields without an attribute stay reachable
+    through ``event["field"]`` or ``event.get("field")``.
+    """
     event_id: str
-    event_class: Union[str, None]
-    event_type: Union[str, None]
-    device_id: Optional[str]
-    created_at: Union[str, None]
+    event_class: Union[str, None] = None
+    event_type: Union[str, None] = None
+    device_id: Optional[str] = None
+    created_at: Union[str, None] = None
+    payload: Optional[Dict[str, Any]] = field(
+        default=None, repr=False, compare=False
+    )
 
+    @staticmethod
+    def from_dict(d: Dict[str, Any], fields: Optional[Sequence[str]] = None):
+        """
+        Builds an Event around `d`. With `fields`, only those keys are kept
+        in `payload` besides the attributes, and `d` itself is not
+        referenced so it can be freed.
+        """
+        get = d.get
+        return Event(
+            d["event_id"],
+            get("event_class"),
+            get("event_type"),
+            get("device_id"),
+            get("created_at"),
+            d if fields is None else {name: d[name] for name in fields if name in d},
+        )
 
-@dataclass_json
-@dataclass
+    def to_dict(self) -> Dict[str, Any]:
+        d = {
+            "event_id": self.event_id,
+            "event_class": self.event_class,
+            "event_type": self.event_type,
+            "device_id": self.device_id,
+            "created_at": self.created_at,
+        }
+        if self.payload is not None:
+            d.update(self.payload)
+        return d
+
+    def __getitem__(self, key: str) -> Any:
+        payload = self.payload
+        if payload is not None and key in payload:
+            return payload[key]
+        if key in _EVENT_ATTRIBUTES:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
+@slotted_model
 class ActionAttemptError:
     type: str
     message: str
 
 
-@dataclass_json
-@dataclass
+@slotted_model
 class ActionAttempt:
     action_attempt_id: str
     action_type: str
@@ -148,8 +242,7 @@ class ActionAttempt:
     error: Optional[ActionAttemptError] = None
 
 
-@dataclass_json
-@dataclass
+@slotted_model
 class Workspace:
     workspace_id: str
     name: str
@@ -157,8 +250,7 @@ class Workspace:
     connect_partner_name: str = None
 
 
-@dataclass_json
-@dataclass
+@slotted_model
 class ConnectWebview:
     workspace_id: str
     connect_webview_id: str
@@ -181,8 +273,7 @@ class ConnectWebview:
     automatically_manage_new_devices: Optional[bool] = None
 
 
-@dataclass_json
-@dataclass
+@slotted_model
 class ConnectedAccount:
     connected_account_id: str
     created_at: str
@@ -192,8 +283,7 @@ class ConnectedAccount:
     custom_metadata: Dict[str, Union[str, int, bool, None]]
 
 
-@dataclass_json
-@dataclass
+@slotted_model
 class AccessCode:
     access_code_id: str
     device_id: str
@@ -219,8 +309,7 @@ class AccessCode:
     is_one_time_use: Optional[bool] = None
 
 
-@dataclass_json
-@dataclass
+@slotted_model
 class UnmanagedAccessCode:
     access_code_id: str
     device_id: str
@@ -261,8 +350,7 @@ class NoiseThreshold:
         )
 
 
-@dataclass_json
-@dataclass
+@slotted_model
 class ClimateSetting:
     automatic_heating_enabled: Optional[bool]
     automatic_cooling_enabled: Optional[bool]
@@ -274,8 +362,7 @@ class ClimateSetting:
     manual_override_allowed: Optional[bool]
 
 
-@dataclass_json
-@dataclass
+@slotted_model
 class ClimateSettingScheduleBase(ClimateSetting):
     schedule_type: Optional[str]
     name: Optional[str]
@@ -283,8 +370,7 @@ class ClimateSettingScheduleBase(ClimateSetting):
     schedule_ends_at: str
 
 
-@dataclass_json
-@dataclass
+@slotted_model
 class ClimateSettingSchedule(ClimateSettingScheduleBase):
     climate_setting_schedule_id: str
     is_set_on_device: bool
@@ -292,14 +378,26 @@ class ClimateSettingSchedule(ClimateSettingScheduleBase):
     created_at: str
 
 
-@dataclass_json
-@dataclass
+@slotted_model
 class ClimateSettingScheduleUpdate(ClimateSettingSchedule):
     pass
 
 
-@dataclass_json
 @dataclass
+class BulkResult:
+    index: int
+    item: Any
+    value: Any = None
+    error: Optional[Exception] = None
+    duration: float = 0.0
+    callback_error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@slotted_model
 class Webhook:
     webhook_id: str
     url: str
@@ -314,14 +412,40 @@ class AbstractActionAttempts(abc.ABC):
     ) -> ActionAttempt:
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def list(
+        self,
+        action_attempts: Sequence[Union[ActionAttemptId, ActionAttempt]],
+    ) -> List[ActionAttempt]:
+        raise NotImplementedError
+
     @abc.abstractmethod
     def poll_until_ready(
         self,
         action_attempt: Union[ActionAttemptId, ActionAttempt],
         should_raise: bool = True,
+        timeout: Optional[float] = 300,
+        initial_delay: float = 0,
+        poll_interval: float = 0.25,
+        max_poll_interval: float = 5,
+        backoff_factor: float = 1.5,
+        jitter: float = 0.1,
     ) -> ActionAttempt:
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def wait_for_many(
+        self,
+        action_attempts: Sequence[Union[ActionAttemptId, ActionAttempt]],
+        timeout: Optional[float] = 300,
+        poll_interval: float = 0.25,
+        max_poll_interval: float = 5,
+        backoff_factor: float = 1.5,
+        jitter: float = 0.1,
+        batch_size: int = 100,
+    ) -> Iterator[ActionAttempt]:
+        raise NotImplementedError
+
 
 class AbstractLocks(abc.ABC):
     @abc.abstractmethod
@@ -333,11 +457,19 @@ class AbstractLocks(abc.ABC):
         raise NotImplementedError
 
     @abc.abstractmethod
-    def lock_door(self, device: Union[DeviceId, Device]) -> ActionAttempt:
+    def lock_door(
+        self,
+        device: Union[DeviceId, Device],
+        wait_for_action_attempt: Optional[bool] = True,
+    ) -> ActionAttempt:
         raise NotImplementedError
 
     @abc.abstractmethod
-    def unlock_door(self, device: Union[DeviceId, Device]) -> ActionAttempt:
+    def unlock_door(
+        self,
+        device: Union[DeviceId, Device],
+        wait_for_action_attempt: Optional[bool] = True,
+    ) -> ActionAttempt:
         raise NotImplementedError
 
 
@@ -363,6 +495,7 @@ class AbstractUnmanagedAccessCodes(abc.ABC):
         self,
         access_code: Union[AccessCodeId, UnmanagedAccessCode],
         allow_external_modification: Optional[bool] = None,
+        wait_for_action_attempt: Optional[bool] = True,
     ) -> ActionAttempt:
         raise NotImplementedError
 
@@ -378,6 +511,24 @@ class AbstractAccessCodes(abc.ABC):
     ) -> List[AccessCode]:
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def iter_list(
+        self,
+        device: Optional[Union[DeviceId, Device]] = None,
+        access_codes: Optional[Union[List[AccessCode], List[AccessCodeId]]] = None,
+        page_size: int = 100,
+    ) -> Iterator[AccessCode]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def list_columns(
+        self,
+        device: Optional[Union[DeviceId, Device]] = None,
+        access_codes: Optional[Union[List[AccessCode], List[AccessCodeId]]] = None,
+        columns: Sequence[str] = ACCESS_CODE_COLUMNS,
+    ) -> Dict[str, List[Any]]:
+        raise NotImplementedError
+
     @abc.abstractmethod
     def get(
         self,
@@ -426,13 +577,17 @@ class AbstractAccessCodes(abc.ABC):
         starts_at: Optional[str] = None,
         ends_at: Optional[str] = None,
         type: Optional[str] = None,
-    ) -> AccessCode:
+        allow_external_modification: Optional[bool] = None,
+        wait_for_action_attempt: Optional[bool] = True,
+    ) -> Union[AccessCode, ActionAttempt]:
         raise NotImplementedError
 
     @abc.abstractmethod
     def delete(
         self,
         access_code: Union[AccessCodeId, AccessCode],
+        device: Optional[Union[DeviceId, Device]] = None,
+        wait_for_action_attempt: Optional[bool] = True,
     ) -> ActionAttempt:
         raise NotImplementedError
 
@@ -524,6 +679,21 @@ class AbstractUnmanagedDevices(abc.ABC):
     ) -> List[UnmanagedDevice]:
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def iter_list(
+        self,
+        connected_account: Union[ConnectedAccountId, ConnectedAccount] = None,
+        connected_accounts: List[Union[ConnectedAccountId, ConnectedAccount]] = None,
+        connect_webview: Union[ConnectWebviewId, ConnectWebview] = None,
+        device_type: Optional[DeviceType] = None,
+        device_types: Optional[List[DeviceType]] = None,
+        device_ids: Optional[List[Union[DeviceId, Device]]] = None,
+        manufacturer: Optional[str] = None,
+        created_before: Optional[str] = None,
+        page_size: int = 100,
+    ) -> Iterator[UnmanagedDevice]:
+        raise NotImplementedError
+
     @abc.abstractmethod
     def update(
         self,
@@ -549,6 +719,46 @@ class AbstractDevices(abc.ABC):
     ) -> List[Device]:
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def iter_list(
+        self,
+        connected_account: Union[ConnectedAccountId, ConnectedAccount] = None,
+        connected_accounts: List[Union[ConnectedAccountId, ConnectedAccount]] = None,
+        connect_webview: Union[ConnectWebviewId, ConnectWebview] = None,
+        device_type: Optional[DeviceType] = None,
+        device_types: Optional[List[DeviceType]] = None,
+        device_ids: Optional[List[Union[DeviceId, Device]]] = None,
+        manufacturer: Optional[str] = None,
+        created_before: Optional[str] = None,
+        page_size: int = 100,
+    ) -> Iterator[Device]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def get_many(
+        self,
+        devices: Sequence[Union[DeviceId, Device]],
+        batch_size: int = 100,
+        raise_if_missing: bool = True,
+    ) -> List[Optional[Device]]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def list_columns(
+        self,
+        connected_account: Union[ConnectedAccountId, ConnectedAccount] = None,
+        connected_accounts: List[Union[ConnectedAccountId, ConnectedAccount]] = None,
+        connect_webview: Union[ConnectWebviewId, ConnectWebview] = None,
+        device_type: Optional[DeviceType] = None,
+        device_types: Optional[List[DeviceType]] = None,
+        device_ids: Optional[List[Union[DeviceId, Device]]] = None,
+        manufacturer: Optional[str] = None,
+        limit: Optional[float] = None,
+        created_before: Optional[str] = None,
+        columns: Sequence[str] = DEVICE_COLUMNS,
+    ) -> Dict[str, List[Any]]:
+        raise NotImplementedError
+
     @abc.abstractmethod
     def get(
         self,
@@ -584,6 +794,29 @@ class AbstractEvents(abc.ABC):
     def list(self) -> List[Event]:
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def iter_list(
+        self,
+        since: str,
+        until: Optional[str] = None,
+        window: timedelta = timedelta(hours=1),
+        page_limit: int = 500,
+        min_window: timedelta = timedelta(seconds=1),
+    ) -> Iterator[Event]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def backfill(
+        self,
+        start: str,
+        end: Optional[str] = None,
+        shards: int = 8,
+        max_workers: int = 8,
+        page_limit: int = 500,
+        min_shard: timedelta = timedelta(seconds=1),
+    ) -> Iterator[Event]:
+        raise NotImplementedError
+
 
 class AbstractWorkspaces(abc.ABC):
     @abc.abstractmethod
@@ -814,7 +1047,30 @@ class AbstractWebhooks(abc.ABC):
         raise NotImplementedError
 
 
-@dataclass
+class AbstractBulk(abc.ABC):
+    @abc.abstractmethod
+    def run(
+        self,
+        operations: Sequence[Callable[[], Any]],
+        max_workers: int = 8,
+        on_result: Optional[Callable[[BulkResult], None]] = None,
+    ) -> List[BulkResult]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def map(
+        self,
+        fn: Callable[..., Any],
+        items: Sequence[Any],
+        max_workers: int = 8,
+        on_result: Optional[Callable[[BulkResult], None]] = None,
+        **kwargs: Any,
+    ) -> List[BulkResult]:
+        raise NotImplementedError
+
+
+# repr and eq would read, and so build, every lazy route
+@dataclass(repr=False, eq=False)
 class AbstractRoutes(abc.ABC):
     workspaces: AbstractWorkspaces
     connect_webviews: AbstractConnectWebviews
@@ -827,13 +1083,15 @@ class AbstractRoutes(abc.ABC):
     events: AbstractEvents
     connected_accounts: AbstractConnectedAccounts
     webhooks: AbstractWebhooks
+    bulk: AbstractBulk
 
     @abc.abstractmethod
     def make_request(self, method: str, path: str, **kwargs) -> Any:
         raise NotImplementedError
 
 
-@dataclass
+# repr and eq would read, and so build, every lazy route
+@dataclass(repr=False, eq=False)
 class AbstractSeam(AbstractRoutes):
     api_key: str
     workspace_id: str
@@ -846,12 +1104,17 @@ class AbstractSeam(AbstractRoutes):
         workspace_id: Optional[str] = None,
         api_url: Optional[str] = None,
         should_report_exceptions: Optional[bool] = False,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
     ):
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def close(self) -> None:
+        raise NotImplementedError
 
-@dataclass_json
-@dataclass
+
+@slotted_model
 class ResetSandBoxResponse:
     message: str
     ok: bool
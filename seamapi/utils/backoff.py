@@ -0,0 +1,27 @@
+import random
+from typing import Iterator
+
+
+def apply_jitter(interval: float, jitter: float) -> float:
+    """
+    Randomly spreads `interval` by +/- `jitter` (a fraction of the interval)
+    so concurrent pollers don't synchronize.
+    """
+    spread = interval * jitter
+    return max(0.0, interval + random.uniform(-spread, spread))
+
+
+def backoff_intervals(
+    initial_interval: float,
+    max_interval: float,
+    backoff_factor: float = 2.0,
+    jitter: float = 0.1,
+) -> Iterator[float]:
+    """
+    Yields an endless series of jittered sleep intervals that grow by
+    `backoff_factor` up to `max_interval`.
+    """
+    interval = initial_interval
+    while True:
+        yield apply_jitter(interval, jitter)
+        interval = min(interval * backoff_factor, max_interval)
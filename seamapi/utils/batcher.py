@@ -0,0 +1,137 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional
+
+
+class Batcher:
+    """
+    Micro-batches concurrent single-key lookups into one bulk call.
+
+    The first thread to ask for a key waits `window` seconds for others to
+    join, then calls `fetch_many` once with every key collected and hands
+    each waiting thread its value (None when the key was not returned). A
+    batch reaching `max_batch_size` is sent right away. When several threads
+    wait on the same key, every one after the first receives
+    `copy_value(value)`, so they don't share a mutable result.
+    """
+
+    def __init__(
+        self,
+        fetch_many: Callable[[List[Hashable]], Dict[Hashable, Any]],
+        window: float = 0.005,
+        max_batch_size: int = 100,
+        copy_value: Optional[Callable[[Any], Any]] = None,
+    ):
+        self.fetch_many = fetch_many
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self.copy_value = copy_value
+        self._pending: Dict[Hashable, List[Future]] = {}
+        self._scheduled = False
+        self._lock = threading.Lock()
+
+    def _take(self) -> Dict[Hashable, List[Future]]:
+        batch, self._pending, self._scheduled = self._pending, {}, False
+        return batch
+
+    def _run(self, batch: Dict[Hashable, List[Future]]) -> None:
+        try:
+            found = self.fetch_many(list(batch))
+        except BaseException as error:
+            for futures in batch.values():
+                for future in futures:
+                    future.set_exception(error)
+            return
+        for key, futures in batch.items():
+            value = found.get(key)
+            for index, future in enumerate(futures):
+                future.set_result(_copy_for(self.copy_value, value, index))
+
+    def get(self, key: Hashable) -> Any:
+        future: Future = Future()
+        batch = None
+        leader = False
+        with self._lock:
+            self._pending.setdefault(key, []).append(future)
+            if len(self._pending) >= self.max_batch_size:
+                batch = self._take()
+            elif not self._scheduled:
+                self._scheduled = leader = True
+
+        if batch is None and leader:
+            time.sleep(self.window)
+            with self._lock:
+                if self._pending:
+                    batch = self._take()
+        if batch:
+            self._run(batch)
+        return future.result()
+
+
+def _copy_for(copy_value, value, index):
+    # The first waiter of a key gets the fetched value itself
+    if index == 0 or value is None or copy_value is None:
+        return value
+    return copy_value(value)
+
+
+class AsyncBatcher:
+    """Asyncio counterpart of Batcher, with an async `fetch_many`"""
+
+    def __init__(
+        self,
+        fetch_many: Callable[[List[Hashable]], Awaitable[Dict[Hashable, Any]]],
+        window: float = 0.005,
+        max_batch_size: int = 100,
+        copy_value: Optional[Callable[[Any], Any]] = None,
+    ):
+        self.fetch_many = fetch_many
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self.copy_value = copy_value
+        self._pending: Dict[Hashable, List["asyncio.Future[Any]"]] = {}
+        self._scheduled = False
+        self._tasks = set()
+
+    def _take(self) -> Dict[Hashable, List["asyncio.Future[Any]"]]:
+        batch, self._pending, self._scheduled = self._pending, {}, False
+        return batch
+
+    async def _run(self, batch: Dict[Hashable, List["asyncio.Future[Any]"]]) -> None:
+        try:
+            found = await self.fetch_many(list(batch))
+        except Exception as error:
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(error)
+            return
+        for key, futures in batch.items():
+            value = found.get(key)
+            for index, future in enumerate(futures):
+                if not future.done():
+                    future.set_result(_copy_for(self.copy_value, value, index))
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.window)
+        if self._pending:
+            await self._run(self._take())
+
+    async def get(self, key: Hashable) -> Any:
+        future = asyncio.get_running_loop().create_future()
+        self._pending.setdefault(key, []).append(future)
+        # Flushes run in their own tasks so a cancelled caller can't strand
+        # the other waiters of its batch
+        if len(self._pending) >= self.max_batch_size:
+            task = asyncio.ensure_future(self._run(self._take()))
+        elif not self._scheduled:
+            self._scheduled = True
+            task = asyncio.ensure_future(self._flush_later())
+        else:
+            task = None
+        if task is not None:
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        return await future
@@ -0,0 +1,84 @@
+"""
+Columnar views of list responses, built straight from the decoded JSON so no
+per-row model objects are created. Columns are dotted paths into each item,
+e.g. "properties.online". Arrow output requires the optional `pyarrow` package.
+"""
+from typing import Any, Dict, Iterable, List, Sequence
+
+DEVICE_COLUMNS = (
+    "device_id",
+    "device_type",
+    "connected_account_id",
+    "workspace_id",
+    "created_at",
+    "is_managed",
+    "properties.name",
+    "properties.manufacturer",
+    "properties.online",
+    "properties.locked",
+    "properties.battery_level",
+)
+
+ACCESS_CODE_COLUMNS = (
+    "access_code_id",
+    "device_id",
+    "type",
+    "status",
+    "name",
+    "code",
+    "starts_at",
+    "ends_at",
+    "created_at",
+    "is_managed",
+)
+
+
+def require_pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError(
+            "Arrow tables require pyarrow. "
+            "Install it with `pip install seamapi[arrow]`."
+        )
+    return pyarrow
+
+
+def _get_path(item: Dict[str, Any], path: List[str]) -> Any:
+    value = item
+    for key in path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def to_columns(
+    items: Iterable[Dict[str, Any]], columns: Sequence[str]
+) -> Dict[str, List[Any]]:
+    """Returns {column: [value per item]}, with None for missing values"""
+    if not isinstance(items, list):
+        items = list(items)
+
+    result = {}
+    for column in columns:
+        path = column.split(".")
+        if len(path) == 1:
+            result[column] = [item.get(column) for item in items]
+        else:
+            result[column] = [_get_path(item, path) for item in items]
+    return result
+
+
+def as_table(columns: Dict[str, List[Any]]):
+    """Converts the output of `to_columns` to a pyarrow.Table"""
+    pyarrow = require_pyarrow()
+    return pyarrow.table(columns)
+
+
+def write_parquet(columns: Dict[str, List[Any]], path: str, **kwargs: Any) -> None:
+    """Writes the output of `to_columns` to a Parquet file"""
+    require_pyarrow()
+    import pyarrow.parquet
+
+    pyarrow.parquet.write_table(as_table(columns), path, **kwargs)
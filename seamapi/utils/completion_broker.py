@@ -0,0 +1,222 @@
+import json
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Mapping, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from seamapi.utils.device_cache import DeviceCache
+
+
+class CompletionBroker:
+    """
+    Wakes action attempt waiters when a webhook event for them arrives.
+
+    Serve `wsgi_app` or `asgi_app` at the URL registered through
+    ``Webhooks.create`` (with ``action_attempt.*`` or ``lock.*`` event
+    types) and pass the broker to the client. ``poll_until_ready`` then
+    fetches the action attempt as soon as an event carrying its
+    ``action_attempt_id`` is delivered, and only polls every
+    `fallback_interval` seconds in case a delivery is lost.
+
+    Events that arrive before anyone waits for them are remembered, so an
+    action attempt that finishes before ``poll_until_ready`` starts is not
+    missed.
+
+    Every event is also passed to ``DeviceCache.handle_event`` of the
+    attached device caches, so devices changed by a delivered event are not
+    served stale. A client given both a broker and a device cache attaches
+    its cache.
+
+    ...
+
+    Attributes
+    ----------
+    fallback_interval : float
+        Seconds between safety-net polls while waiting for an event
+    events : int
+        Number of events received
+
+    Methods
+    -------
+    register(action_attempt_id)
+        Gets a future resolved with the next event for an action attempt
+    discard(action_attempt_id, waiter)
+        Stops waiting on a future returned by register
+    add_device_cache(device_cache)
+        Invalidates a device cache from delivered events
+    handle_event(event)
+        Resolves the waiters of the action attempt an event refers to
+    wsgi_app(environ, start_response)
+        WSGI application receiving webhook deliveries
+    asgi_app(scope, receive, send)
+        ASGI application receiving webhook deliveries
+    """
+
+    def __init__(
+        self,
+        fallback_interval: float = 10,
+        max_recent: int = 1024,
+        verify: Optional[Callable[[Mapping[str, str], bytes], Any]] = None,
+        device_cache: Optional["DeviceCache"] = None,
+    ):
+        """
+        Parameters
+        ----------
+        fallback_interval : float, optional
+          Seconds between safety-net polls while waiting for an event.
+          Defaults to 10.
+        max_recent : int, optional
+          Number of events kept for action attempts nobody is waiting for
+          yet. Defaults to 1024.
+        verify : Callable[[Mapping[str, str], bytes], Any], optional
+          Called with the lowercased request headers and the raw body of
+          each delivery before it is parsed, e.g. WebhookReceiver(secret).verify.
+          Raising rejects the delivery with a 401.
+        device_cache : DeviceCache, optional
+          Device cache invalidated from delivered events.
+        """
+        self.fallback_interval = fallback_interval
+        self.max_recent = max_recent
+        self.verify = verify
+        self.events = 0
+        self.device_caches: List["DeviceCache"] = []
+        if device_cache is not None:
+            self.device_caches.append(device_cache)
+        self._waiters: Dict[str, List[Future]] = {}
+        self._recent: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def register(self, action_attempt_id: str) -> Future:
+        """
+        Returns a future resolved with the next event for the action
+        attempt, already resolved if one arrived before the call
+        """
+        waiter: Future = Future()
+        with self._lock:
+            event = self._recent.pop(action_attempt_id, None)
+            if event is None:
+                self._waiters.setdefault(action_attempt_id, []).append(waiter)
+        if event is not None:
+            waiter.set_result(event)
+        return waiter
+
+    def discard(self, action_attempt_id: str, waiter: Future) -> None:
+        with self._lock:
+            waiters = self._waiters.get(action_attempt_id)
+            if waiters and waiter in waiters:
+                waiters.remove(waiter)
+                if not waiters:
+                    del self._waiters[action_attempt_id]
+
+    def add_device_cache(self, device_cache: "DeviceCache") -> None:
+        if not any(cache is device_cache for cache in self.device_caches):
+            self.device_caches.append(device_cache)
+
+    def handle_event(self, event: Dict[str, Any]) -> None:
+        """
+        Invalidates the device the event refers to in the attached device
+        caches, then resolves every waiter of its action attempt. Events
+        without an ``action_attempt_id`` wake no one.
+        """
+        # Before waking waiters, so a get made once the action completes
+        # doesn't read the device from before it
+        for device_cache in self.device_caches:
+            device_cache.handle_event(event)
+
+        action_attempt_id = event.get("action_attempt_id")
+        with self._lock:
+            self.events += 1
+            if not action_attempt_id:
+                return
+            waiters = self._waiters.pop(action_attempt_id, None)
+            if waiters is None:
+                self._recent[action_attempt_id] = event
+                self._recent.move_to_end(action_attempt_id)
+                while len(self._recent) > self.max_recent:
+                    self._recent.popitem(last=False)
+                return
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(event)
+
+    def _receive(self, method: str, headers: Mapping[str, str], body: bytes) -> int:
+        if method != "POST":
+            return 405
+        if self.verify is not None:
+            try:
+                self.verify(headers, body)
+            except Exception:
+                return 401
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            return 400
+        if not isinstance(payload, dict):
+            return 400
+        # Deliveries carry the event itself, some wrap it in {"event": ...}
+        event = payload.get("event", payload)
+        if isinstance(event, dict):
+            self.handle_event(event)
+        return 204
+
+    def wsgi_app(self, environ, start_response):
+        headers = {
+            key[5:].replace("_", "-").lower(): value
+            for key, value in environ.items()
+            if key.startswith("HTTP_")
+        }
+        if environ.get("CONTENT_TYPE"):
+            headers["content-type"] = environ["CONTENT_TYPE"]
+        try:
+            length = int(environ.get("CONTENT_LENGTH") or 0)
+        except ValueError:
+            length = 0
+        body = environ["wsgi.input"].read(length) if length > 0 else b""
+
+        status = self._receive(environ.get("REQUEST_METHOD", "GET"), headers, body)
+        start_response(_STATUS_LINES[status], [("Content-Length", "0")])
+        return [b""]
+
+    async def asgi_app(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        if scope["type"] != "http":
+            return
+
+        chunks = []
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            chunks.append(message.get("body", b""))
+            more_body = message.get("more_body", False)
+        headers = {
+            key.decode("latin-1").lower(): value.decode("latin-1")
+            for key, value in scope.get("headers", [])
+        }
+
+        status = self._receive(scope.get("method", "GET"), headers, b"".join(chunks))
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [(b"content-length", b"0")],
+            }
+        )
+        await send({"type": "http.response.body", "body": b""})
+
+
+_STATUS_LINES = {
+    204: "204 No Content",
+    400: "400 Bad Request",
+    401: "401 Unauthorized",
+    405: "405 Method Not Allowed",
+}
@@ -1,26 +1,63 @@
-# https://stackoverflow.com/a/3031270/559475
 class DeepAttrDict(dict):
-    MARKER = object()
+    """
+    Read-only dict with attribute access over nested dicts.
+
+    Only the top level is copied on construction. Nested dicts are shared
+    with the source and wrapped on access, and looking up a missing key
+    returns an empty view without inserting it, so chained access like
+    ``properties.a.b`` stays safe. Being a dict, it can be passed to
+    ``json.dumps`` or back to the API as is.
+    """
+
+    __slots__ = ()
 
     def __init__(self, value=None):
         if value is None:
-            pass
+            super().__init__()
         elif isinstance(value, dict):
-            for key in value:
-                self.__setitem__(key, value[key])
+            super().__init__(value)
         else:
             raise TypeError("expected dict")
 
-    def __setitem__(self, key, value):
+    @staticmethod
+    def _wrap(value):
         if isinstance(value, dict) and not isinstance(value, DeepAttrDict):
-            value = DeepAttrDict(value)
-        super(DeepAttrDict, self).__setitem__(key, value)
+            return DeepAttrDict(value)
+        return value
 
     def __getitem__(self, key):
-        found = self.get(key, DeepAttrDict.MARKER)
-        if found is DeepAttrDict.MARKER:
-            found = DeepAttrDict()
-            super(DeepAttrDict, self).__setitem__(key, found)
-        return found
+        found = dict.get(self, key, _MISSING)
+        if found is _MISSING:
+            return DeepAttrDict()
+        return self._wrap(found)
+
+    def __getattr__(self, key):
+        # Keep protocol lookups (copy, pickle, ...) from resolving to views
+        if key.startswith("__"):
+            raise AttributeError(key)
+        return self[key]
+
+    def __setattr__(self, key, value):
+        raise AttributeError("DeepAttrDict is read-only")
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("DeepAttrDict is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return (DeepAttrDict, (dict(self),))
+
+    def __repr__(self):
+        return f"DeepAttrDict({dict.__repr__(self)})"
+
+    def get(self, key, default=None):
+        return self._wrap(dict.get(self, key, default))
+
+    def to_dict(self):
+        """Returns a plain dict with the same items"""
+        return dict(self)
+
 
-    __setattr__, __getattr__ = __setitem__, __getitem__
+_MISSING = object()
@@ -0,0 +1,210 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, Optional, Union
+
+from seamapi.types import ActionAttempt, Device, DeviceId
+from seamapi.utils.convert_to_id import to_device_id
+from seamapi.utils.paginate import parse_timestamp
+
+_MISSING = object()
+
+
+class DeviceCache:
+    """
+    In-memory LRU cache of devices keyed by device id.
+
+    Entries older than `ttl` seconds are not served by ``get``. Individual
+    fields that rarely change (e.g. ``name`` or ``capabilities_supported``)
+    can be given a longer TTL through `field_ttls` and read with
+    ``get_field`` after the device itself has gone stale.
+
+    Devices are copied when stored and when read, so a caller changing the
+    Device it got doesn't change what later readers get.
+
+    ...
+
+    Attributes
+    ----------
+    hits : int
+        Number of lookups served from the cache
+    misses : int
+        Number of lookups that were missing or stale
+    evictions : int
+        Number of entries dropped because the cache was full
+
+    Methods
+    -------
+    get(device_id)
+        Gets a fresh cached device, or None
+    get_field(device_id, field, default=None)
+        Gets a field of a cached device using the field's TTL
+    put(device)
+        Stores a device
+    put_many(devices)
+        Stores several devices
+    invalidate(device_id)
+        Drops a device
+    handle_event(event)
+        Drops the device an event refers to
+    clear()
+        Drops every device
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = 30,
+        field_ttls: Optional[Dict[str, float]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Parameters
+        ----------
+        maxsize : int, optional
+          Maximum number of devices kept. Defaults to 1024.
+        ttl : float, optional
+          Seconds a cached device is served by `get`. Defaults to 30.
+        field_ttls : Dict[str, float], optional
+          Per-field TTLs for `get_field`, keyed by dotted path e.g.
+          {"name": 3600, "properties.name": 3600}. Fields not listed use `ttl`.
+        clock : Callable[[], float], optional
+          Monotonic clock, replaceable in tests
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.field_ttls = field_ttls or {}
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[DeviceId, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _lookup(self, device_id: DeviceId, ttl: float) -> Any:
+        with self._lock:
+            entry = self._entries.get(device_id)
+            if entry is None or self.clock() - entry[1] > ttl:
+                self.misses += 1
+                return _MISSING
+            self._entries.move_to_end(device_id)
+            self.hits += 1
+            return entry[0]
+
+    def get(self, device_id: DeviceId) -> Optional[Device]:
+        """Returns the cached device if it is younger than `ttl`, else None"""
+        device = self._lookup(device_id, self.ttl)
+        return None if device is _MISSING else copy.deepcopy(device)
+
+    def get_field(self, device_id: DeviceId, field: str, default: Any = None) -> Any:
+        """
+        Returns a field of a cached device by dotted path, e.g.
+        "properties.name", if the device is younger than that field's TTL
+        """
+        device = self._lookup(device_id, self.field_ttls.get(field, self.ttl))
+        if device is _MISSING:
+            return default
+
+        value = device
+        for key in field.split("."):
+            if isinstance(value, Device):
+                value = getattr(value, key, _MISSING)
+            else:
+                value = value.get(key, _MISSING)
+            if value is _MISSING:
+                return default
+        return copy.deepcopy(value)
+
+    def put(self, device: Device) -> None:
+        device = copy.deepcopy(device)
+        with self._lock:
+            self._entries[device.device_id] = (device, self.clock())
+            self._entries.move_to_end(device.device_id)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def put_many(self, devices: Iterable[Device]) -> None:
+        for device in devices:
+            self.put(device)
+
+    def invalidate(self, device_id: DeviceId) -> None:
+        with self._lock:
+            self._entries.pop(device_id, None)
+
+    def handle_event(self, event: Dict[str, Any]) -> None:
+        """
+        Drops the device an event refers to. Accepts events from
+        `Events.list` or webhook payloads. Every event carrying a device_id
+        (device.*, lock.*, access_code.*, ...) may reflect a change in the
+        device's state, so all of them invalidate, except events created
+        before any cached entry could have been fetched (older than the
+        longest TTL), e.g. when backfilling history.
+        """
+        device_id = event.get("device_id")
+        if not device_id:
+            return
+        created_at = event.get("created_at")
+        if created_at:
+            max_ttl = max([self.ttl, *self.field_ttls.values()])
+            horizon = datetime.now(timezone.utc) - timedelta(seconds=max_ttl)
+            if parse_timestamp(created_at) < horizon:
+                return
+        self.invalidate(device_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# Helpers used by the route classes, no-ops when the client has no cache
+
+
+def get_cached_device(
+    seam, device: Optional[Union[DeviceId, Device]], name: Optional[str] = None
+) -> Optional[Device]:
+    if seam.device_cache is None or not device or name:
+        return None
+    return seam.device_cache.get(to_device_id(device))
+
+
+def cache_devices(seam, devices: Iterable[Device]) -> None:
+    if seam.device_cache is not None:
+        seam.device_cache.put_many(devices)
+
+
+def invalidate_device(seam, device: Union[DeviceId, Device]) -> None:
+    if seam.device_cache is not None:
+        seam.device_cache.invalidate(to_device_id(device))
+
+
+def poll_until_ready_and_invalidate(
+    seam, action_attempt_id: str, device: Union[DeviceId, Device]
+) -> ActionAttempt:
+    """
+    Waits for an action attempt, then drops its device again, since a get
+    made while the action ran may have re-cached the old state
+    """
+    action_attempt = seam.action_attempts.poll_until_ready(action_attempt_id)
+    invalidate_device(seam, device)
+    return action_attempt
+
+
+async def poll_until_ready_and_invalidate_async(
+    seam, action_attempt_id: str, device: Union[DeviceId, Device]
+) -> ActionAttempt:
+    """Asyncio counterpart of poll_until_ready_and_invalidate"""
+    action_attempt = await seam.action_attempts.poll_until_ready(action_attempt_id)
+    invalidate_device(seam, device)
+    return action_attempt
+
+
+def invalidate_event_devices(seam, events: Iterable[Dict[str, Any]]) -> None:
+    if seam.device_cache is not None:
+        for event in events:
+            seam.device_cache.handle_event(event)
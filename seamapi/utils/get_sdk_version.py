@@ -0,0 +1,19 @@
+from functools import lru_cache
+
+@lru_cache(maxsize=None)
+def get_sdk_version():
+    # Resolved once per process; importlib.metadata avoids the import cost
+    # of pkg_resources
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+    except ImportError:  # Python 3.7
+        from pkg_resources import (
+            get_distribution,
+            DistributionNotFound as PackageNotFoundError,
+        )
+        version = lambda name: get_distribution(name).version
+
+    try:
+        return version("seamapi")
+    except PackageNotFoundError:
+        return "unknown"
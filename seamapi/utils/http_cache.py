@@ -0,0 +1,129 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+from urllib.parse import urlencode
+
+MISSING = object()
+
+
+def request_key(url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+    """Builds a stable key for a GET request from its url and query params"""
+    if not params:
+        return url
+    query = sorted((k, v) for k, v in params.items() if v is not None)
+    return url + "?" + urlencode(query, doseq=True)
+
+
+class HttpCache:
+    """
+    Validator cache for conditional GET requests.
+
+    Stores the ETag / Last-Modified validators and the raw body of GET
+    responses per URL and query. Later requests for the same resource send
+    If-None-Match / If-Modified-Since, and a 304 reply is served by decoding
+    the stored body again, so every caller gets its own value and nothing a
+    caller changes reaches the cache. Responses without validators are not
+    stored.
+
+    Keys include the workspace and a hash of the Authorization header, so a
+    cache shared by several clients never serves one client's response to
+    another.
+
+    ...
+
+    Attributes
+    ----------
+    hits : int
+        Responses served from the cache (304)
+    misses : int
+        Responses whose body was sent by the server
+
+    Methods
+    -------
+    key(url, params=None, workspace_id=None, authorization=None)
+        Builds the cache key of a request
+    validators(key)
+        Gets the conditional headers to send for a key
+    get(key, loads)
+        Decodes the stored body for a key
+    store(key, headers, content, loads)
+        Stores and decodes a 200 response
+    clear()
+        Drops every entry
+    """
+
+    def __init__(self, maxsize: int = 256):
+        """
+        Parameters
+        ----------
+        maxsize : int, optional
+          Maximum number of URLs kept. Defaults to 256.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[Dict[str, str], bytes]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        workspace_id: Optional[str] = None,
+        authorization: Optional[str] = None,
+    ) -> str:
+        credentials = hashlib.blake2b(
+            (authorization or "").encode(), digest_size=8
+        ).hexdigest()
+        return f"{workspace_id or ''}:{credentials}:{request_key(url, params)}"
+
+    def validators(self, key: str) -> Dict[str, str]:
+        with self._lock:
+            entry = self._entries.get(key)
+        return dict(entry[0]) if entry is not None else {}
+
+    def get(self, key: str, loads: Callable[[bytes], Any]) -> Any:
+        """Decodes the stored body and counts a hit, or returns MISSING"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISSING
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return loads(entry[1])
+
+    def store(
+        self,
+        key: str,
+        headers: Mapping[str, str],
+        content: bytes,
+        loads: Callable[[bytes], Any],
+    ) -> Any:
+        value = loads(content)
+
+        validators = {}
+        if headers.get("etag"):
+            validators["If-None-Match"] = headers["etag"]
+        if headers.get("last-modified"):
+            validators["If-Modified-Since"] = headers["last-modified"]
+
+        with self._lock:
+            self.misses += 1
+            if not validators:
+                self._entries.pop(key, None)
+                return value
+            self._entries[key] = (validators, bytes(content))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
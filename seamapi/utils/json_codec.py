@@ -0,0 +1,33 @@
+import json
+from dataclasses import dataclass
+from typing import Any, Callable, Union
+
+
+@dataclass(frozen=True)
+class JsonCodec:
+    """Encodes request payloads to bytes and decodes response bodies"""
+    name: str
+    dumps: Callable[[Any], bytes]
+    loads: Callable[[Union[bytes, str]], Any]
+
+
+def _stdlib_dumps(value: Any) -> bytes:
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+
+STDLIB_JSON_CODEC = JsonCodec(name="json", dumps=_stdlib_dumps, loads=json.loads)
+
+
+def get_orjson_codec() -> JsonCodec:
+    import orjson
+
+    return JsonCodec(name="orjson", dumps=orjson.dumps, loads=orjson.loads)
+
+
+def get_default_json_codec() -> JsonCodec:
+    # Prefer orjson when it is installed, it decodes large list responses
+    # several times faster
+    try:
+        return get_orjson_codec()
+    except ImportError:
+        return STDLIB_JSON_CODEC
@@ -0,0 +1,168 @@
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+
+def parse_timestamp(value: str) -> datetime:
+    # datetime.fromisoformat only accepts a trailing "Z" from Python 3.11
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def format_timestamp(value: datetime) -> str:
+    value = value.astimezone(timezone.utc)
+    return value.strftime("%Y-%m-%dT%H:%M:%S.") + f"{value.microsecond // 1000:03d}Z"
+
+
+class CreatedBeforeCursor:
+    """
+    Tracks position while walking a list endpoint that returns items newest
+    first and accepts `limit` and `created_before`.
+
+    `created_before` is exclusive, so the next page is requested from one
+    millisecond after the oldest item seen. Items sharing that timestamp come
+    back again and are dropped here. If a whole page shares one timestamp the
+    cursor steps past it, so only more than `page_size` items created in the
+    same millisecond can be missed.
+    """
+
+    def __init__(
+        self,
+        page_size: int,
+        id_key: str,
+        created_before: Optional[str] = None,
+    ):
+        self.page_size = page_size
+        self.id_key = id_key
+        self.created_before = created_before
+        self.done = False
+        self._boundary: Optional[str] = None
+        self._seen_at_boundary: Set[str] = set()
+
+    def advance(self, page: List[Any]) -> List[Any]:
+        """Records a fetched page and returns the items not yet returned."""
+
+        new_items = [
+            item
+            for item in page
+            if item.created_at != self._boundary
+            or getattr(item, self.id_key) not in self._seen_at_boundary
+        ]
+        if len(page) < self.page_size:
+            self.done = True
+            return new_items
+
+        oldest = page[-1].created_at
+        if oldest == self._boundary:
+            self.created_before = oldest
+            return new_items
+
+        self._boundary = oldest
+        self._seen_at_boundary = {
+            getattr(item, self.id_key) for item in page if item.created_at == oldest
+        }
+        self.created_before = format_timestamp(
+            parse_timestamp(oldest) + timedelta(milliseconds=1)
+        )
+        return new_items
+
+
+def time_windows(
+    since: str,
+    until: Optional[str] = None,
+    window: timedelta = timedelta(hours=1),
+) -> Iterator[Tuple[str, str]]:
+    """Splits [since, until] into consecutive `window`-sized ranges."""
+
+    start = parse_timestamp(since)
+    end = datetime.now(timezone.utc) if until is None else parse_timestamp(until)
+    while start < end:
+        stop = min(start + window, end)
+        yield format_timestamp(start), format_timestamp(stop)
+        start = stop
+
+
+TimeShard = Tuple[datetime, datetime]
+
+
+class TimeShards:
+    """
+    Bookkeeping for a backfill that fetches a time range as concurrent
+    shards.
+
+    Fetched shards are handed to `complete`. A shard that returned
+    `page_limit` items or more was probably truncated, so it is split in
+    two and the halves are returned to be fetched instead, unless it is
+    already shorter than `min_shard`. `ready` yields the items of finished
+    shards in time order as soon as every earlier shard is finished,
+    sorted by `created_at` and without the duplicates that both shards on
+    an inclusive edge return. `previous_ids` holds the ids of the last shard
+    yielded, and can be passed to the TimeShards of the next adjacent range.
+    """
+
+    def __init__(
+        self,
+        start: datetime,
+        end: datetime,
+        shards: int,
+        page_limit: int,
+        min_shard: timedelta,
+        id_key: str = "event_id",
+        previous_ids: Optional[Set[str]] = None,
+    ):
+        self.page_limit = page_limit
+        self.id_key = id_key
+        self.min_shard = min_shard
+        self.splits = 0
+        self.pending: List[TimeShard] = split_time_range(start, end, shards)
+        self._finished: Dict[TimeShard, List[Any]] = {}
+        self.previous_ids: Set[str] = previous_ids or set()
+
+    @property
+    def done(self) -> bool:
+        return not self.pending
+
+    def complete(self, shard: TimeShard, items: List[Any]) -> List[TimeShard]:
+        """Records a fetched shard and returns the shards still to fetch for it"""
+
+        start, end = shard
+        if len(items) >= self.page_limit and end - start > self.min_shard:
+            halves = split_time_range(start, end, 2)
+            index = self.pending.index(shard)
+            self.pending[index : index + 1] = halves
+            self.splits += 1
+            return halves
+
+        self._finished[shard] = sorted(
+            items, key=lambda item: parse_timestamp(item.created_at)
+        )
+        return []
+
+    def ready(self) -> Iterator[Any]:
+        while self.pending and self.pending[0] in self._finished:
+            items = self._finished.pop(self.pending.pop(0))
+            ids = set()
+            for item in items:
+                item_id = getattr(item, self.id_key)
+                ids.add(item_id)
+                if item_id not in self.previous_ids:
+                    yield item
+            self.previous_ids = ids
+
+
+def split_time_range(start: datetime, end: datetime, parts: int) -> List[TimeShard]:
+    """Splits [start, end] into `parts` equal ranges, whole milliseconds"""
+
+    step = (end - start) / max(parts, 1)
+    step -= timedelta(microseconds=step.microseconds % 1000)
+    # Ranges shorter than `parts` milliseconds get fewer, 1 ms parts
+    step = max(step, timedelta(milliseconds=1))
+    edges = [start + step * i for i in range(parts) if start + step * i < end]
+    edges.append(end)
+    return list(zip(edges, edges[1:])) or [(start, end)]
+
+
+def chunks(items: List[Any], size: int) -> Iterator[List[Any]]:
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
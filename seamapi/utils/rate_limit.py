@@ -0,0 +1,192 @@
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from typing import Dict, Optional
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """
+    Limits for one endpoint family.
+
+    rate is the sustained requests per second, burst the number of requests
+    that may be sent at once after a quiet period (defaults to `rate`, at
+    least 1), and max_in_flight the number of concurrent requests. Any of
+    them can be None for no limit.
+    """
+    rate: Optional[float] = None
+    burst: Optional[float] = None
+    max_in_flight: Optional[int] = None
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket. `reserve` takes a token immediately and
+    returns how long the caller has to wait before using it, so waiting
+    happens outside the lock and works for both threads and coroutines.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = burst if burst is not None else max(rate, 1)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated_at) * self.rate
+            )
+            self._updated_at = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+
+class _InFlight:
+    """
+    Counts requests in flight against `limit`, shared by threads and every
+    event loop. Threads block on a condition, coroutines try without
+    blocking and back off with asyncio.sleep.
+    """
+
+    def __init__(self, limit: int):
+        if limit < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        self.limit = limit
+        self.count = 0
+        self._condition = threading.Condition()
+
+    def acquire(self) -> None:
+        with self._condition:
+            while self.count >= self.limit:
+                self._condition.wait()
+            self.count += 1
+
+    def try_acquire(self) -> bool:
+        with self._condition:
+            if self.count >= self.limit:
+                return False
+            self.count += 1
+            return True
+
+    def release(self) -> None:
+        with self._condition:
+            self.count -= 1
+            self._condition.notify()
+
+
+class _Family:
+    def __init__(self, limit: RateLimit):
+        self.bucket = (
+            TokenBucket(limit.rate, limit.burst) if limit.rate is not None else None
+        )
+        self.in_flight = (
+            _InFlight(limit.max_in_flight)
+            if limit.max_in_flight is not None
+            else None
+        )
+
+
+class RateLimiter:
+    """
+    Client-side rate and concurrency limits per endpoint family.
+
+    Families are glob patterns matched against the request path, e.g.
+    "/access_codes/*" or "/action_attempts/get". The first matching pattern
+    wins, and paths matching none use `default`. One limiter can be shared
+    by several clients, sync and async alike: threads and coroutines draw
+    from the same token buckets and in-flight counts.
+
+    ...
+
+    Methods
+    -------
+    acquire(path)
+        Context manager that blocks the thread until a request may be sent
+    acquire_async(path)
+        Async context manager that waits until a request may be sent
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, RateLimit]] = None,
+        default: Optional[RateLimit] = None,
+    ):
+        """
+        Parameters
+        ----------
+        limits : Dict[str, RateLimit], optional
+          Limits keyed by path pattern
+        default : RateLimit, optional
+          Limits for paths that match no pattern. Defaults to None (no limit).
+        """
+        self._patterns = [
+            (pattern, _Family(limit)) for pattern, limit in (limits or {}).items()
+        ]
+        self._default = _Family(default) if default is not None else None
+        self._families: Dict[str, Optional[_Family]] = {}
+
+    def _family(self, path: str) -> Optional[_Family]:
+        try:
+            return self._families[path]
+        except KeyError:
+            pass
+        family = self._default
+        for pattern, candidate in self._patterns:
+            if fnmatchcase(path, pattern):
+                family = candidate
+                break
+        self._families[path] = family
+        return family
+
+    @contextmanager
+    def acquire(self, path: str):
+        family = self._family(path)
+        if family is None:
+            yield
+            return
+
+        if family.in_flight is not None:
+            family.in_flight.acquire()
+        try:
+            if family.bucket is not None:
+                delay = family.bucket.reserve()
+                if delay:
+                    time.sleep(delay)
+            yield
+        finally:
+            if family.in_flight is not None:
+                family.in_flight.release()
+
+    @asynccontextmanager
+    async def acquire_async(self, path: str):
+        # Imported here so sync-only clients don't load asyncio
+        import asyncio
+
+        family = self._family(path)
+        if family is None:
+            yield
+            return
+
+        if family.in_flight is not None:
+            backoff = 0.001
+            while not family.in_flight.try_acquire():
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 0.05)
+        try:
+            if family.bucket is not None:
+                delay = family.bucket.reserve()
+                if delay:
+                    await asyncio.sleep(delay)
+            yield
+        finally:
+            if family.in_flight is not None:
+                family.in_flight.release()
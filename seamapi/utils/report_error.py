@@ -14,3 +14,17 @@ def report_error(f):
 
       raise error
   return wrapper
+
+"""
+Coroutine counterpart of `report_error` for the async route classes.
+"""
+def report_error_async(f):
+  async def wrapper(self, *args, **kwargs):
+    try:
+      return await f(self, *args, **kwargs)
+    except Exception as error:
+      if self.seam.should_report_exceptions and type(error) is not SeamApiException:
+        self.seam.sentry_client.capture_exception(error)
+
+      raise error
+  return wrapper
@@ -0,0 +1,173 @@
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Collection, Optional
+
+from seamapi.utils.backoff import apply_jitter
+
+IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "OPTIONS", "PUT", "DELETE"])
+RETRYABLE_STATUSES = frozenset([429, 502, 503, 504])
+
+
+@dataclass
+class RetryEvent:
+    """Passed to `RetryPolicy.on_retry` before each retry"""
+    method: str
+    url: str
+    attempt: int
+    delay: float
+    status_code: Optional[int] = None
+    error: Optional[BaseException] = None
+
+
+class RetryPolicy:
+    """
+    Decides whether a failed request is retried and how long to wait first.
+
+    Only idempotent methods are retried by default, on 429/502/503/504 and
+    on connection errors. Waits grow exponentially with jitter so clients
+    that failed together don't retry together, and a Retry-After header
+    from the server takes precedence. Retries stop after `max_attempts`
+    or when the next attempt would start after `total_timeout`.
+
+    ...
+
+    Attributes
+    ----------
+    retries : int
+        Number of retries scheduled so far
+
+    Methods
+    -------
+    deadline()
+        Gets the monotonic deadline for a new call
+    next_delay(method, url, attempt, deadline, status_code=None, retry_after=None, error=None)
+        Gets the delay before the next attempt, or None to give up
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        retry_methods: Collection[str] = IDEMPOTENT_METHODS,
+        retry_statuses: Collection[int] = RETRYABLE_STATUSES,
+        initial_backoff: float = 0.5,
+        max_backoff: float = 30,
+        backoff_factor: float = 2.0,
+        jitter: float = 0.5,
+        max_retry_after: float = 120,
+        timeout: Optional[float] = None,
+        total_timeout: Optional[float] = None,
+        on_retry: Optional[Callable[[RetryEvent], None]] = None,
+    ):
+        """
+        Parameters
+        ----------
+        max_attempts : int, optional
+          Total attempts per call including the first. Defaults to 4.
+        retry_methods : Collection[str], optional
+          HTTP methods that may be retried. Defaults to the idempotent ones.
+        retry_statuses : Collection[int], optional
+          Status codes that are retried. Defaults to 429, 502, 503 and 504.
+        initial_backoff : float, optional
+          Seconds to wait before the first retry. Defaults to 0.5.
+        max_backoff : float, optional
+          Upper bound for the exponential wait. Defaults to 30.
+        backoff_factor : float, optional
+          Growth of the wait per retry. Defaults to 2.
+        jitter : float, optional
+          Random spread of each wait as a fraction of it. Defaults to 0.5.
+        max_retry_after : float, optional
+          Longest Retry-After that is honoured. Longer ones are not
+          retried. Defaults to 120.
+        timeout : float, optional
+          Per-attempt timeout in seconds. Defaults to None (no timeout).
+        total_timeout : float, optional
+          Seconds after which no new attempt is started for a call.
+          Defaults to None (no deadline).
+        on_retry : Callable[[RetryEvent], None], optional
+          Called before each retry, e.g. to log or emit metrics
+        """
+        self.max_attempts = max_attempts
+        self.retry_methods = frozenset(m.upper() for m in retry_methods)
+        self.retry_statuses = frozenset(retry_statuses)
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.backoff_factor = backoff_factor
+        self.jitter = jitter
+        self.max_retry_after = max_retry_after
+        self.timeout = timeout
+        self.total_timeout = total_timeout
+        self.on_retry = on_retry
+        self.retries = 0
+
+    def deadline(self) -> Optional[float]:
+        if self.total_timeout is None:
+            return None
+        return time.monotonic() + self.total_timeout
+
+    def next_delay(
+        self,
+        method: str,
+        url: str,
+        attempt: int,
+        deadline: Optional[float],
+        status_code: Optional[int] = None,
+        retry_after: Optional[str] = None,
+        error: Optional[BaseException] = None,
+    ) -> Optional[float]:
+        """
+        Returns the seconds to wait before retrying after `attempt` failed
+        with `status_code` or `error`, or None if the call should not be
+        retried.
+        """
+        if attempt >= self.max_attempts or method.upper() not in self.retry_methods:
+            return None
+        if error is None and status_code not in self.retry_statuses:
+            return None
+
+        delay = apply_jitter(
+            min(
+                self.initial_backoff * self.backoff_factor ** (attempt - 1),
+                self.max_backoff,
+            ),
+            self.jitter,
+        )
+        if retry_after is not None:
+            requested = parse_retry_after(retry_after)
+            if requested is not None:
+                if requested > self.max_retry_after:
+                    return None
+                delay = requested
+
+        if deadline is not None and time.monotonic() + delay > deadline:
+            return None
+
+        self.retries += 1
+        if self.on_retry is not None:
+            self.on_retry(
+                RetryEvent(
+                    method=method,
+                    url=url,
+                    attempt=attempt,
+                    delay=delay,
+                    status_code=status_code,
+                    error=error,
+                )
+            )
+        return delay
+
+
+def parse_retry_after(value: str) -> Optional[float]:
+    """Parses a Retry-After header given in seconds or as an HTTP date"""
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
@@ -0,0 +1,92 @@
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import asyncio
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Runs at most one call per key at a time. Threads asking for a key that
+    is already in flight wait for that call and receive its result (or
+    exception) instead of running their own.
+
+    ...
+
+    Attributes
+    ----------
+    shared : int
+        Number of calls that were served by another call in flight
+    """
+
+    def __init__(self):
+        self.shared = 0
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+            else:
+                self.shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+
+class AsyncSingleFlight:
+    """
+    Asyncio counterpart of SingleFlight. The shared call runs in its own
+    task, so cancelling one waiter doesn't cancel it for the others.
+
+    ...
+
+    Attributes
+    ----------
+    shared : int
+        Number of calls that were served by another call in flight
+    """
+
+    def __init__(self):
+        self.shared = 0
+        self._tasks: Dict[Hashable, "asyncio.Future[Any]"] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        # Imported here so sync-only clients don't load asyncio
+        import asyncio
+
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._tasks[key] = task
+            task.add_done_callback(lambda _: self._tasks.pop(key, None))
+        else:
+            self.shared += 1
+        return await asyncio.shield(task)
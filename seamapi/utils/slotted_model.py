@@ -0,0 +1,148 @@
+import abc
+import json
+from dataclasses import MISSING, dataclass, fields, is_dataclass
+
+
+def slotted_model(cls):
+    """
+    Turns a class into a slotted dataclass with specialised ``from_dict`` and
+    ``to_dict`` methods.
+
+    The methods are generated once per class with the field names inlined,
+    so decoding an API response is a single constructor call instead of the
+    per-field type introspection done by dataclasses-json. Fields typed as
+    another slotted model (optionally wrapped in ``Optional``) are decoded
+    and encoded recursively. Unknown keys are ignored, missing keys fall
+    back to the field default and raise ``TypeError`` for required fields,
+    like dataclasses-json did. ``schema()`` still builds the marshmallow
+    schema when dataclasses-json is installed.
+    """
+    cls = add_slots(dataclass(cls))
+    model_fields = fields(cls)
+
+    namespace = {"MISSING": MISSING}
+    from_dict_args = []
+    to_dict_items = []
+    for index, field in enumerate(model_fields):
+        name = field.name
+        nested = _nested_model(field.type)
+        if field.default is not MISSING:
+            namespace[f"_dflt_{index}"] = field.default
+            value = f"d.get({name!r}, _dflt_{index})"
+        elif field.default_factory is not MISSING:
+            namespace[f"_dflt_{index}"] = field.default_factory
+            value = f"(d[{name!r}] if {name!r} in d else _dflt_{index}())"
+        else:
+            value = f"d[{name!r}]"
+
+        if nested is None:
+            from_dict_args.append(f"{name}={value}")
+            to_dict_items.append(f"{name!r}: self.{name}")
+        else:
+            namespace[f"_model_{index}"] = nested
+            from_dict_args.append(
+                f"{name}=_decode(_model_{index}, {value})"
+            )
+            to_dict_items.append(
+                f"{name!r}: None if self.{name} is None else self.{name}.to_dict()"
+            )
+
+    namespace["_decode"] = _decode
+    namespace["_missing_key"] = _missing_key
+    source = (
+        "def from_dict(cls, d, infer_missing=False):\n"
+        "    if infer_missing:\n"
+        "        d = {**cls._required_as_none, **d}\n"
+        "    try:\n"
+        f"        return cls({', '.join(from_dict_args)})\n"
+        "    except KeyError as e:\n"
+        "        raise _missing_key(cls, e) from None\n"
+        "def to_dict(self, encode_json=False):\n"
+        f"    return {{{', '.join(to_dict_items)}}}\n"
+    )
+    exec(source, namespace)
+
+    cls._required_as_none = {
+        field.name: None
+        for field in model_fields
+        if field.default is MISSING and field.default_factory is MISSING
+    }
+    cls.from_dict = classmethod(namespace["from_dict"])
+    cls.to_dict = namespace["to_dict"]
+    cls.from_json = classmethod(_from_json)
+    cls.to_json = _to_json
+    cls.schema = classmethod(_schema)
+    return cls
+
+
+def _decode(model, value):
+    if value is None or isinstance(value, model):
+        return value
+    return model.from_dict(value)
+
+
+def _missing_key(cls, error):
+    return TypeError(
+        f"{cls.__name__}.from_dict() missing required key: {error.args[0]!r}"
+    )
+
+
+def _from_json(cls, s, **kwargs):
+    return cls.from_dict(json.loads(s, **kwargs))
+
+
+def _to_json(self, **kwargs):
+    return json.dumps(self.to_dict(), **kwargs)
+
+
+def _schema(cls, *, infer_missing=False, partial=False, **kwargs):
+    # The marshmallow schema needs dataclasses-json, which is no longer a
+    # dependency of the SDK
+    try:
+        from dataclasses_json.mm import build_schema
+    except ImportError:
+        raise ImportError(
+            f"{cls.__name__}.schema() requires dataclasses-json, "
+            "install it with `pip install dataclasses-json`"
+        ) from None
+    Schema = build_schema(cls, _SlottedModels, infer_missing, partial)
+    return Schema(partial=partial, **kwargs)
+
+
+class _SlottedModels(abc.ABC):
+    # Stands in for DataClassJsonMixin in build_schema, so nested slotted
+    # models get a nested schema
+    @classmethod
+    def __subclasshook__(cls, subclass):
+        return hasattr(subclass, "_required_as_none") or NotImplemented
+
+
+def _nested_model(field_type):
+    # Unwrap Optional[Model] / Union[Model, None]
+    candidates = getattr(field_type, "__args__", None) or (field_type,)
+    for candidate in candidates:
+        if isinstance(candidate, type) and is_dataclass(candidate) and hasattr(
+            candidate, "_required_as_none"
+        ):
+            return candidate
+    return None
+
+
+def add_slots(cls):
+    # Equivalent of dataclass(slots=True), which needs Python 3.10
+    inherited = set()
+    for base in cls.__mro__[1:]:
+        inherited.update(getattr(base, "__slots__", ()))
+
+    field_names = tuple(
+        field.name for field in fields(cls) if field.name not in inherited
+    )
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__slots__"] = field_names
+    for name in field_names:
+        # Defaults already live in the generated __init__
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
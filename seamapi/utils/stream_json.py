@@ -0,0 +1,55 @@
+"""
+Incremental decoding of JSON arrays in response bodies, so each element can be
+turned into a model as soon as it is parsed instead of after the whole body
+has been buffered. Requires the optional `ijson` package.
+"""
+from typing import Any, AsyncIterator, Iterator
+
+
+def require_ijson():
+    try:
+        import ijson
+    except ImportError:
+        raise ImportError(
+            "Streaming list responses requires ijson. "
+            "Install it with `pip install seamapi[streaming]`."
+        )
+    return ijson
+
+
+def iter_json_items(response, prefix: str) -> Iterator[Any]:
+    """
+    Yields the items at `prefix` (e.g. "devices.item") of a streamed
+    requests.Response
+    """
+    ijson = require_ijson()
+    response.raw.decode_content = True
+    try:
+        yield from ijson.items(response.raw, prefix, use_float=True)
+    finally:
+        response.close()
+
+
+class _AsyncByteReader:
+    def __init__(self, response):
+        self._chunks = response.aiter_bytes()
+
+    async def read(self, size: int = -1) -> bytes:
+        # ijson probes the stream type with read(0), which must not consume a chunk
+        if size == 0:
+            return b""
+        try:
+            return await self._chunks.__anext__()
+        except StopAsyncIteration:
+            return b""
+
+
+async def aiter_json_items(response, prefix: str) -> AsyncIterator[Any]:
+    """Yields the items at `prefix` of a streamed httpx.Response"""
+    ijson = require_ijson()
+    try:
+        items = ijson.items(_AsyncByteReader(response), prefix, use_float=True)
+        async for item in items:
+            yield item
+    finally:
+        await response.aclose()
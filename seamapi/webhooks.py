@@ -1,12 +1,29 @@
 from seamapi.types import (
     AbstractSeam as Seam,
     AbstractWebhooks,
+    Event,
     Webhook,
     WebhookId,
+    WebhookVerificationException,
 )
+import base64
+import binascii
+import hashlib
+import hmac
 import time
-from typing import List, Union, Optional, cast
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    List,
+    Mapping,
+    Tuple,
+    Union,
+    Optional,
+    cast,
+)
 import requests
+from seamapi.utils.json_codec import JsonCodec, get_default_json_codec
 from seamapi.utils.convert_to_id import (
     to_connect_webview_id,
     to_connected_account_id,
@@ -169,3 +186,198 @@ class Webhooks(AbstractWebhooks):
         )
 
         return [Webhook.from_dict(w) for w in res["webhooks"]]
+
+
+WebhookBody = Union[bytes, bytearray, memoryview, str]
+
+
+class WebhookReceiver:
+    """
+    Verifies and parses webhook deliveries sent by Seam.
+
+    Deliveries are signed with the `secret` of the Webhook: the
+    ``svix-signature`` (or ``webhook-signature``) header holds base64
+    HMAC-SHA256 signatures of ``"{id}.{timestamp}.{body}"``, compared in
+    constant time. Deliveries whose timestamp is further than `tolerance`
+    seconds from now are rejected to prevent replays.
+
+    The key is decoded once and the keyed HMAC state is reused for every
+    delivery, and bodies are hashed and decoded without being copied, so
+    one receiver can be shared across threads for high-volume ingestion.
+
+    ...
+
+    Methods
+    -------
+    verify(headers, body)
+        Checks the signature and timestamp of a delivery
+    parse(headers, body)
+        Verifies a delivery and returns its Event
+    parse_many(deliveries)
+        Verifies and parses a batch of deliveries
+    """
+
+    def __init__(
+        self,
+        secret: Union[str, Webhook],
+        tolerance: float = 300,
+        json_codec: Optional[JsonCodec] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Parameters
+        ----------
+        secret : str or Webhook
+          Signing secret returned on the Webhook, usually prefixed "whsec_"
+        tolerance : float, optional
+          Maximum age (and clock skew) of a delivery in seconds. Defaults to 300.
+        json_codec : JsonCodec, optional
+          Codec used to decode bodies. Defaults to orjson when it is
+          installed, otherwise the standard library json.
+        clock : Callable[[], float], optional
+          Wall clock returning unix seconds, replaceable in tests
+
+        Raises
+        ------
+        ValueError
+            If the secret is not valid base64.
+        """
+        if isinstance(secret, Webhook):
+            secret = secret.secret
+        if secret.startswith("whsec_"):
+            secret = secret[len("whsec_") :]
+        try:
+            key = base64.b64decode(secret, validate=True)
+        except binascii.Error:
+            raise ValueError("Webhook secret is not valid base64")
+
+        self.tolerance = tolerance
+        self.json_codec = json_codec or get_default_json_codec()
+        self.clock = clock
+        self._hmac = hmac.new(key, digestmod=hashlib.sha256)
+
+    def _signature(self, message_id: str, timestamp: str, body: WebhookBody) -> bytes:
+        mac = self._hmac.copy()
+        mac.update(f"{message_id}.{timestamp}.".encode())
+        mac.update(body.encode() if isinstance(body, str) else body)
+        return base64.b64encode(mac.digest())
+
+    def _verify(
+        self, headers: Mapping[str, str], body: WebhookBody, now: float
+    ) -> None:
+        headers = _normalize_headers(headers)
+        message_id = headers.get("svix-id") or headers.get("webhook-id")
+        timestamp = headers.get("svix-timestamp") or headers.get("webhook-timestamp")
+        signatures = headers.get("svix-signature") or headers.get(
+            "webhook-signature"
+        )
+        if not message_id or not timestamp or not signatures:
+            raise WebhookVerificationException(
+                "Missing signature headers", message_id
+            )
+
+        try:
+            sent_at = int(timestamp)
+        except ValueError:
+            raise WebhookVerificationException("Invalid timestamp", message_id)
+        if abs(now - sent_at) > self.tolerance:
+            raise WebhookVerificationException(
+                "Timestamp outside the tolerance window", message_id
+            )
+
+        expected = self._signature(message_id, timestamp, body)
+        for signature in signatures.split(" "):
+            version, _, value = signature.partition(",")
+            if version == "v1" and hmac.compare_digest(expected, value.encode()):
+                return
+        raise WebhookVerificationException("No matching signature", message_id)
+
+    def _parse(self, body: WebhookBody) -> Event:
+        # orjson decodes memoryviews in place, the stdlib needs bytes
+        if isinstance(body, memoryview) and self.json_codec.name != "orjson":
+            body = body.tobytes()
+        try:
+            payload = self.json_codec.loads(body)
+        except ValueError as error:
+            raise WebhookVerificationException(f"Invalid JSON: {error}")
+        if isinstance(payload, dict) and isinstance(payload.get("event"), dict):
+            payload = payload["event"]
+        if not isinstance(payload, dict) or "event_id" not in payload:
+            raise WebhookVerificationException("Body is not an event")
+        return Event.from_dict(payload)
+
+    def verify(self, headers: Mapping[str, str], body: WebhookBody) -> None:
+        """Checks the signature and timestamp of a delivery.
+
+        Parameters
+        ----------
+        headers : Mapping[str, str]
+            Request headers, in any case
+        body : bytes or str
+            Raw request body, exactly as received
+
+        Raises
+        ------
+        WebhookVerificationException
+            If a header is missing, the timestamp is outside the tolerance
+            window or no signature matches.
+        """
+        self._verify(headers, body, self.clock())
+
+    def parse(self, headers: Mapping[str, str], body: WebhookBody) -> Event:
+        """Verifies a delivery and returns its event.
+
+        Parameters
+        ----------
+        headers : Mapping[str, str]
+            Request headers, in any case
+        body : bytes or str
+            Raw request body, exactly as received
+
+        Raises
+        ------
+        WebhookVerificationException
+            If the delivery can't be verified or isn't an event.
+
+        Returns
+        ------
+            Event
+        """
+        self._verify(headers, body, self.clock())
+        return self._parse(body)
+
+    def parse_many(
+        self, deliveries: Iterable[Tuple[Mapping[str, str], WebhookBody]]
+    ) -> List[Union[Event, WebhookVerificationException]]:
+        """Verifies and parses a batch of deliveries.
+
+        The clock is read once for the whole batch, and a rejected delivery
+        doesn't stop the others.
+
+        Parameters
+        ----------
+        deliveries : Iterable[Tuple[Mapping[str, str], bytes or str]]
+            (headers, body) pairs
+
+        Returns
+        ------
+            A list in the order of `deliveries` holding the Event of each
+            valid delivery, or the WebhookVerificationException explaining
+            why it was rejected.
+        """
+        now = self.clock()
+        results: List[Union[Event, WebhookVerificationException]] = []
+        for headers, body in deliveries:
+            try:
+                self._verify(headers, body, now)
+                results.append(self._parse(body))
+            except WebhookVerificationException as error:
+                results.append(error)
+        return results
+
+
+def _normalize_headers(headers: Mapping[str, Any]) -> Mapping[str, Any]:
+    if isinstance(headers, dict) and all(key.islower() for key in headers):
+        return headers
+    return {key.lower(): value for key, value in headers.items()}
+
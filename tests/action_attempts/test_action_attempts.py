@@ -1,4 +1,13 @@
+import threading
+import time
+import pytest
+import responses
 from seamapi import Seam
+from seamapi.types import (
+    ActionAttemptsNotFoundException,
+    ActionAttemptTimeoutException,
+)
+from seamapi.utils.completion_broker import CompletionBroker
 from tests.fixtures.run_august_factory import run_august_factory
 
 
@@ -16,3 +25,129 @@ def test_action_attempts(seam: Seam):
 
     polled_action_attempt = seam.action_attempts.poll_until_ready(delete_action_attempt)
     assert polled_action_attempt is not None
+
+
+def pending_then_success_responses(seam: Seam, pending_count: int):
+    action_attempt = {
+        "action_attempt_id": "aa_1",
+        "action_type": "LOCK_DOOR",
+        "status": "pending",
+        "result": None,
+        "error": None,
+    }
+    for _ in range(pending_count):
+        responses.add(
+            "GET",
+            seam.api_url + "/action_attempts/get",
+            json={"action_attempt": action_attempt},
+        )
+    responses.add(
+        "GET",
+        seam.api_url + "/action_attempts/get",
+        json={"action_attempt": {**action_attempt, "status": "success"}},
+    )
+
+
+@responses.activate
+def test_poll_until_ready_backs_off(seam: Seam):
+    pending_then_success_responses(seam, pending_count=3)
+
+    action_attempt = seam.action_attempts.poll_until_ready(
+        "aa_1", poll_interval=0.01, max_poll_interval=0.02
+    )
+
+    assert action_attempt.status == "success"
+    assert len(responses.calls) == 4
+
+
+@responses.activate
+def test_poll_until_ready_times_out(seam: Seam):
+    pending_then_success_responses(seam, pending_count=100)
+
+    with pytest.raises(ActionAttemptTimeoutException) as error:
+        seam.action_attempts.poll_until_ready(
+            "aa_1", timeout=0.05, poll_interval=0.01, max_poll_interval=0.01
+        )
+
+    assert error.value.action_attempt_id == "aa_1"
+
+
+@responses.activate
+def test_poll_until_ready_wakes_on_webhook_event(seam: Seam):
+    pending_then_success_responses(seam, pending_count=1)
+    broker = CompletionBroker(fallback_interval=60)
+    client = Seam(
+        api_key=seam.api_key, api_url=seam.api_url, completion_broker=broker
+    )
+
+    deliver = threading.Timer(
+        0.05,
+        broker.handle_event,
+        [{"event_type": "lock.locked", "action_attempt_id": "aa_1"}],
+    )
+    deliver.start()
+    start = time.monotonic()
+    action_attempt = client.action_attempts.poll_until_ready("aa_1")
+
+    assert action_attempt.status == "success"
+    assert time.monotonic() - start < 5
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_wait_for_many_polls_only_pending(seam: Seam):
+    def action_attempt(action_attempt_id, status):
+        return {
+            "action_attempt_id": action_attempt_id,
+            "action_type": "LOCK_DOOR",
+            "status": status,
+            "result": {},
+            "error": None,
+        }
+
+    responses.add(
+        "GET",
+        seam.api_url + "/action_attempts/list",
+        json={
+            "action_attempts": [
+                action_attempt("aa_1", "success"),
+                action_attempt("aa_2", "pending"),
+            ]
+        },
+    )
+    responses.add(
+        "GET",
+        seam.api_url + "/action_attempts/list",
+        json={"action_attempts": [action_attempt("aa_2", "success")]},
+    )
+
+    finished = list(
+        seam.action_attempts.wait_for_many(["aa_1", "aa_2"], poll_interval=0.01)
+    )
+
+    assert [aa.action_attempt_id for aa in finished] == ["aa_1", "aa_2"]
+    assert len(responses.calls) == 2
+    assert "aa_1" not in responses.calls[1].request.url
+
+
+@responses.activate
+def test_wait_for_many_raises_for_unknown_ids(seam: Seam):
+    responses.add(
+        "GET",
+        seam.api_url + "/action_attempts/list",
+        json={
+            "action_attempts": [
+                {
+                    "action_attempt_id": "aa_1",
+                    "action_type": "LOCK_DOOR",
+                    "status": "pending",
+                    "result": None,
+                    "error": None,
+                }
+            ]
+        },
+    )
+
+    with pytest.raises(ActionAttemptsNotFoundException) as error:
+        list(seam.action_attempts.wait_for_many(["aa_1", "aa_missing"], timeout=None))
+    assert error.value.action_attempt_ids == ["aa_missing"]
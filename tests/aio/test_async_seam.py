@@ -0,0 +1,331 @@
+import asyncio
+import json
+from datetime import timedelta
+import httpx
+from seamapi.aio import AsyncSeam
+from seamapi.types import Device, DevicesNotFoundException, SeamApiException
+from seamapi.utils.completion_broker import CompletionBroker
+from seamapi.utils.event_sync import AsyncEventSync, MemoryCheckpointStore
+from seamapi.utils.http_cache import HttpCache
+
+
+async def mock_seam(seam_backend, handler, **kwargs) -> AsyncSeam:
+    seam = AsyncSeam(
+        api_url=seam_backend.url, api_key=seam_backend.sandbox_api_key, **kwargs
+    )
+    # Close the pooled client before swapping in the mock transport
+    await seam.client.aclose()
+    seam.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return seam
+
+
+def test_async_seam_routes(seam_backend, device_dict):
+    def handler(request: httpx.Request):
+        if request.url.path == "/devices/list":
+            return httpx.Response(200, json={"devices": [device_dict()]})
+        return httpx.Response(
+            404, json={"error": {"type": "device_not_found"}}
+        )
+
+    async def run():
+        async with await mock_seam(seam_backend, handler) as seam:
+            devices, _ = await asyncio.gather(
+                seam.devices.list(), seam.devices.list()
+            )
+            assert type(devices[0]) is Device
+            assert devices[0].properties.locked == True
+
+            try:
+                await seam.devices.get(name="foo")
+                assert False
+            except SeamApiException as error:
+                assert error.status_code == 404
+                assert error.metadata["type"] == "device_not_found"
+
+    asyncio.run(run())
+
+
+def test_async_conditional_get(seam_backend, device_dict):
+    evicting = []
+
+    def handler(request: httpx.Request):
+        if request.headers.get("If-None-Match") == '"v1"':
+            for http_cache in evicting:
+                http_cache.clear()
+            return httpx.Response(304)
+        return httpx.Response(
+            200, json={"devices": [device_dict()]}, headers={"ETag": '"v1"'}
+        )
+
+    async def run():
+        async with await mock_seam(
+            seam_backend,
+            handler,
+            http_cache=HttpCache(),
+        ) as seam:
+            first = await seam.devices.list()
+            second = await seam.devices.list()
+
+            assert second[0].device_id == first[0].device_id
+            assert seam.http_cache.hits == 1
+
+            # A 304 for an entry evicted in the meantime fetches the body again
+            evicting.append(seam.http_cache)
+            third = await seam.devices.list()
+            assert third[0].device_id == first[0].device_id
+
+    asyncio.run(run())
+
+
+def test_async_coalesces_identical_gets(seam_backend, device_dict):
+    calls = []
+
+    async def handler(request: httpx.Request):
+        calls.append(request.url.path)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"device": device_dict()})
+
+    async def run():
+        async with await mock_seam(
+            seam_backend,
+            handler,
+            coalesce_requests=True,
+        ) as seam:
+            first, second = await asyncio.gather(
+                seam.devices.get("device_1"), seam.devices.get("device_1")
+            )
+            assert first == second and first is not second
+            await seam.devices.get("device_1")
+
+    asyncio.run(run())
+    assert len(calls) == 2
+
+
+def test_async_get_many_and_batched_gets(seam_backend, device_dict):
+    calls = []
+
+    def handler(request: httpx.Request):
+        device_ids = request.url.params.get_list("device_ids")
+        calls.append(device_ids)
+        return httpx.Response(
+            200,
+            json={
+                "devices": [
+                    device_dict(device_id)
+                    for device_id in device_ids
+                    if device_id != "missing"
+                ]
+            },
+        )
+
+    async def run():
+        async with await mock_seam(
+            seam_backend,
+            handler,
+            device_get_batch_window=0.01,
+        ) as seam:
+            devices = await seam.devices.get_many(
+                ["d_1", "d_2", "d_3"], batch_size=2
+            )
+            assert [d.device_id for d in devices] == ["d_1", "d_2", "d_3"]
+
+            devices = await asyncio.gather(
+                seam.devices.get("d_4"),
+                seam.devices.get("d_5"),
+                seam.devices.get("d_4"),
+            )
+            assert [d.device_id for d in devices] == ["d_4", "d_5", "d_4"]
+            assert devices[0] == devices[2]
+            assert devices[0] is not devices[2]
+
+            try:
+                await seam.devices.get("missing")
+                assert False
+            except DevicesNotFoundException as error:
+                assert error.device_ids == ["missing"]
+
+    asyncio.run(run())
+    assert sorted(calls) == [["d_1", "d_2"], ["d_3"], ["d_4", "d_5"], ["missing"]]
+
+
+def test_async_bulk_map(seam_backend):
+    def handler(request: httpx.Request):
+        device_id = json.loads(request.content)["device_id"]
+        if device_id == "device_missing":
+            return httpx.Response(
+                404, json={"error": {"type": "device_not_found"}}
+            )
+        return httpx.Response(
+            200,
+            json={
+                "action_attempt": {
+                    "action_attempt_id": "aa_" + device_id,
+                    "action_type": "UNLOCK_DOOR",
+                    "status": "pending",
+                    "result": None,
+                    "error": None,
+                }
+            },
+        )
+
+    async def run():
+        async with await mock_seam(seam_backend, handler) as seam:
+            device_ids = ["device_1", "device_missing", "device_2"]
+            results = await seam.bulk.map(
+                seam.locks.unlock_door,
+                device_ids,
+                max_workers=2,
+                wait_for_action_attempt=False,
+            )
+
+            assert [r.item for r in results] == device_ids
+            assert [r.ok for r in results] == [True, False, True]
+            assert results[2].value.action_attempt_id == "aa_device_2"
+            assert results[1].error.status_code == 404
+
+    asyncio.run(run())
+
+
+def test_async_poll_until_ready_wakes_on_webhook_event(seam_backend):
+    polls = []
+
+    def handler(request: httpx.Request):
+        polls.append(request)
+        return httpx.Response(
+            200,
+            json={
+                "action_attempt": {
+                    "action_attempt_id": "aa_1",
+                    "action_type": "LOCK_DOOR",
+                    "status": "pending" if len(polls) == 1 else "success",
+                    "result": None,
+                    "error": None,
+                }
+            },
+        )
+
+    broker = CompletionBroker(fallback_interval=60)
+
+    async def run():
+        async with await mock_seam(
+            seam_backend,
+            handler,
+            completion_broker=broker,
+        ) as seam:
+            asyncio.get_running_loop().call_later(
+                0.05, broker.handle_event, {"action_attempt_id": "aa_1"}
+            )
+            action_attempt = await asyncio.wait_for(
+                seam.action_attempts.poll_until_ready("aa_1"), timeout=5
+            )
+
+            assert action_attempt.status == "success"
+            assert len(polls) == 2
+
+    asyncio.run(run())
+
+
+def test_async_event_sync(seam_backend):
+    pages = [
+        [
+            {"event_id": "evt_2", "created_at": "2023-01-01T00:00:02.000Z"},
+            {"event_id": "evt_1", "created_at": "2023-01-01T00:00:01.000Z"},
+        ],
+        [
+            {"event_id": "evt_2", "created_at": "2023-01-01T00:00:02.000Z"},
+            {"event_id": "evt_3", "created_at": "2023-01-01T00:00:03.000Z"},
+        ],
+    ]
+    since = []
+
+    def handler(request: httpx.Request):
+        since.append(request.url.params["since"])
+        return httpx.Response(200, json={"events": pages[len(since) - 1]})
+
+    store = MemoryCheckpointStore()
+
+    async def run():
+        async with await mock_seam(seam_backend, handler) as seam:
+            sync = AsyncEventSync(seam, store, since="2023-01-01T00:00:00.000Z")
+            events = [e.event_id async for e in sync.tail(interval=0, max_polls=2)]
+
+            assert events == ["evt_1", "evt_2", "evt_3"]
+            assert since[1] == "2023-01-01T00:00:02.000Z"
+            assert store.checkpoint.created_at == "2023-01-01T00:00:03.000Z"
+
+    asyncio.run(run())
+
+
+def test_async_event_sync_walks_full_pages(seam_backend):
+    events = [
+        {"event_id": f"evt_{i}", "created_at": f"2023-01-01T00:00:{i:02d}.000Z"}
+        for i in range(1, 6)
+    ]
+
+    def handler(request: httpx.Request):
+        start, end = request.url.params.get_list("between") or [
+            request.url.params["since"],
+            "9999",
+        ]
+        # Newest first, cut to the page size
+        page = [e for e in reversed(events) if start <= e["created_at"] <= end][:2]
+        return httpx.Response(200, json={"events": page})
+
+    async def run():
+        async with await mock_seam(seam_backend, handler) as seam:
+            sync = AsyncEventSync(
+                seam, since="2023-01-01T00:00:00.000Z", page_limit=2
+            )
+            polled = [e.event_id for e in await sync.poll()]
+
+            assert polled == [e["event_id"] for e in events]
+
+    asyncio.run(run())
+
+
+def test_async_events_backfill(seam_backend):
+    events = [
+        {"event_id": f"evt_{i}", "created_at": f"2023-01-01T00:{i:02d}:00.000Z"}
+        for i in range(40)
+    ]
+    in_flight = []
+    max_in_flight = []
+
+    async def handler(request: httpx.Request):
+        start, end = request.url.params.get_list("between")
+        page = [e for e in events if start <= e["created_at"] <= end][:8]
+        in_flight.append(request)
+        max_in_flight.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.remove(request)
+        return httpx.Response(200, json={"events": page})
+
+    async def run():
+        async with await mock_seam(seam_backend, handler) as seam:
+            backfilled = [
+                e.event_id
+                async for e in seam.events.backfill(
+                    "2023-01-01T00:00:00.000Z",
+                    "2023-01-01T01:00:00.000Z",
+                    shards=2,
+                    max_workers=3,
+                    page_limit=8,
+                )
+            ]
+
+            assert backfilled == [e["event_id"] for e in events]
+            assert max(max_in_flight) <= 3
+
+            listed = [
+                e.event_id
+                async for e in seam.events.iter_list(
+                    "2023-01-01T00:00:00.000Z",
+                    "2023-01-01T01:00:00.000Z",
+                    window=timedelta(minutes=30),
+                    page_limit=8,
+                )
+            ]
+
+            assert listed == [e["event_id"] for e in events]
+
+    asyncio.run(run())
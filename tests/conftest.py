@@ -36,6 +36,28 @@ def seam(seam_backend: Any):
     yield seam
 
 
+@pytest.fixture
+def device_dict():
+    """Builds API device payloads, with any field overridden by keyword"""
+
+    def make(device_id: str = "device_1", **fields: Any):
+        return {
+            "device_id": device_id,
+            "device_type": "august_lock",
+            "properties": {"locked": True},
+            "capabilities_supported": ["lock"],
+            "errors": [],
+            "warnings": [],
+            "connected_account_id": "ca_1",
+            "workspace_id": "ws_1",
+            "created_at": "2023-01-01T00:00:00.000Z",
+            "is_managed": True,
+            **fields,
+        }
+
+    return make
+
+
 @pytest.fixture
 def fake_sentry(monkeypatch):
     sentry_dsn = "https://key@sentry.io/123"
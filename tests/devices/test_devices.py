@@ -1,7 +1,14 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import responses
 from seamapi import Seam
-from seamapi.types import SeamApiException
+from seamapi.types import DevicesNotFoundException, SeamApiException
 from tests.fixtures.run_august_factory import run_august_factory
 from seamapi.utils.deep_attr_dict import DeepAttrDict
+from seamapi.utils.device_cache import DeviceCache
 
 
 def test_devices(seam: Seam):
@@ -109,3 +116,210 @@ def test_unmanaged_devices(seam: Seam):
     seam.devices.unmanaged.update(device=device, is_managed=True)
     unmanaged_devices = seam.devices.unmanaged.list()
     assert len(unmanaged_devices) == 0
+
+
+@responses.activate
+def test_lock_door_without_waiting(seam: Seam):
+    responses.add(
+        "POST",
+        seam.api_url + "/locks/lock_door",
+        json={
+            "action_attempt": {
+                "action_attempt_id": "aa_1",
+                "action_type": "LOCK_DOOR",
+                "status": "pending",
+                "result": None,
+                "error": None,
+            }
+        },
+    )
+
+    action_attempt = seam.locks.lock_door(
+        "device_1", wait_for_action_attempt=False
+    )
+
+    assert action_attempt.status == "pending"
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_list_devices_streaming(seam_backend, device_dict):
+    pytest.importorskip("ijson")
+    device = device_dict(properties={"locked": True, "battery_level": 0.5})
+    responses.add(
+        "GET",
+        seam_backend.url + "/devices/list",
+        json={"devices": [device, {**device, "device_id": "device_2"}], "ok": True},
+    )
+
+    seam = Seam(
+        api_url=seam_backend.url,
+        api_key=seam_backend.sandbox_api_key,
+        stream_list_responses=True,
+    )
+    devices = seam.devices.list()
+
+    assert [d.device_id for d in devices] == ["device_1", "device_2"]
+    assert devices[0].properties.battery_level == 0.5
+
+
+@responses.activate
+def test_list_devices_as_columns(seam: Seam):
+    device = {
+        "device_id": "device_1",
+        "device_type": "august_lock",
+        "properties": {"online": True, "locked": True, "battery_level": 0.5},
+        "connected_account_id": "ca_1",
+        "created_at": "2023-01-01T00:00:00.000Z",
+    }
+    responses.add(
+        "GET",
+        seam.api_url + "/devices/list",
+        json={
+            "devices": [device, {"device_id": "device_2", "properties": {}}],
+            "ok": True,
+        },
+    )
+
+    columns = seam.devices.list_columns(
+        columns=["device_id", "device_type", "properties.locked"]
+    )
+
+    assert columns == {
+        "device_id": ["device_1", "device_2"],
+        "device_type": ["august_lock", None],
+        "properties.locked": [True, None],
+    }
+
+
+@responses.activate
+def test_device_cache(seam: Seam, device_dict):
+    device = device_dict(properties={"locked": False})
+    get = responses.add(
+        "GET", seam.api_url + "/devices/get", json={"device": device}
+    )
+    responses.add(
+        "POST",
+        seam.api_url + "/locks/lock_door",
+        json={
+            "action_attempt": {
+                "action_attempt_id": "aa_1",
+                "action_type": "LOCK_DOOR",
+                "status": "pending",
+            }
+        },
+    )
+    responses.add(
+        "GET",
+        seam.api_url + "/events/list",
+        json={
+            "events": [
+                {
+                    "event_id": "evt_1",
+                    "event_type": "lock.locked",
+                    "device_id": "device_1",
+                }
+            ]
+        },
+    )
+
+    cache = DeviceCache()
+    client = Seam(api_key=seam.api_key, api_url=seam.api_url, device_cache=cache)
+
+    client.devices.get("device_1")
+    client.devices.get("device_1")
+    assert get.call_count == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    client.locks.lock_door("device_1", wait_for_action_attempt=False)
+    client.devices.get("device_1")
+    assert get.call_count == 2
+
+    client.events.list(since="2023-01-01T00:00:00.000Z")
+    client.devices.get("device_1")
+    assert get.call_count == 3
+
+    def get_action_attempt(request):
+        # A get made while the action runs caches the pre-action state
+        client.devices.get("device_1")
+        return (
+            200,
+            {},
+            json.dumps(
+                {
+                    "action_attempt": {
+                        "action_attempt_id": "aa_1",
+                        "action_type": "LOCK_DOOR",
+                        "status": "success",
+                        "result": {},
+                        "error": None,
+                    }
+                }
+            ),
+        )
+
+    responses.add_callback(
+        "GET",
+        seam.api_url + "/action_attempts/get",
+        callback=get_action_attempt,
+        content_type="application/json",
+    )
+    client.locks.lock_door("device_1")
+    assert get.call_count == 4
+    client.devices.get("device_1")
+    assert get.call_count == 5
+
+
+def add_devices_list_by_ids(seam: Seam, device_dict, known_ids):
+    def list_by_ids(request):
+        query = parse_qs(urlparse(request.url).query)
+        devices = [
+            device_dict(device_id, properties={})
+            for device_id in query["device_ids"]
+            if device_id in known_ids
+        ]
+        return (200, {}, json.dumps({"devices": devices}))
+
+    responses.add_callback(
+        "GET",
+        seam.api_url + "/devices/list",
+        callback=list_by_ids,
+        content_type="application/json",
+    )
+
+
+@responses.activate
+def test_get_many_devices(seam: Seam, device_dict):
+    add_devices_list_by_ids(seam, device_dict, {"d_1", "d_2", "d_3"})
+
+    devices = seam.devices.get_many(["d_3", "d_1", "d_2", "d_1"], batch_size=2)
+    assert [d.device_id for d in devices] == ["d_3", "d_1", "d_2", "d_1"]
+    assert len(responses.calls) == 2
+
+    with pytest.raises(DevicesNotFoundException) as error:
+        seam.devices.get_many(["d_1", "missing"])
+    assert error.value.device_ids == ["missing"]
+
+    devices = seam.devices.get_many(["missing"], raise_if_missing=False)
+    assert devices == [None]
+
+
+@responses.activate
+def test_batches_concurrent_device_gets(seam: Seam, device_dict):
+    add_devices_list_by_ids(seam, device_dict, {"d_1", "d_2", "d_3"})
+
+    client = Seam(
+        api_key=seam.api_key,
+        api_url=seam.api_url,
+        device_get_batch_window=0.05,
+    )
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        devices = list(pool.map(client.devices.get, ["d_1", "d_2", "d_3", "d_1"]))
+
+    assert [d.device_id for d in devices] == ["d_1", "d_2", "d_3", "d_1"]
+    assert devices[0] == devices[3]
+    assert devices[0] is not devices[3]
+    assert len(responses.calls) == 1
+
+    with pytest.raises(DevicesNotFoundException):
+        client.devices.get("missing")
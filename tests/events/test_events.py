@@ -1,5 +1,12 @@
+import json
+import pickle
 import time
+from datetime import timedelta
+from urllib.parse import parse_qs, urlparse
+import responses
 from seamapi import Seam
+from seamapi.types import Event
+from seamapi.utils.paginate import parse_timestamp
 from tests.fixtures.run_august_factory import run_august_factory
 
 SINCE = "2021-01-01T00:00:00.000Z"
@@ -24,3 +31,123 @@ def test_events(seam: Seam):
 
     none_event = seam.events.get(event_id=FAKE_UUID)
     assert none_event is None
+
+
+EVENT = {
+    "event_id": "evt_1",
+    "event_class": "lock",
+    "event_type": "lock.unlocked",
+    "device_id": "device_1",
+    "created_at": "2023-01-01T00:00:01.000Z",
+    "method": "keycode",
+    "connected_account_id": "ca_1",
+}
+
+
+@responses.activate
+def test_events_are_typed(seam: Seam):
+    responses.add("GET", seam.api_url + "/events/list", json={"events": [EVENT]})
+    responses.add("GET", seam.api_url + "/events/get", json={"event": EVENT})
+    responses.add("GET", seam.api_url + "/events/get", json={})
+
+    event = seam.events.list(since=SINCE)[0]
+    assert type(event) is Event
+    assert event.event_type == "lock.unlocked"
+    assert event["method"] == "keycode"
+    assert event.get("missing") is None
+    assert event.to_dict() == EVENT
+    assert not hasattr(event, "__dict__")
+    assert pickle.loads(pickle.dumps(event)) == event
+
+    assert seam.events.get(event_id="evt_1") == event
+    assert seam.events.get(event_id=FAKE_UUID) is None
+
+
+@responses.activate
+def test_events_projection(seam: Seam):
+    responses.add("GET", seam.api_url + "/events/list", json={"events": [EVENT]})
+
+    event = seam.events.list(since=SINCE, fields=["method"])[0]
+
+    assert event.payload == {"method": "keycode"}
+    assert event.device_id == "device_1"
+    assert event["created_at"] == EVENT["created_at"]
+    assert event.get("connected_account_id") is None
+
+
+def backfill_events():
+    # A burst of 30 events in the first minute and one event per hour after
+    events = [
+        {"event_id": f"burst_{i}", "created_at": f"2023-01-01T00:00:{i:02d}.000Z"}
+        for i in range(30)
+    ]
+    events += [
+        {"event_id": f"hourly_{h}", "created_at": f"2023-01-01T{h:02d}:00:00.000Z"}
+        for h in range(1, 24)
+    ]
+    return events
+
+
+def list_between(events, url, page_limit):
+    start, end = parse_qs(urlparse(url).query)["between"]
+    start, end = parse_timestamp(start), parse_timestamp(end)
+    page = [e for e in events if start <= parse_timestamp(e["created_at"]) <= end]
+    return page[:page_limit]
+
+
+@responses.activate
+def test_events_backfill(seam: Seam):
+    events = backfill_events()
+    responses.add_callback(
+        "GET",
+        seam.api_url + "/events/list",
+        callback=lambda request: (
+            200,
+            {},
+            json.dumps({"events": list_between(events, request.url, 10)}),
+        ),
+        content_type="application/json",
+    )
+
+    backfilled = list(
+        seam.events.backfill(
+            "2023-01-01T00:00:00.000Z",
+            "2023-01-02T00:00:00.000Z",
+            shards=4,
+            max_workers=3,
+            page_limit=10,
+        )
+    )
+
+    ordered = sorted(events, key=lambda e: e["created_at"])
+    assert [e.event_id for e in backfilled] == [e["event_id"] for e in ordered]
+    assert all(type(e) is Event for e in backfilled)
+    # The busy first shard was split until each part fit in a page
+    assert len(responses.calls) > 4
+
+
+@responses.activate
+def test_events_iter_list_splits_full_windows(seam: Seam):
+    events = backfill_events()
+    responses.add_callback(
+        "GET",
+        seam.api_url + "/events/list",
+        callback=lambda request: (
+            200,
+            {},
+            json.dumps({"events": list_between(events, request.url, 10)}),
+        ),
+        content_type="application/json",
+    )
+
+    listed = list(
+        seam.events.iter_list(
+            "2023-01-01T00:00:00.000Z",
+            "2023-01-01T04:00:00.000Z",
+            window=timedelta(hours=2),
+            page_limit=10,
+        )
+    )
+
+    expected = [e for e in events if e["created_at"] <= "2023-01-01T04:00:00.000Z"]
+    assert [e.event_id for e in listed] == [e["event_id"] for e in expected]
@@ -5,3 +5,13 @@ def test_init_seam_with_fixture(seam: Seam):
     assert seam.api_key
     assert seam.api_url
     assert "http" in seam.api_url and "localhost" in seam.api_url
+
+
+def test_routes_are_built_on_first_access(seam: Seam):
+    assert "locks" not in vars(seam)
+
+    locks = seam.locks
+
+    assert vars(seam)["locks"] is locks
+    assert seam.locks is locks
+    assert locks.seam is seam
@@ -0,0 +1,128 @@
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+import responses
+from seamapi import Seam
+from seamapi.utils.json_codec import JsonCodec, STDLIB_JSON_CODEC
+from seamapi.utils.rate_limit import RateLimit, RateLimiter
+
+
+@responses.activate
+def test_reuses_pooled_session(seam: Seam):
+    rsp = responses.Response(
+        method="GET",
+        url=seam.api_url + "/workspaces/list",
+        json={"workspaces": []},
+    )
+    responses.add(rsp)
+
+    with Seam(
+        api_key=seam.api_key,
+        api_url=seam.api_url,
+        pool_maxsize=32,
+    ) as client:
+        session = client.session
+        client.workspaces.list()
+        client.workspaces.list()
+
+        assert client.session is session
+        assert session.get_adapter(seam.api_url)._pool_maxsize == 32
+
+    assert rsp.call_count == 2
+
+
+@responses.activate
+def test_sends_prebuilt_headers(seam_backend):
+    responses.add(
+        "GET",
+        seam_backend.url + "/workspaces/list",
+        json={"workspaces": []},
+    )
+
+    seam = Seam(
+        api_key=seam_backend.sandbox_api_key,
+        api_url=seam_backend.url,
+        workspace_id="ws_1",
+    )
+    seam.workspaces.list()
+
+    headers = responses.calls[0].request.headers
+    assert headers["Authorization"] == "Bearer " + seam_backend.sandbox_api_key
+    assert headers["seam-workspace"] == "ws_1"
+    assert headers["User-Agent"].startswith("Python SDK v")
+
+
+@responses.activate
+def test_uses_custom_json_codec(seam: Seam):
+    calls = []
+
+    def dumps(value):
+        calls.append("dumps")
+        return STDLIB_JSON_CODEC.dumps(value)
+
+    def loads(body):
+        calls.append("loads")
+        return STDLIB_JSON_CODEC.loads(body)
+
+    responses.add(
+        "POST",
+        seam.api_url + "/locks/lock_door",
+        json={"action_attempt": {"action_attempt_id": "aa_1"}},
+        match=[
+            responses.matchers.json_params_matcher({"device_id": "d_1"})
+        ],
+    )
+
+    client = Seam(
+        api_key=seam.api_key,
+        api_url=seam.api_url,
+        json_codec=JsonCodec(name="spy", dumps=dumps, loads=loads),
+    )
+    res = client.make_request(
+        "POST", "/locks/lock_door", json={"device_id": "d_1"}
+    )
+
+    assert res["action_attempt"]["action_attempt_id"] == "aa_1"
+    assert calls == ["dumps", "loads"]
+
+
+@responses.activate
+def test_rate_limits_requests(seam: Seam):
+    responses.add("GET", seam.api_url + "/workspaces/list", json={"workspaces": []})
+
+    client = Seam(
+        api_key=seam.api_key,
+        api_url=seam.api_url,
+        rate_limiter=RateLimiter({"/workspaces/*": RateLimit(rate=20, burst=1)}),
+    )
+    start = time.monotonic()
+    for _ in range(3):
+        client.workspaces.list()
+
+    assert time.monotonic() - start >= 0.09
+
+
+@responses.activate
+def test_coalesces_identical_concurrent_gets(seam: Seam, device_dict):
+    device = device_dict()
+
+    def slow_get(request):
+        time.sleep(0.1)
+        return (200, {}, json.dumps({"device": device}))
+
+    responses.add_callback(
+        "GET",
+        seam.api_url + "/devices/get",
+        callback=slow_get,
+        content_type="application/json",
+    )
+
+    client = Seam(
+        api_key=seam.api_key, api_url=seam.api_url, coalesce_requests=True
+    )
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        devices = list(pool.map(client.devices.get, ["device_1"] * 4))
+
+    assert len(responses.calls) == 1
+    assert client.single_flight.shared == 3
+    assert devices[0].properties.to_dict() is not devices[1].properties.to_dict()
@@ -0,0 +1,78 @@
+import json
+import responses
+from seamapi import Seam
+from seamapi.types import ActionAttempt, SeamApiException
+
+
+def unlock_callback(request):
+    device_id = json.loads(request.body)["device_id"]
+    if device_id == "device_missing":
+        return (404, {}, json.dumps({"error": {"type": "device_not_found"}}))
+    return (
+        200,
+        {},
+        json.dumps(
+            {
+                "action_attempt": {
+                    "action_attempt_id": "aa_" + device_id,
+                    "action_type": "UNLOCK_DOOR",
+                    "status": "pending",
+                    "result": None,
+                    "error": None,
+                }
+            }
+        ),
+    )
+
+
+@responses.activate
+def test_bulk_map_collects_results_in_order(seam: Seam):
+    responses.add_callback(
+        "POST",
+        seam.api_url + "/locks/unlock_door",
+        callback=unlock_callback,
+        content_type="application/json",
+    )
+
+    device_ids = ["device_1", "device_missing", "device_2", "device_3"]
+    finished = []
+    results = seam.bulk.map(
+        seam.locks.unlock_door,
+        device_ids,
+        max_workers=3,
+        on_result=finished.append,
+        wait_for_action_attempt=False,
+    )
+
+    assert [r.item for r in results] == device_ids
+    assert [r.index for r in results] == [0, 1, 2, 3]
+    assert [r.ok for r in results] == [True, False, True, True]
+    assert type(results[0].value) is ActionAttempt
+    assert results[2].value.action_attempt_id == "aa_device_2"
+    assert isinstance(results[1].error, SeamApiException)
+    assert results[1].error.metadata["type"] == "device_not_found"
+    assert all(r.duration >= 0 for r in results)
+    assert sorted(r.index for r in finished) == [0, 1, 2, 3]
+
+
+def test_bulk_run(seam: Seam):
+    def fail():
+        raise ValueError("boom")
+
+    results = seam.bulk.run([lambda: 1, fail, lambda: 3], max_workers=2)
+
+    assert [r.value for r in results] == [1, None, 3]
+    assert isinstance(results[1].error, ValueError)
+
+
+def test_bulk_on_result_errors_are_recorded(seam: Seam):
+    def on_result(result):
+        if result.value == 2:
+            raise RuntimeError("callback failed")
+
+    results = seam.bulk.run([lambda: 1, lambda: 2, lambda: 3], on_result=on_result)
+
+    assert [r.value for r in results] == [1, 2, 3]
+    assert all(r.ok for r in results)
+    assert isinstance(results[1].callback_error, RuntimeError)
+    assert results[0].callback_error is None
@@ -0,0 +1,26 @@
+import pytest
+
+from seamapi.utils.columns import as_table, to_columns
+
+
+def test_to_columns_flattens_paths():
+    items = [
+        {"device_id": "d_1", "properties": {"online": True, "battery": {"level": 0.5}}},
+        {"device_id": "d_2", "properties": None},
+    ]
+
+    columns = to_columns(iter(items), ["device_id", "properties.battery.level"])
+
+    assert columns == {
+        "device_id": ["d_1", "d_2"],
+        "properties.battery.level": [0.5, None],
+    }
+
+
+def test_as_table():
+    pytest.importorskip("pyarrow")
+
+    table = as_table({"device_id": ["d_1", "d_2"], "online": [True, None]})
+
+    assert table.num_rows == 2
+    assert table.column("online").to_pylist() == [True, None]
@@ -0,0 +1,117 @@
+import asyncio
+import io
+import json
+from seamapi import Seam
+from seamapi.types import Device
+from seamapi.utils.completion_broker import CompletionBroker
+from seamapi.utils.device_cache import DeviceCache
+
+
+def post(broker: CompletionBroker, payload, method="POST", headers=None):
+    body = json.dumps(payload).encode()
+    environ = {
+        "REQUEST_METHOD": method,
+        "CONTENT_LENGTH": str(len(body)),
+        "CONTENT_TYPE": "application/json",
+        "wsgi.input": io.BytesIO(body),
+    }
+    for key, value in (headers or {}).items():
+        environ["HTTP_" + key.upper().replace("-", "_")] = value
+    statuses = []
+    broker.wsgi_app(environ, lambda status, headers: statuses.append(status))
+    return statuses[0]
+
+
+def test_wsgi_app_resolves_waiters():
+    broker = CompletionBroker()
+    first = broker.register("aa_1")
+    second = broker.register("aa_1")
+    other = broker.register("aa_2")
+
+    event = {
+        "event_id": "evt_1",
+        "event_type": "action_attempt.lock_door.succeeded",
+        "action_attempt_id": "aa_1",
+    }
+    assert post(broker, event) == "204 No Content"
+
+    assert first.result(0) == event
+    assert second.result(0) == event
+    assert not other.done()
+
+    broker.discard("aa_2", other)
+    assert post(broker, {"event": {"action_attempt_id": "aa_2"}}) == "204 No Content"
+    assert not other.done()
+    assert broker.events == 2
+
+
+def test_remembers_events_that_arrive_before_waiting():
+    broker = CompletionBroker(max_recent=2)
+    for action_attempt_id in ["aa_1", "aa_2", "aa_3"]:
+        broker.handle_event({"action_attempt_id": action_attempt_id})
+    broker.handle_event({"event_type": "device.connected", "device_id": "d_1"})
+
+    assert broker.register("aa_3").done()
+    assert broker.register("aa_2").done()
+    assert not broker.register("aa_1").done()
+
+
+def test_deliveries_invalidate_the_client_device_cache(seam: Seam, device_dict):
+    cache = DeviceCache()
+    broker = CompletionBroker()
+    Seam(
+        api_key=seam.api_key,
+        api_url=seam.api_url,
+        device_cache=cache,
+        completion_broker=broker,
+    )
+    cache.put(Device.from_dict(device_dict("d_1")))
+    cache.put(Device.from_dict(device_dict("d_2")))
+
+    event = {"event_id": "evt_1", "event_type": "lock.unlocked", "device_id": "d_1"}
+    assert post(broker, event) == "204 No Content"
+
+    assert cache.get("d_1") is None
+    assert cache.get("d_2") is not None
+    assert broker.device_caches == [cache]
+
+
+def test_wsgi_app_rejects_invalid_deliveries():
+    def verify(headers, body):
+        if headers.get("x-token") != "secret":
+            raise ValueError("bad token")
+
+    broker = CompletionBroker(verify=verify)
+    waiter = broker.register("aa_1")
+    event = {"action_attempt_id": "aa_1"}
+
+    assert post(broker, event, method="GET") == "405 Method Not Allowed"
+    assert post(broker, event) == "401 Unauthorized"
+    assert post(broker, [event], headers={"X-Token": "secret"}) == "400 Bad Request"
+    assert not waiter.done()
+
+    assert post(broker, event, headers={"X-Token": "secret"}) == "204 No Content"
+    assert waiter.done()
+
+
+def test_asgi_app_resolves_waiters():
+    broker = CompletionBroker()
+    waiter = broker.register("aa_1")
+    body = json.dumps({"action_attempt_id": "aa_1"}).encode()
+    messages = [
+        {"type": "http.request", "body": body[:5], "more_body": True},
+        {"type": "http.request", "body": body[5:]},
+    ]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "method": "POST", "headers": []}
+    asyncio.run(broker.asgi_app(scope, receive, send))
+
+    assert sent[0]["status"] == 204
+    assert waiter.result(0) == {"action_attempt_id": "aa_1"}
@@ -1,7 +1,71 @@
+import copy
+import json
+import pickle
+
+import pytest
+from seamapi.types import Device
 from seamapi.utils.deep_attr_dict import DeepAttrDict
+from seamapi.utils.json_codec import get_orjson_codec
 
 
 def test_deep_attr_dict():
     attrdict = DeepAttrDict({"a": {"b": {"c": 5}}})
 
     assert attrdict.a.b.c == 5
+
+
+def test_deep_attr_dict_shares_nested_dicts():
+    source = {"a": {"b": {"c": 5}}}
+    attrdict = DeepAttrDict(source)
+
+    source["a"]["b"]["c"] = 6
+
+    assert attrdict.a.b.c == 6
+    assert attrdict.to_dict() == source
+    assert attrdict.to_dict()["a"] is source["a"]
+
+
+def test_deep_attr_dict_miss_does_not_mutate():
+    source = {"a": {"b": 1}}
+    attrdict = DeepAttrDict(source)
+
+    assert attrdict.missing.nested == {}
+    assert not attrdict.a.missing
+    assert attrdict.get("missing") is None
+    assert "missing" not in attrdict
+    assert source == {"a": {"b": 1}}
+
+
+def test_deep_attr_dict_is_read_only():
+    attrdict = DeepAttrDict({"a": 1})
+
+    with pytest.raises(AttributeError):
+        attrdict.a = 2
+    with pytest.raises(TypeError):
+        attrdict["a"] = 2
+    with pytest.raises(TypeError):
+        attrdict.update(a=2)
+    assert attrdict == {"a": 1}
+
+
+def test_deep_attr_dict_serializes_as_dict(device_dict):
+    device = Device.from_dict(
+        device_dict(
+            properties={"name": "Front door", "model": {"display_name": "Lock"}}
+        )
+    )
+    properties = device.properties
+
+    assert isinstance(properties, dict)
+    assert json.loads(json.dumps(properties)) == properties
+    assert json.loads(json.dumps({"properties": properties.model})) == {
+        "properties": {"display_name": "Lock"}
+    }
+    assert pickle.loads(pickle.dumps(properties)) == properties
+    assert copy.deepcopy(properties).model.display_name == "Lock"
+
+    try:
+        codec = get_orjson_codec()
+    except ImportError:
+        return
+    assert codec.loads(codec.dumps(properties)) == properties
@@ -0,0 +1,87 @@
+from datetime import datetime, timezone
+
+from seamapi.types import Device
+from seamapi.utils.device_cache import DeviceCache
+from seamapi.utils.paginate import format_timestamp
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_device_cache_ttl_and_field_ttls(device_dict):
+    clock = FakeClock()
+    cache = DeviceCache(
+        ttl=10, field_ttls={"properties.name": 100}, clock=clock
+    )
+    cache.put(
+        Device.from_dict(
+            device_dict("d_1", properties={"name": "Front Door", "locked": True})
+        )
+    )
+
+    clock.now = 5
+    assert cache.get("d_1").device_id == "d_1"
+
+    clock.now = 50
+    assert cache.get("d_1") is None
+    assert cache.get_field("d_1", "properties.name") == "Front Door"
+    assert cache.get_field("d_1", "connected_account_id") is None
+
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+def test_device_cache_lru_eviction_and_events(device_dict):
+    cache = DeviceCache(maxsize=2)
+    cache.put(Device.from_dict(device_dict("d_1")))
+    cache.put(Device.from_dict(device_dict("d_2")))
+    cache.get("d_1")
+    cache.put(Device.from_dict(device_dict("d_3")))
+
+    assert cache.get("d_2") is None
+    assert cache.evictions == 1
+
+    cache.handle_event({"event_type": "device.disconnected", "device_id": "d_1"})
+    assert cache.get("d_1") is None
+    assert len(cache) == 1
+
+    # Events from before the TTL can't be newer than a cached entry
+    cache.handle_event(
+        {
+            "event_type": "lock.locked",
+            "device_id": "d_3",
+            "created_at": "2023-01-01T00:00:00.000Z",
+        }
+    )
+    assert cache.get("d_3") is not None
+    cache.handle_event(
+        {
+            "event_type": "lock.locked",
+            "device_id": "d_3",
+            "created_at": format_timestamp(datetime.now(timezone.utc)),
+        }
+    )
+    assert cache.get("d_3") is None
+
+
+def test_device_cache_returns_copies(device_dict):
+    cache = DeviceCache()
+    device = Device.from_dict(device_dict("d_1"))
+    cache.put(device)
+    device.capabilities_supported.append("thermostat")
+
+    first = cache.get("d_1")
+    first.errors.append({"error_code": "device_offline"})
+    first.device_type = "schlage_lock"
+
+    second = cache.get("d_1")
+    assert second is not first
+    assert second.errors == []
+    assert second.device_type == "august_lock"
+    assert second.capabilities_supported == ["lock"]
+    cache.get_field("d_1", "capabilities_supported").append("thermostat")
+    assert cache.get_field("d_1", "capabilities_supported") == ["lock"]
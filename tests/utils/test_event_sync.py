@@ -0,0 +1,201 @@
+import json
+from datetime import timedelta
+from urllib.parse import parse_qs, urlparse
+import responses
+from seamapi import Seam
+from seamapi.types import Event
+from seamapi.utils.event_sync import (
+    Checkpoint,
+    EventSync,
+    FileCheckpointStore,
+    MemoryCheckpointStore,
+    SqliteCheckpointStore,
+)
+
+SINCE = "2023-01-01T00:00:00.000Z"
+
+
+def make_event(event_id: str, created_at: str):
+    return {
+        "event_id": event_id,
+        "event_type": "lock.unlocked",
+        "event_class": "lock",
+        "device_id": "device_1",
+        "created_at": created_at,
+    }
+
+
+def add_events_list(seam: Seam, *events):
+    responses.add(
+        "GET", seam.api_url + "/events/list", json={"events": list(events)}
+    )
+
+
+@responses.activate
+def test_poll_fetches_only_new_events(seam: Seam):
+    e1 = make_event("evt_1", "2023-01-01T00:00:01.000Z")
+    e2 = make_event("evt_2", "2023-01-01T00:00:02.000Z")
+    e3 = make_event("evt_3", "2023-01-01T00:00:02.000Z")
+    e4 = make_event("evt_4", "2023-01-01T00:00:03.000Z")
+    add_events_list(seam, e2, e1)
+    add_events_list(seam, e2, e3)
+    add_events_list(seam, e3, e4)
+    add_events_list(seam, e4)
+
+    store = MemoryCheckpointStore()
+    sync = EventSync(seam, store, since=SINCE, device_id="device_1")
+
+    first = sync.poll()
+    assert [type(e) for e in first] == [Event, Event]
+    assert [e.event_id for e in first] == ["evt_1", "evt_2"]
+    assert store.checkpoint.created_at == "2023-01-01T00:00:02.000Z"
+    assert list(store.checkpoint.seen) == ["evt_2"]
+
+    assert [e.event_id for e in sync.poll()] == ["evt_3"]
+    assert [e.event_id for e in sync.poll()] == ["evt_4"]
+    assert sync.poll() == []
+
+    params = [call.request.params for call in responses.calls]
+    assert params[0] == {"since": SINCE, "device_id": "device_1"}
+    assert params[1]["since"] == "2023-01-01T00:00:02.000Z"
+    assert params[3]["since"] == "2023-01-01T00:00:03.000Z"
+
+
+@responses.activate
+def test_overlap_picks_up_late_events(seam: Seam):
+    e1 = make_event("evt_1", "2023-01-01T00:00:10.000Z")
+    late = make_event("evt_late", "2023-01-01T00:00:08.000Z")
+    e2 = make_event("evt_2", "2023-01-01T00:01:00.000Z")
+    add_events_list(seam, e1)
+    add_events_list(seam, late, e1)
+    add_events_list(seam, e2)
+
+    sync = EventSync(seam, since=SINCE, overlap=timedelta(seconds=5))
+
+    assert [e.event_id for e in sync.poll()] == ["evt_1"]
+    assert [e.event_id for e in sync.poll()] == ["evt_late"]
+    assert responses.calls[1].request.params["since"] == "2023-01-01T00:00:05.000Z"
+
+    assert [e.event_id for e in sync.poll()] == ["evt_2"]
+    assert list(sync.checkpoint.seen) == ["evt_2"]
+
+
+def add_events_server(seam: Seam, events, page_limit: int, newest_first=False):
+    """Serves `since` and `between` queries, truncated to `page_limit`"""
+
+    def list_events(request):
+        query = parse_qs(urlparse(request.url).query)
+        start, end = query.get("between") or [query["since"][0], "9999"]
+        matching = sorted(
+            (e for e in events if start <= e["created_at"] <= end),
+            key=lambda e: e["created_at"],
+            reverse=newest_first,
+        )
+        return (200, {}, json.dumps({"events": matching[:page_limit]}))
+
+    responses.add_callback(
+        "GET",
+        seam.api_url + "/events/list",
+        callback=list_events,
+        content_type="application/json",
+    )
+
+
+@responses.activate
+def test_poll_walks_a_full_page_in_narrower_windows(seam: Seam):
+    events = [
+        make_event(f"evt_{i}", f"2023-01-01T00:00:{i:02d}.000Z") for i in range(1, 6)
+    ]
+    add_events_server(seam, events, page_limit=2)
+
+    store = MemoryCheckpointStore()
+    sync = EventSync(seam, store, since=SINCE, page_limit=2)
+
+    assert [e.event_id for e in sync.poll()] == [e["event_id"] for e in events]
+    assert "between" in responses.calls[1].request.params
+    assert store.checkpoint.created_at == "2023-01-01T00:00:05.000Z"
+
+
+@responses.activate
+def test_poll_gets_past_a_full_page_of_seen_events(seam: Seam):
+    seen = [
+        make_event(f"evt_{i}", f"2023-01-01T00:00:{i:02d}.000Z") for i in range(1, 4)
+    ]
+    newer = [
+        make_event("evt_10", "2023-01-01T00:00:10.000Z"),
+        make_event("evt_11", "2023-01-01T00:00:11.000Z"),
+    ]
+    add_events_server(seam, seen + newer, page_limit=3)
+
+    checkpoint = Checkpoint(
+        created_at="2023-01-01T00:00:03.000Z",
+        seen={e["event_id"]: e["created_at"] for e in seen},
+    )
+    store = MemoryCheckpointStore(checkpoint)
+    sync = EventSync(seam, store, overlap=timedelta(seconds=5), page_limit=3)
+
+    assert [e.event_id for e in sync.poll()] == ["evt_10", "evt_11"]
+    assert store.checkpoint.created_at == "2023-01-01T00:00:11.000Z"
+    assert sync.poll() == []
+
+
+@responses.activate
+def test_poll_handles_newest_first_pages(seam: Seam):
+    events = [
+        make_event(f"evt_{i}", f"2023-01-01T00:00:{i:02d}.000Z") for i in range(1, 6)
+    ]
+    add_events_server(seam, events, page_limit=2, newest_first=True)
+
+    store = MemoryCheckpointStore()
+    sync = EventSync(seam, store, since=SINCE, page_limit=2)
+
+    assert [e.event_id for e in sync.poll()] == [e["event_id"] for e in events]
+    assert store.checkpoint.created_at == "2023-01-01T00:00:05.000Z"
+
+
+@responses.activate
+def test_file_store_resumes_after_commit(seam: Seam, tmp_path):
+    path = str(tmp_path / "checkpoint.json")
+    add_events_list(seam, make_event("evt_1", "2023-01-01T00:00:01.000Z"))
+    add_events_list(seam, make_event("evt_1", "2023-01-01T00:00:01.000Z"))
+
+    sync = EventSync(seam, FileCheckpointStore(path), since=SINCE)
+    assert len(sync.poll(commit=False)) == 1
+    assert FileCheckpointStore(path).load() is None
+    sync.commit()
+
+    resumed = EventSync(seam, FileCheckpointStore(path), since=SINCE)
+    assert resumed.poll() == []
+    assert responses.calls[1].request.params["since"] == "2023-01-01T00:00:01.000Z"
+
+
+@responses.activate
+def test_tail_commits_after_each_batch(seam: Seam):
+    add_events_list(seam, make_event("evt_1", "2023-01-01T00:00:01.000Z"))
+    add_events_list(seam, make_event("evt_2", "2023-01-01T00:00:02.000Z"))
+
+    store = MemoryCheckpointStore()
+    sync = EventSync(seam, store, since=SINCE)
+    events = sync.tail(interval=0, max_polls=2)
+
+    assert next(events).event_id == "evt_1"
+    assert store.checkpoint is None
+    assert next(events).event_id == "evt_2"
+    assert store.checkpoint.created_at == "2023-01-01T00:00:01.000Z"
+    assert list(events) == []
+    assert store.checkpoint.created_at == "2023-01-01T00:00:02.000Z"
+
+
+def test_sqlite_store(tmp_path):
+    path = str(tmp_path / "checkpoints.db")
+    first = SqliteCheckpointStore(path, name="ws_1")
+    second = SqliteCheckpointStore(path, name="ws_2")
+    assert first.load() is None
+
+    first.save(Checkpoint("2023-01-01T00:00:01.000Z", {"evt_1": "2023-01-01T00:00:01.000Z"}))
+    first.save(Checkpoint("2023-01-01T00:00:02.000Z", {"evt_2": "2023-01-01T00:00:02.000Z"}))
+
+    assert SqliteCheckpointStore(path, name="ws_1").load() == Checkpoint(
+        "2023-01-01T00:00:02.000Z", {"evt_2": "2023-01-01T00:00:02.000Z"}
+    )
+    assert second.load() is None
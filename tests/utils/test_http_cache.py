@@ -0,0 +1,97 @@
+import responses
+from seamapi import Seam
+from seamapi.utils.http_cache import HttpCache
+
+
+@responses.activate
+def test_conditional_get_serves_304_from_cache(seam: Seam):
+    url = seam.api_url + "/connected_accounts/list"
+    responses.add(
+        "GET",
+        url,
+        json={"connected_accounts": [{"connected_account_id": "ca_1"}]},
+        headers={"ETag": '"v1"'},
+    )
+    responses.add(
+        "GET",
+        url,
+        status=304,
+        match=[responses.matchers.header_matcher({"If-None-Match": '"v1"'})],
+    )
+
+    http_cache = HttpCache()
+    client = Seam(api_key=seam.api_key, api_url=seam.api_url, http_cache=http_cache)
+
+    first = client.make_request("GET", "/connected_accounts/list")
+    first["connected_accounts"][0]["connected_account_id"] = "ca_2"
+    second = client.make_request("GET", "/connected_accounts/list")
+    second["connected_accounts"].clear()
+    third = client.make_request("GET", "/connected_accounts/list")
+
+    assert third == {"connected_accounts": [{"connected_account_id": "ca_1"}]}
+    assert (http_cache.hits, http_cache.misses) == (2, 1)
+
+
+@responses.activate
+def test_responses_without_validators_are_not_stored(seam: Seam):
+    responses.add(
+        "GET",
+        seam.api_url + "/devices/list",
+        json={"devices": []},
+    )
+
+    http_cache = HttpCache()
+    client = Seam(api_key=seam.api_key, api_url=seam.api_url, http_cache=http_cache)
+
+    client.make_request("GET", "/devices/list", params={"limit": 10})
+    client.make_request("GET", "/devices/list", params={"limit": 10})
+
+    assert "If-None-Match" not in responses.calls[1].request.headers
+    assert len(http_cache) == 0
+    assert (http_cache.hits, http_cache.misses) == (0, 2)
+
+
+@responses.activate
+def test_cache_is_scoped_to_credentials(seam: Seam):
+    url = seam.api_url + "/devices/list"
+    responses.add("GET", url, json={"devices": []}, headers={"ETag": '"v1"'})
+
+    http_cache = HttpCache()
+    client = Seam(api_key=seam.api_key, api_url=seam.api_url, http_cache=http_cache)
+    other_client = Seam(
+        api_key="seam_other_key", api_url=seam.api_url, http_cache=http_cache
+    )
+
+    client.make_request("GET", "/devices/list")
+    other_client.make_request("GET", "/devices/list")
+
+    assert "If-None-Match" not in responses.calls[1].request.headers
+    assert len(http_cache) == 2
+
+
+@responses.activate
+def test_304_after_eviction_fetches_the_body_again(seam: Seam):
+    url = seam.api_url + "/devices/list"
+    http_cache = HttpCache()
+
+    def not_modified(request):
+        # The entry is evicted while the conditional request is in flight
+        http_cache.clear()
+        return (304, {}, "")
+
+    responses.add("GET", url, json={"devices": []}, headers={"ETag": '"v1"'})
+    responses.add_callback(
+        "GET",
+        url,
+        callback=not_modified,
+        match=[responses.matchers.header_matcher({"If-None-Match": '"v1"'})],
+    )
+    responses.add("GET", url, json={"devices": [{"device_id": "d_1"}]})
+
+    client = Seam(api_key=seam.api_key, api_url=seam.api_url, http_cache=http_cache)
+    client.make_request("GET", "/devices/list")
+    body = client.make_request("GET", "/devices/list")
+
+    assert body == {"devices": [{"device_id": "d_1"}]}
+    assert len(responses.calls) == 3
+    assert "If-None-Match" not in responses.calls[2].request.headers
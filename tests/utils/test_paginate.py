@@ -0,0 +1,95 @@
+from dataclasses import dataclass
+from datetime import timedelta
+from seamapi.utils.paginate import (
+    CreatedBeforeCursor,
+    TimeShards,
+    parse_timestamp,
+    split_time_range,
+    time_windows,
+)
+
+
+@dataclass
+class Item:
+    device_id: str
+    created_at: str
+
+
+def test_created_before_cursor_keeps_items_sharing_a_timestamp():
+    items = [
+        Item("d4", "2023-01-04T00:00:00.000Z"),
+        Item("d3", "2023-01-03T00:00:00.000Z"),
+        Item("d2", "2023-01-03T00:00:00.000Z"),
+        Item("d1", "2023-01-01T00:00:00.000Z"),
+    ]
+
+    def list_page(limit, created_before):
+        return [
+            item
+            for item in items
+            if created_before is None or item.created_at < created_before
+        ][:limit]
+
+    cursor = CreatedBeforeCursor(page_size=2, id_key="device_id")
+    yielded = []
+    while not cursor.done:
+        page = list_page(cursor.page_size, cursor.created_before)
+        yielded += cursor.advance(page)
+
+    assert [item.device_id for item in yielded] == ["d4", "d3", "d2", "d1"]
+
+
+def test_time_windows():
+    windows = list(
+        time_windows("2023-01-01T00:00:00.000Z", "2023-01-01T02:30:00.000Z")
+    )
+
+    assert windows == [
+        ("2023-01-01T00:00:00.000Z", "2023-01-01T01:00:00.000Z"),
+        ("2023-01-01T01:00:00.000Z", "2023-01-01T02:00:00.000Z"),
+        ("2023-01-01T02:00:00.000Z", "2023-01-01T02:30:00.000Z"),
+    ]
+
+
+@dataclass
+class EventItem:
+    event_id: str
+    created_at: str
+
+
+def test_split_time_range():
+    start = parse_timestamp("2023-01-01T00:00:00.000Z")
+    end = parse_timestamp("2023-01-01T00:00:01.000Z")
+
+    shards = split_time_range(start, end, 3)
+    assert len(shards) == 3
+    assert shards[0][0] == start and shards[-1][1] == end
+    assert all(a[1] == b[0] for a, b in zip(shards, shards[1:]))
+    assert all(s[0].microsecond % 1000 == 0 for s in shards)
+
+    tiny = start + timedelta(milliseconds=2)
+    assert split_time_range(start, tiny, 8) == [
+        (start, start + timedelta(milliseconds=1)),
+        (start + timedelta(milliseconds=1), tiny),
+    ]
+
+
+def test_time_shards_split_and_merge_in_order():
+    start = parse_timestamp("2023-01-01T00:00:00.000Z")
+    end = parse_timestamp("2023-01-01T00:00:04.000Z")
+    shards = TimeShards(start, end, 2, page_limit=3, min_shard=timedelta(seconds=1))
+    first, second = shards.pending
+
+    # The second shard finishes first but waits for the first one
+    edge = EventItem("e3", "2023-01-01T00:00:02.000Z")
+    assert shards.complete(second, [EventItem("e4", "2023-01-01T00:00:03.000Z"), edge]) == []
+    assert list(shards.ready()) == []
+
+    halves = shards.complete(first, [EventItem("e1", "2023-01-01T00:00:00.500Z")] * 3)
+    assert len(halves) == 2 and shards.splits == 1
+    assert shards.complete(halves[1], [edge]) == []
+    assert list(shards.ready()) == []
+
+    assert shards.complete(halves[0], [EventItem("e1", "2023-01-01T00:00:00.500Z")]) == []
+    assert [i.event_id for i in shards.ready()] == ["e1", "e3", "e4"]
+    assert shards.done
@@ -0,0 +1,105 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from seamapi.utils.rate_limit import RateLimit, RateLimiter, TokenBucket
+
+
+def test_token_bucket_reserves_past_burst():
+    bucket = TokenBucket(rate=10, burst=2)
+
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert 0.09 < bucket.reserve() <= 0.1
+    assert 0.19 < bucket.reserve() <= 0.2
+
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+
+def test_rate_limiter_families_and_in_flight():
+    limiter = RateLimiter(
+        {"/access_codes/*": RateLimit(max_in_flight=2)},
+        default=RateLimit(rate=1000),
+    )
+    in_flight = []
+    peak = []
+    lock = threading.Lock()
+
+    def call():
+        with limiter.acquire("/access_codes/create"):
+            with lock:
+                in_flight.append(1)
+                peak.append(len(in_flight))
+            time.sleep(0.02)
+            with lock:
+                in_flight.pop()
+
+    threads = [threading.Thread(target=call) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert max(peak) == 2
+    assert limiter._family("/access_codes/create") is not limiter._family(
+        "/devices/list"
+    )
+    assert limiter._family("/devices/list") is limiter._default
+
+
+def test_rate_limiter_async():
+    limiter = RateLimiter({"/locks/*": RateLimit(rate=50, burst=1)})
+
+    async def call():
+        async with limiter.acquire_async("/locks/unlock_door"):
+            pass
+
+    async def run():
+        start = time.monotonic()
+        await asyncio.gather(*(call() for _ in range(5)))
+        return time.monotonic() - start
+
+    assert asyncio.run(run()) >= 0.07
+
+
+def test_rate_limiter_in_flight_shared_by_threads_and_loops():
+    limiter = RateLimiter(default=RateLimit(max_in_flight=2))
+    in_flight = []
+    peak = []
+    lock = threading.Lock()
+
+    def enter():
+        with lock:
+            in_flight.append(1)
+            peak.append(len(in_flight))
+
+    def leave():
+        with lock:
+            in_flight.pop()
+
+    def call():
+        with limiter.acquire("/devices/list"):
+            enter()
+            time.sleep(0.02)
+            leave()
+
+    async def call_async():
+        async with limiter.acquire_async("/devices/list"):
+            enter()
+            await asyncio.sleep(0.02)
+            leave()
+
+    async def run():
+        await asyncio.gather(*(call_async() for _ in range(3)))
+
+    threads = [threading.Thread(target=call) for _ in range(3)]
+    threads += [threading.Thread(target=asyncio.run, args=(run(),)) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(peak) == 9
+    assert max(peak) == 2
@@ -0,0 +1,56 @@
+import pytest
+import requests
+import responses
+from seamapi import Seam
+from seamapi.types import SeamApiException
+from seamapi.utils.retry import RetryPolicy, parse_retry_after
+
+
+def make_client(seam: Seam, **policy_kwargs) -> Seam:
+    return Seam(
+        api_key=seam.api_key,
+        api_url=seam.api_url,
+        retry_policy=RetryPolicy(initial_backoff=0, jitter=0, **policy_kwargs),
+    )
+
+
+@responses.activate
+def test_retries_idempotent_requests(seam: Seam):
+    url = seam.api_url + "/devices/list"
+    responses.add("GET", url, body=requests.ConnectionError("reset"))
+    responses.add("GET", url, status=503, headers={"Retry-After": "0"})
+    responses.add("GET", url, json={"devices": []})
+
+    events = []
+    client = make_client(seam, on_retry=events.append)
+
+    assert client.make_request("GET", "/devices/list") == {"devices": []}
+    assert [(e.attempt, e.status_code) for e in events] == [(1, None), (2, 503)]
+    assert isinstance(events[0].error, requests.ConnectionError)
+    assert client.retry_policy.retries == 2
+
+
+@responses.activate
+def test_does_not_retry_non_idempotent_or_exhausted_requests(seam: Seam):
+    responses.add("POST", seam.api_url + "/locks/lock_door", status=503)
+    responses.add("GET", seam.api_url + "/devices/list", status=429)
+
+    client = make_client(seam, max_attempts=3)
+
+    with pytest.raises(SeamApiException):
+        client.make_request("POST", "/locks/lock_door", json={"device_id": "d_1"})
+    with pytest.raises(SeamApiException) as error:
+        client.make_request("GET", "/devices/list")
+
+    assert error.value.status_code == 429
+    assert len(responses.calls) == 1 + 3
+
+
+def test_retry_after_limits_and_formats():
+    policy = RetryPolicy(max_retry_after=10)
+
+    assert parse_retry_after("2.5") == 2.5
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+    assert parse_retry_after("soon") is None
+    assert policy.next_delay("GET", "/", 1, None, 503, retry_after="5") == 5
+    assert policy.next_delay("GET", "/", 1, None, 503, retry_after="60") is None
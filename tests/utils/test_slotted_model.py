@@ -0,0 +1,69 @@
+from typing import Optional
+
+import pytest
+
+from seamapi.utils.slotted_model import slotted_model
+
+
+@slotted_model
+class Error:
+    type: str
+    message: str
+
+
+@slotted_model
+class Attempt:
+    attempt_id: str
+    status: str
+    result: Optional[dict] = None
+    error: Optional[Error] = None
+
+
+@slotted_model
+class NamedAttempt(Attempt):
+    name: str = ""
+
+
+def test_slotted_model_round_trip():
+    payload = {
+        "attempt_id": "a_1",
+        "status": "error",
+        "result": None,
+        "error": {"type": "timeout", "message": "timed out"},
+    }
+
+    attempt = Attempt.from_dict({**payload, "unknown": True})
+
+    assert attempt.error == Error(type="timeout", message="timed out")
+    assert attempt.to_dict() == payload
+    assert Attempt.from_json(attempt.to_json()) == attempt
+    assert not hasattr(attempt, "__dict__")
+
+
+def test_slotted_model_defaults_and_missing():
+    attempt = NamedAttempt.from_dict({"attempt_id": "a_1", "status": "pending"})
+
+    assert attempt.error is None
+    assert attempt.name == ""
+    assert NamedAttempt.__slots__ == ("name",)
+
+    with pytest.raises(TypeError, match="'status'"):
+        Attempt.from_dict({"attempt_id": "a_1"})
+
+    assert Attempt.from_dict({"attempt_id": "a_1"}, infer_missing=True).status is None
+
+
+def test_slotted_model_schema():
+    pytest.importorskip("dataclasses_json")
+
+    payload = {
+        "attempt_id": "a_1",
+        "status": "error",
+        "result": None,
+        "error": {"type": "timeout", "message": "timed out"},
+    }
+
+    schema = Attempt.schema()
+
+    assert schema.load(payload) == Attempt.from_dict(payload)
+    assert schema.dump(Attempt.from_dict(payload)) == payload
@@ -0,0 +1,102 @@
+import base64
+import hashlib
+import hmac
+import json
+import pytest
+from seamapi.types import Event, Webhook, WebhookVerificationException
+from seamapi.utils.json_codec import STDLIB_JSON_CODEC
+from seamapi.webhooks import WebhookReceiver
+
+KEY = b"0123456789abcdef0123456789abcdef"
+SECRET = "whsec_" + base64.b64encode(KEY).decode()
+NOW = 1700000000
+
+EVENT = {
+    "event_id": "evt_1",
+    "event_class": "lock",
+    "event_type": "lock.unlocked",
+    "device_id": "device_1",
+    "created_at": "2023-11-14T22:13:20.000Z",
+    "action_attempt_id": "aa_1",
+}
+
+
+def sign(body: bytes, message_id="msg_1", timestamp=NOW, key=KEY):
+    signed = f"{message_id}.{timestamp}.".encode() + body
+    signature = base64.b64encode(hmac.new(key, signed, hashlib.sha256).digest())
+    return {
+        "svix-id": message_id,
+        "svix-timestamp": str(timestamp),
+        "svix-signature": "v1," + signature.decode(),
+    }
+
+
+def test_parse_verified_delivery():
+    receiver = WebhookReceiver(SECRET, clock=lambda: NOW + 10)
+    body = json.dumps(EVENT).encode()
+
+    event = receiver.parse(sign(body), body)
+
+    assert type(event) is Event
+    assert event.event_id == "evt_1"
+    assert event.event_type == "lock.unlocked"
+    assert event.device_id == "device_1"
+
+    # Header names are case insensitive, rotated secrets send several signatures
+    headers = {key.title(): value for key, value in sign(body).items()}
+    headers["Svix-Signature"] = "v1,bm90IGl0 " + headers["Svix-Signature"]
+    assert receiver.parse(headers, memoryview(body)).event_id == "evt_1"
+
+
+def test_accepts_webhook_and_stdlib_codec():
+    webhook = Webhook(webhook_id="wh_1", url="https://example.com", secret=SECRET)
+    receiver = WebhookReceiver(
+        webhook, json_codec=STDLIB_JSON_CODEC, clock=lambda: NOW
+    )
+    body = json.dumps({"event": EVENT}).encode()
+
+    assert receiver.parse(sign(body), memoryview(body)).event_id == "evt_1"
+
+
+def test_rejects_invalid_deliveries():
+    receiver = WebhookReceiver(SECRET, tolerance=60, clock=lambda: NOW)
+    body = json.dumps(EVENT).encode()
+
+    with pytest.raises(WebhookVerificationException) as error:
+        receiver.verify(sign(body, key=b"another key"), body)
+    assert error.value.message_id == "msg_1"
+
+    with pytest.raises(WebhookVerificationException):
+        receiver.verify(sign(body), body + b" ")
+    with pytest.raises(WebhookVerificationException):
+        receiver.verify(sign(body, timestamp=NOW - 61), body)
+    with pytest.raises(WebhookVerificationException):
+        receiver.verify({"svix-id": "msg_1"}, body)
+
+    receiver.verify(sign(body, timestamp=NOW - 59), body)
+
+
+def test_parse_many():
+    receiver = WebhookReceiver(SECRET, clock=lambda: NOW)
+    bodies = [
+        json.dumps({**EVENT, "event_id": f"evt_{i}"}).encode() for i in range(3)
+    ]
+    deliveries = [(sign(body, message_id=f"msg_{i}"), body) for i, body in enumerate(bodies)]
+    deliveries[1] = (deliveries[1][0], bodies[1] + b"tampered")
+    deliveries.append((sign(b"not json"), b"not json"))
+
+    results = receiver.parse_many(deliveries)
+
+    assert [type(r) for r in results] == [
+        Event,
+        WebhookVerificationException,
+        Event,
+        WebhookVerificationException,
+    ]
+    assert results[2].event_id == "evt_2"
+    assert results[1].message_id == "msg_1"
+
+
+def test_invalid_secret():
+    with pytest.raises(ValueError):
+        WebhookReceiver("whsec_not base64!")